@@ -2,41 +2,76 @@
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .api import IXcommandApiClient
-from .const import CONF_API_KEY, DOMAIN
+from .const import (
+    API_BASE_URL,
+    CONF_API_KEY,
+    CONF_BASE_URL,
+    CONF_GRID_SENSOR,
+    CONF_SITE_CURRENT_LIMIT,
+    DOMAIN,
+    STORAGE_VERSION,
+)
 from .coordinator import IXcommandCoordinator
+from .hub import async_get_hub, async_release_hub
+from .services import async_setup_services
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the services shared by all chargers."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up iXcommand EV Charger from a config entry."""
-    api_client = IXcommandApiClient(entry.data[CONF_API_KEY])
+    # Chargers sharing an API key are polled together by one hub
+    hub = async_get_hub(
+        hass, entry.data[CONF_API_KEY], entry.data.get(CONF_BASE_URL, API_BASE_URL)
+    )
+
+    coordinator = IXcommandCoordinator(hass, entry, hub)
 
-    coordinator = IXcommandCoordinator(hass, entry, api_client)
+    # Serve the last persisted snapshot right away and let the hub run the
+    # first live refresh in the background; without one, block on it
+    if not await coordinator.async_restore_snapshot():
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await async_release_hub(hass, entry.data[CONF_API_KEY])
+            raise
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryAuthFailed:
-        await api_client.close()
-        raise
-    except Exception:
-        await api_client.close()
-        raise
+    hub.async_add_coordinator(coordinator)
+    if site_limit := entry.options.get(CONF_SITE_CURRENT_LIMIT):
+        hub.load_balancer.async_add_charger(
+            coordinator, site_limit, entry.options.get(CONF_GRID_SENSOR)
+        )
 
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
-        "api_client": api_client,
+        "api_client": hub.api_client,
+        "hub": hub,
     }
 
     await hass.config_entries.async_forward_entry_setups(
         entry, ["sensor", "switch", "number"]
     )
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_forward_entry_unload(
@@ -45,6 +80,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         data = hass.data[DOMAIN].pop(entry.entry_id)
-        await data["api_client"].close()
+        data["hub"].async_remove_coordinator(data["coordinator"])
+        await async_release_hub(hass, entry.data[CONF_API_KEY])
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted snapshot of a removed config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
@@ -2,7 +2,10 @@
 
 import asyncio
 import logging
+import random
+import time
 from typing import Any
+from urllib.parse import urlsplit
 
 import aiohttp
 
@@ -10,8 +13,17 @@ from .const import (
     ALL_READABLE_PROPERTIES,
     API_BASE_URL,
     API_TIMEOUT,
+    CIRCUIT_CLOSED,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CIRCUIT_RESET_TIMEOUT,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF,
     WRITABLE_PROPERTIES,
 )
+from .metrics import ApiMetrics
+from .rate_limiter import IXcommandRateLimiter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,17 +36,138 @@ class IXcommandApiAuthError(IXcommandApiError):
     """Exception raised when authentication fails."""
 
 
+class IXcommandWriteNotConfirmedError(IXcommandApiError):
+    """Exception raised when the charger does not report a written value back."""
+
+
+class IXcommandApiUnavailableError(IXcommandApiError):
+    """Exception raised when the circuit breaker is short-circuiting requests."""
+
+
+class IXcommandConnectionError(IXcommandApiError):
+    """Exception raised when the API cannot be reached or times out."""
+
+
+class IXcommandServerError(IXcommandApiError):
+    """Exception raised when the API answers with a 5xx status."""
+
+
+# Errors worth retrying and counting against the circuit breaker
+TRANSIENT_ERRORS = (IXcommandConnectionError, IXcommandServerError)
+
+
+class CircuitBreaker:
+    """Circuit breaker tracking the health of one API host.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail immediately. Once ``reset_timeout`` has passed a single
+    half-open probe is let through; its outcome closes or re-opens the
+    circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._probe_in_flight = False
+
+    def before_request(self) -> None:
+        """Raise if the circuit does not allow a request right now."""
+        if self.state == CIRCUIT_CLOSED:
+            return
+        if self.state == CIRCUIT_OPEN:
+            assert self.opened_at is not None
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise IXcommandApiUnavailableError("API unavailable, circuit open")
+            self.state = CIRCUIT_HALF_OPEN
+        if self._probe_in_flight:
+            raise IXcommandApiUnavailableError("API unavailable, probe in progress")
+        self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self.state != CIRCUIT_CLOSED:
+            _LOGGER.info("iXcommand API reachable again, closing circuit")
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Let another probe through after one was abandoned."""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit when needed."""
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == CIRCUIT_HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != CIRCUIT_OPEN:
+                _LOGGER.warning(
+                    "iXcommand API failing (%d consecutive errors), opening circuit for %ss",
+                    self.failures,
+                    self.reset_timeout,
+                )
+            self.state = CIRCUIT_OPEN
+            self.opened_at = time.monotonic()
+
+
+_CIRCUIT_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Return the circuit breaker shared by every client talking to a host."""
+    if (breaker := _CIRCUIT_BREAKERS.get(host)) is None:
+        breaker = _CIRCUIT_BREAKERS[host] = CircuitBreaker()
+    return breaker
+
+
 class IXcommandApiClient:
     """API client for iXcommand EV Charger."""
 
-    def __init__(self, api_key: str, session: aiohttp.ClientSession | None = None) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        api_key: str,
+        session: aiohttp.ClientSession | None = None,
+        *,
+        base_url: str = API_BASE_URL,
+        timeout: float = API_TIMEOUT,
+        max_retries: int = RETRY_ATTEMPTS,
+        retry_backoff: float = RETRY_BACKOFF,
+        rate_limiter: IXcommandRateLimiter | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        When a session is passed in (normally Home Assistant's shared session)
+        the client only borrows it and never closes it, so several config
+        entries can reuse the same connection pool. Each client rate-limits
+        its own API key and counts its requests in metrics. base_url can
+        point the client at another server, such as a local mock of the
+        cloud API.
+        """
         self._api_key = api_key
+        self._owns_session = session is None
         self._session = session or aiohttp.ClientSession()
+        self._base_url = base_url
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self.circuit_breaker = get_circuit_breaker(urlsplit(base_url).netloc)
+        self.rate_limiter = rate_limiter or IXcommandRateLimiter()
+        self.metrics = ApiMetrics()
+        # serial -> key set -> GET request currently in flight
+        self._inflight: dict[str, dict[frozenset[str], asyncio.Task[dict[str, Any]]]] = {}
 
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session:
+        """Close the HTTP session if this client created it."""
+        if self._session and self._owns_session:
             await self._session.close()
 
     def _get_headers(self) -> dict[str, str]:
@@ -51,8 +184,61 @@ class IXcommandApiClient:
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | list[tuple[str, str]] | None = None,
     ) -> dict[str, Any]:
-        """Make an HTTP request to the API."""
-        url = f"{API_BASE_URL}{endpoint}"
+        """Make an HTTP request to the API.
+
+        Idempotent GET requests are retried on timeouts, connection errors
+        and 5xx responses with exponential backoff and jitter. Every attempt
+        waits for the API key's rate limiter and goes through the host's
+        circuit breaker.
+        """
+        retries = self._max_retries if method == "GET" else 0
+        attempt = 0
+        while True:
+            await self.rate_limiter.async_acquire(write=method != "GET")
+            self.circuit_breaker.before_request()
+            try:
+                result = await self._make_single_request(method, endpoint, data, params)
+            except TRANSIENT_ERRORS as err:
+                self.circuit_breaker.record_failure()
+                if attempt >= retries or self.circuit_breaker.state == CIRCUIT_OPEN:
+                    raise
+                delay = self._retry_backoff * 2**attempt
+                delay += random.uniform(0, self._retry_backoff)
+                attempt += 1
+                _LOGGER.debug(
+                    "%s %s failed (%s), retry %d/%d in %.2fs",
+                    method,
+                    endpoint,
+                    err,
+                    attempt,
+                    retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            except IXcommandApiError:
+                # The host answered (a 4xx or an unreadable body), so it is reachable
+                self.circuit_breaker.record_success()
+                raise
+            except BaseException:
+                # Cancelled or failed unexpectedly; says nothing about the host
+                self.circuit_breaker.release_probe()
+                raise
+            else:
+                self.circuit_breaker.record_success()
+                return result
+
+    async def _make_single_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None,
+        params: dict[str, Any] | list[tuple[str, str]] | None,
+    ) -> dict[str, Any]:
+        """Make one HTTP request attempt and record it in the metrics."""
+        url = f"{self._base_url}{endpoint}"
+        started = time.monotonic()
+        received = 0
+        error: str | None = None
 
         try:
             async with self._session.request(
@@ -61,35 +247,101 @@ class IXcommandApiClient:
                 headers=self._get_headers(),
                 json=data,
                 params=params,
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+                timeout=self._timeout,
             ) as response:
+                body = await response.read()
+                received = len(body)
+                if response.status != 200:
+                    error = f"http_{response.status}"
                 if response.status == 401:
                     raise IXcommandApiAuthError("Invalid API key")
+                elif response.status >= 500:
+                    raise IXcommandServerError(
+                        f"API request failed with status {response.status}: {await response.text()}"
+                    )
                 elif response.status != 200:
                     raise IXcommandApiError(
                         f"API request failed with status {response.status}: {await response.text()}"
                     )
 
-                return await response.json()
+                try:
+                    return await response.json()
+                except ValueError as err:
+                    error = "invalid_json"
+                    raise IXcommandApiError(f"Invalid JSON in API response: {err}") from err
 
         except aiohttp.ClientError as err:
-            raise IXcommandApiError(f"HTTP client error: {err}") from err
+            error = type(err).__name__
+            raise IXcommandConnectionError(f"HTTP client error: {err}") from err
         except asyncio.TimeoutError as err:
-            raise IXcommandApiError("Request timeout") from err
+            error = "timeout"
+            raise IXcommandConnectionError("Request timeout") from err
+        except asyncio.CancelledError:
+            error = "cancelled"
+            raise
+        except Exception as err:
+            error = error or type(err).__name__
+            raise
+        finally:
+            self.metrics.record(method, endpoint, time.monotonic() - started, received, error)
 
     async def get_properties(
         self, serial_number: str, properties: list[str] | None = None
     ) -> dict[str, Any]:
-        """Get properties from a thing (charger)."""
+        """Get properties from a thing (charger).
+
+        Concurrent reads of the same charger are collapsed: keys already
+        being fetched by an in-flight request are served from that request,
+        and only the remaining keys (if any) are fetched.
+        """
         if properties is None:
             properties = ALL_READABLE_PROPERTIES
 
+        wanted = frozenset(properties)
+        missing = set(wanted)
+        shared: list[asyncio.Task[dict[str, Any]]] = []
+        for keys, task in self._inflight.get(serial_number, {}).items():
+            if keys & wanted:
+                shared.append(task)
+                missing -= keys
+        if missing:
+            missing_properties = [prop for prop in properties if prop in missing]
+            shared.append(self._fetch_properties(serial_number, missing_properties))
+
+        result: dict[str, Any] = {}
+        for task in shared:
+            # Shielded so a cancelled caller does not abort a shared request
+            response = await asyncio.shield(task)
+            result.update((key, value) for key, value in response.items() if key in wanted)
+        return result
+
+    def _fetch_properties(
+        self, serial_number: str, properties: list[str]
+    ) -> asyncio.Task[dict[str, Any]]:
+        """Start a GET for the given keys that concurrent readers can join."""
         # Send keys as multiple query parameters (array format)
         # Each property becomes a separate "keys" parameter
         params = [("keys", prop) for prop in properties]
         endpoint = f"/thing/{serial_number}/properties"
 
-        return await self._make_request("GET", endpoint, params=params)
+        keys = frozenset(properties)
+        inflight = self._inflight.setdefault(serial_number, {})
+        task = asyncio.get_running_loop().create_task(
+            self._make_request("GET", endpoint, params=params)
+        )
+        inflight[keys] = task
+
+        def _remove_inflight(finished: asyncio.Task[dict[str, Any]]) -> None:
+            if inflight.get(keys) is finished:
+                del inflight[keys]
+            if not inflight and self._inflight.get(serial_number) is inflight:
+                del self._inflight[serial_number]
+            if not finished.cancelled():
+                # Mark the error retrieved even if every caller went away
+                finished.exception()
+
+        task.add_done_callback(_remove_inflight)
+        return task
 
     async def set_properties(
         self, serial_number: str, properties: dict[str, Any]
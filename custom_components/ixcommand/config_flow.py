@@ -2,9 +2,74 @@
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.core import callback
+from homeassistant.helpers import selector
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import IXcommandApiAuthError, IXcommandApiClient, IXcommandApiError
-from .const import CONF_API_KEY, CONF_SERIAL_NUMBER, DOMAIN
+from .const import (
+    CONF_ACTIVE_INTERVAL,
+    CONF_API_KEY,
+    CONF_CURRENT_DEADBAND,
+    CONF_CURRENT_MIN_INTERVAL,
+    CONF_ERROR_INTERVAL,
+    CONF_GRID_SENSOR,
+    CONF_IDLE_INTERVAL,
+    CONF_POWER_DEADBAND,
+    CONF_POWER_MIN_INTERVAL,
+    CONF_SERIAL_NUMBER,
+    CONF_SIGNAL_DEADBAND,
+    CONF_SIGNAL_MIN_INTERVAL,
+    CONF_SITE_CURRENT_LIMIT,
+    CONF_SOLAR_EXPORT_SENSOR,
+    CONF_SOLAR_HYSTERESIS,
+    CONF_SOLAR_MIN_WRITE_INTERVAL,
+    CONF_SOLAR_WINDOW,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_WRITE_SUPPRESSION_MAX_AGE,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_CURRENT_DEADBAND,
+    DEFAULT_CURRENT_MIN_INTERVAL,
+    DEFAULT_ERROR_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_POWER_DEADBAND,
+    DEFAULT_POWER_MIN_INTERVAL,
+    DEFAULT_SIGNAL_DEADBAND,
+    DEFAULT_SIGNAL_MIN_INTERVAL,
+    DEFAULT_SITE_CURRENT_LIMIT,
+    DEFAULT_SOLAR_HYSTERESIS,
+    DEFAULT_SOLAR_MIN_WRITE_INTERVAL,
+    DEFAULT_SOLAR_WINDOW,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DEFAULT_WRITE_SUPPRESSION_MAX_AGE,
+    DOMAIN,
+    MAX_POLL_INTERVAL,
+    MAX_SITE_CURRENT_LIMIT,
+    MAX_STALE_GRACE_PERIOD,
+    MIN_POLL_INTERVAL,
+    SOLAR_CONTROL_INTERVAL,
+)
+
+POLL_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_POLL_INTERVAL, max=MAX_POLL_INTERVAL)
+)
+DEADBAND_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0))
+MIN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_POLL_INTERVAL))
+# Solar timings cannot be shorter than one control loop iteration
+SOLAR_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=SOLAR_CONTROL_INTERVAL, max=MAX_POLL_INTERVAL)
+)
+
+# (option key, default, validator) of the sensor state write filters
+FILTER_OPTIONS = [
+    (CONF_CURRENT_DEADBAND, DEFAULT_CURRENT_DEADBAND, DEADBAND_VALIDATOR),
+    (CONF_CURRENT_MIN_INTERVAL, DEFAULT_CURRENT_MIN_INTERVAL, MIN_INTERVAL_VALIDATOR),
+    (CONF_POWER_DEADBAND, DEFAULT_POWER_DEADBAND, DEADBAND_VALIDATOR),
+    (CONF_POWER_MIN_INTERVAL, DEFAULT_POWER_MIN_INTERVAL, MIN_INTERVAL_VALIDATOR),
+    (CONF_SIGNAL_DEADBAND, DEFAULT_SIGNAL_DEADBAND, DEADBAND_VALIDATOR),
+    (CONF_SIGNAL_MIN_INTERVAL, DEFAULT_SIGNAL_MIN_INTERVAL, MIN_INTERVAL_VALIDATOR),
+]
 
 
 class IXcommandConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
@@ -12,6 +77,16 @@ class IXcommandConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ig
 
     VERSION = 1
 
+    _reauth_serial: str
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return IXcommandOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, str] | None = None
     ) -> config_entries.FlowResult:
@@ -29,11 +104,10 @@ class IXcommandConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ig
                     errors[CONF_SERIAL_NUMBER] = "invalid_serial_format"
                 else:
                     # Test the connection
-                    api_client = IXcommandApiClient(user_input[CONF_API_KEY])
-                    try:
-                        await api_client.test_connection(serial)
-                    finally:
-                        await api_client.close()
+                    api_client = IXcommandApiClient(
+                        user_input[CONF_API_KEY], async_get_clientsession(self.hass)
+                    )
+                    await api_client.test_connection(serial)
 
                     # Create the config entry with prefix for unique_id
                     await self.async_set_unique_id(f"{DOMAIN}_{serial}")
@@ -76,6 +150,7 @@ class IXcommandConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ig
         self, entry_data: dict[str, str]
     ) -> config_entries.FlowResult:
         """Handle reauth flow."""
+        self._reauth_serial = entry_data[CONF_SERIAL_NUMBER]
         return await self.async_step_reauth_confirm()
 
     async def async_step_reauth_confirm(
@@ -87,11 +162,10 @@ class IXcommandConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ig
         if user_input is not None:
             try:
                 # Test the connection with new credentials
-                api_client = IXcommandApiClient(user_input[CONF_API_KEY])
-                try:
-                    await api_client.test_connection(self.context["serial_number"])
-                finally:
-                    await api_client.close()
+                api_client = IXcommandApiClient(
+                    user_input[CONF_API_KEY], async_get_clientsession(self.hass)
+                )
+                await api_client.test_connection(self._reauth_serial)
 
                 # Update the existing entry
                 existing_entry = self.hass.config_entries.async_get_entry(
@@ -123,6 +197,99 @@ class IXcommandConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ig
             ),
             errors=errors,
             description_placeholders={
-                "serial": self.context["serial_number"]
+                "serial": self._reauth_serial
             },
         )
+
+
+class IXcommandOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for an iXcommand EV Charger."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, float] | None = None
+    ) -> config_entries.FlowResult:
+        """Manage polling, sensor write filters, load balancing and solar charging.
+
+        Load balancing and solar surplus charging both set targetCurrent and
+        chargingEnable, so a charger can only use one of them.
+        """
+        errors = {}
+        if user_input is not None:
+            if user_input.get(CONF_SITE_CURRENT_LIMIT) and user_input.get(CONF_SOLAR_EXPORT_SENSOR):
+                errors["base"] = "solar_with_load_balancing"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = user_input if user_input is not None else self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_ACTIVE_INTERVAL,
+                        default=options.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL),
+                    ): POLL_INTERVAL_VALIDATOR,
+                    vol.Optional(
+                        CONF_IDLE_INTERVAL,
+                        default=options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+                    ): POLL_INTERVAL_VALIDATOR,
+                    vol.Optional(
+                        CONF_ERROR_INTERVAL,
+                        default=options.get(CONF_ERROR_INTERVAL, DEFAULT_ERROR_INTERVAL),
+                    ): POLL_INTERVAL_VALIDATOR,
+                    vol.Optional(
+                        CONF_STALE_GRACE_PERIOD,
+                        default=options.get(CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_STALE_GRACE_PERIOD)),
+                    vol.Optional(
+                        CONF_WRITE_SUPPRESSION_MAX_AGE,
+                        default=options.get(
+                            CONF_WRITE_SUPPRESSION_MAX_AGE, DEFAULT_WRITE_SUPPRESSION_MAX_AGE
+                        ),
+                    ): MIN_INTERVAL_VALIDATOR,
+                    **{
+                        vol.Optional(key, default=options.get(key, default)): validator
+                        for key, default, validator in FILTER_OPTIONS
+                    },
+                    vol.Optional(
+                        CONF_SITE_CURRENT_LIMIT,
+                        default=options.get(CONF_SITE_CURRENT_LIMIT, DEFAULT_SITE_CURRENT_LIMIT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_SITE_CURRENT_LIMIT)),
+                    vol.Optional(
+                        CONF_GRID_SENSOR,
+                        description={"suggested_value": options.get(CONF_GRID_SENSOR)},
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(
+                            domain="sensor", device_class=SensorDeviceClass.CURRENT
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SOLAR_EXPORT_SENSOR,
+                        description={"suggested_value": options.get(CONF_SOLAR_EXPORT_SENSOR)},
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(
+                            domain="sensor", device_class=SensorDeviceClass.POWER
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SOLAR_WINDOW,
+                        default=options.get(CONF_SOLAR_WINDOW, DEFAULT_SOLAR_WINDOW),
+                    ): SOLAR_INTERVAL_VALIDATOR,
+                    vol.Optional(
+                        CONF_SOLAR_HYSTERESIS,
+                        default=options.get(CONF_SOLAR_HYSTERESIS, DEFAULT_SOLAR_HYSTERESIS),
+                    ): DEADBAND_VALIDATOR,
+                    vol.Optional(
+                        CONF_SOLAR_MIN_WRITE_INTERVAL,
+                        default=options.get(
+                            CONF_SOLAR_MIN_WRITE_INTERVAL, DEFAULT_SOLAR_MIN_WRITE_INTERVAL
+                        ),
+                    ): SOLAR_INTERVAL_VALIDATOR,
+                }
+            ),
+            errors=errors,
+        )
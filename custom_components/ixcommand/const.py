@@ -6,9 +6,33 @@ DOMAIN = "ixcommand"
 API_BASE_URL = "https://evcharger.ixcommand.com/api/v1"
 API_TIMEOUT = 10
 
+# Retries for idempotent requests
+RETRY_ATTEMPTS = 2  # extra attempts after the first failure
+RETRY_BACKOFF = 0.5  # seconds, doubled on every retry plus jitter
+
+# Client-side rate limits per API key (requests per second, burst size)
+READ_RATE = 5
+READ_BURST = 20
+WRITE_RATE = 2
+WRITE_BURST = 10
+
+# Circuit breaker per API host
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failures before opening
+CIRCUIT_RESET_TIMEOUT = 60  # seconds before a half-open probe
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+CIRCUIT_STATES = [CIRCUIT_CLOSED, CIRCUIT_OPEN, CIRCUIT_HALF_OPEN]
+
 # Config entry keys
 CONF_API_KEY = "api_key"
 CONF_SERIAL_NUMBER = "serial_number"
+CONF_BASE_URL = "base_url"  # optional, overrides API_BASE_URL for testing
+
+# Options keys
+CONF_ACTIVE_INTERVAL = "active_interval"
+CONF_IDLE_INTERVAL = "idle_interval"
+CONF_ERROR_INTERVAL = "error_interval"
 
 # API property keys
 PROP_BOOST_CURRENT = "boostCurrent"
@@ -52,6 +76,51 @@ ALL_READABLE_PROPERTIES = [
     PROP_BSSID,
 ]
 
+# Property tiers, each refreshed on its own cadence. The fast tier holds the
+# live measurements and is fetched on every poll; the slower tiers hold
+# configuration and network details that rarely change.
+FAST_PROPERTIES = [
+    PROP_CURRENT_CHARGING_POWER,
+    PROP_CHARGING_CURRENT,
+    PROP_CHARGING_CURRENT_L2,
+    PROP_CHARGING_CURRENT_L3,
+    PROP_CHARGING_STATUS,
+    PROP_CHARGING_STATE,
+    PROP_CHARGING_ENABLE,
+    PROP_BOOST_STATE,
+    PROP_BOOST_REMAINING,
+    PROP_TOTAL_ENERGY,
+]
+
+SLOW_PROPERTIES = [
+    PROP_SIGNAL,
+    PROP_BOOST_CURRENT,
+    PROP_TARGET_CURRENT,
+    PROP_SINGLE_PHASE,
+    PROP_BOOST_TIME,
+    PROP_MAXIMUM_CURRENT,
+]
+
+VERY_SLOW_PROPERTIES = [
+    PROP_SSID,
+    PROP_BSSID,
+]
+
+SLOW_TIER_INTERVAL = 300  # seconds
+VERY_SLOW_TIER_INTERVAL = 3600  # seconds
+
+# (properties, refresh interval in seconds); 0 means every poll
+PROPERTY_TIERS = [
+    (FAST_PROPERTIES, 0),
+    (SLOW_PROPERTIES, SLOW_TIER_INTERVAL),
+    (VERY_SLOW_PROPERTIES, VERY_SLOW_TIER_INTERVAL),
+]
+
+# Read-back confirmation after writes
+CONFIRM_INITIAL_DELAY = 0.25  # seconds before the first read-back
+CONFIRM_MAX_DELAY = 4  # seconds, cap for the growing backoff
+CONFIRM_TIMEOUT = 10  # seconds before giving up on a write
+
 # Writable properties
 WRITABLE_PROPERTIES = [
     PROP_BOOST_CURRENT,
@@ -65,6 +134,90 @@ WRITABLE_PROPERTIES = [
 # Polling interval
 UPDATE_INTERVAL = 30  # seconds
 
+# Adaptive polling profiles
+DEFAULT_ACTIVE_INTERVAL = 10  # seconds, while charging or boosting
+DEFAULT_IDLE_INTERVAL = 120  # seconds, while idle
+DEFAULT_ERROR_INTERVAL = 300  # seconds, longest interval while polls keep failing
+MIN_POLL_INTERVAL = 5  # seconds
+MAX_POLL_INTERVAL = 3600  # seconds
+
+# How long the last snapshot is served as stale data while polls fail
+CONF_STALE_GRACE_PERIOD = "stale_grace_period"
+DEFAULT_STALE_GRACE_PERIOD = 900  # seconds, 0 makes entities unavailable at once
+MAX_STALE_GRACE_PERIOD = 86400  # seconds
+
+# How often the hub checks which chargers are due for a refresh
+SCHEDULER_TICK = 1  # seconds
+
+# Maximum number of property requests in flight per API key
+MAX_CONCURRENT_REQUESTS = 4
+
+# hass.data key holding the per-API-key hubs
+DATA_HUBS = "hubs"
+
+# set_properties service
+SERVICE_SET_PROPERTIES = "set_properties"
+ATTR_DEVICE_ID = "device_id"
+ATTR_SERIAL_NUMBER = "serial_number"
+ATTR_PROPERTIES = "properties"
+MAX_CONCURRENT_WRITES = 4  # chargers written at once by one service call
+
+# State write filters for noisy sensors: a new value is only written once it
+# differs from the last written one by the deadband and the minimum interval
+# has passed. Charging status transitions and recovery from unavailable
+# always write.
+CONF_CURRENT_DEADBAND = "current_deadband"
+CONF_CURRENT_MIN_INTERVAL = "current_min_interval"
+CONF_POWER_DEADBAND = "power_deadband"
+CONF_POWER_MIN_INTERVAL = "power_min_interval"
+CONF_SIGNAL_DEADBAND = "signal_deadband"
+CONF_SIGNAL_MIN_INTERVAL = "signal_min_interval"
+DEFAULT_CURRENT_DEADBAND = 0.2  # A
+DEFAULT_CURRENT_MIN_INTERVAL = 0  # seconds
+DEFAULT_POWER_DEADBAND = 50  # W
+DEFAULT_POWER_MIN_INTERVAL = 0  # seconds
+DEFAULT_SIGNAL_DEADBAND = 3  # %
+DEFAULT_SIGNAL_MIN_INTERVAL = 300  # seconds
+
+# Site load balancing across the chargers of one API key behind a shared
+# main fuse; a site current limit of 0 leaves the charger out
+CONF_SITE_CURRENT_LIMIT = "site_current_limit"
+CONF_GRID_SENSOR = "grid_sensor"
+DEFAULT_SITE_CURRENT_LIMIT = 0  # A per phase, 0 disables load balancing
+MAX_SITE_CURRENT_LIMIT = 1000  # A per phase
+MIN_CHARGING_CURRENT = 6  # A, lowest current a charger can be set to
+LOAD_BALANCE_INTERVAL = 5  # seconds between control loop runs
+LOAD_BALANCE_HEADROOM = 2  # A left above the draw of a vehicle taking less than its target
+
+# Solar surplus charging, enabled by configuring a grid export power sensor
+CONF_SOLAR_EXPORT_SENSOR = "solar_export_sensor"
+CONF_SOLAR_WINDOW = "solar_window"
+CONF_SOLAR_HYSTERESIS = "solar_hysteresis"
+CONF_SOLAR_MIN_WRITE_INTERVAL = "solar_min_write_interval"
+DEFAULT_SOLAR_WINDOW = 120  # seconds of samples averaged
+DEFAULT_SOLAR_HYSTERESIS = 300  # W above a threshold before switching up
+DEFAULT_SOLAR_MIN_WRITE_INTERVAL = 60  # seconds between writes
+SOLAR_CONTROL_INTERVAL = 10  # seconds between samples and control decisions
+SOLAR_MODE_SWITCH_INTERVAL = 300  # seconds between phase or enable changes
+PHASE_VOLTAGE = 230  # V
+
+# Writes whose values a recently polled snapshot already shows are skipped
+CONF_WRITE_SUPPRESSION_MAX_AGE = "write_suppression_max_age"
+DEFAULT_WRITE_SUPPRESSION_MAX_AGE = 60  # seconds, 0 always writes
+
+# Request metrics of each API client
+API_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # seconds, histogram upper bounds
+API_LATENCY_WINDOW = 50  # recent requests the latency sensor averages
+API_DIAGNOSTIC_INTERVAL = 10  # seconds between API diagnostic sensor refreshes
+
+# Local estimates of fast-moving values between polls
+INTERPOLATION_INTERVAL = 1  # seconds between estimates
+ENERGY_INTERPOLATION_STEP = 10  # Wh, granularity of the extrapolated energy
+
+# Persisted snapshot used to warm-start entities at boot
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60  # seconds, batches snapshot writes to disk
+
 # Device info
 MANUFACTURER = "iXcommand"
 MODEL = "EV Charger"
@@ -79,3 +232,9 @@ CHARGING_STATUSES = [
     "CONTROL_PILOT_ERROR",
     "ERROR",
 ]
+
+# Charging status values that use the active polling profile
+ACTIVE_CHARGING_STATUSES = [
+    "CHARGING",
+    "CHARGING_WITH_VENTILATION",
+]
@@ -1,22 +1,25 @@
 """Base controllable entity for iXcommand EV Charger."""
 
-import asyncio
 import logging
 from typing import Any
 
 from homeassistant.helpers.entity import Entity
 
-from .api import IXcommandApiClient, IXcommandApiError
+from .api import IXcommandApiClient, IXcommandApiError, IXcommandWriteNotConfirmedError
 from .coordinator import IXcommandCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-CONTROL_UPDATE_DELAY = 2
+# Debounce window for merging rapid writes, e.g. while dragging a slider
+WRITE_COALESCE_DELAY = 0.5
 
 
 class IXcommandControllableEntity(Entity):
     """Base class for controllable entities with optimistic updates."""
 
+    # Seconds to wait for further writes before sending; 0 sends immediately
+    _write_delay: float = 0
+
     def __init__(
         self,
         coordinator: IXcommandCoordinator,
@@ -31,22 +34,22 @@ class IXcommandControllableEntity(Entity):
         property_name: str,
         property_value: Any,
     ) -> None:
-        """Send control command and update local state optimistically."""
+        """Send control command through the charger's write buffer.
+
+        The buffer merges this write with other pending writes for the same
+        charger, updates the local state optimistically once sent and
+        returns as soon as the charger reports the new value back.
+        """
         serial = self.coordinator.serial_number
         try:
             _LOGGER.debug("Setting %s to %s for charger %s", property_name, property_value, serial)
-            await self.api_client.set_properties(serial, {property_name: property_value})
-            _LOGGER.debug("Successfully set %s, updating local state", property_name)
-            self._update_local_state(property_name, property_value)
-            await asyncio.sleep(CONTROL_UPDATE_DELAY)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.write_buffer.async_write(
+                {property_name: property_value}, self._write_delay
+            )
+            _LOGGER.debug("Successfully set %s", property_name)
+        except IXcommandWriteNotConfirmedError as err:
+            _LOGGER.warning("Charger %s did not confirm %s=%s: %s", serial, property_name, property_value, err)
+            raise
         except IXcommandApiError as err:
             _LOGGER.error("Failed to set %s to %s: %s", property_name, property_value, err)
             raise
-
-    def _update_local_state(self, property_name: str, property_value: Any) -> None:
-        """Update coordinator data optimistically."""
-        if self.coordinator.data:
-            updated_data = self.coordinator.data.copy()
-            updated_data[property_name] = property_value
-            self.coordinator.async_set_updated_data(updated_data)
@@ -1,53 +1,406 @@
 """Data coordinator for iXcommand EV Charger."""
 
+from __future__ import annotations
+
+import asyncio
 import logging
-from datetime import timedelta
-from typing import Any
+import math
+from collections.abc import Callable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import IXcommandApiAuthError, IXcommandApiClient, IXcommandApiError
+from .api import (
+    IXcommandApiAuthError,
+    IXcommandApiError,
+    IXcommandWriteNotConfirmedError,
+)
 from .const import (
-    ALL_READABLE_PROPERTIES,
+    ACTIVE_CHARGING_STATUSES,
+    CONF_ACTIVE_INTERVAL,
+    CONF_ERROR_INTERVAL,
+    CONF_IDLE_INTERVAL,
     CONF_SERIAL_NUMBER,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_WRITE_SUPPRESSION_MAX_AGE,
+    CONFIRM_INITIAL_DELAY,
+    CONFIRM_MAX_DELAY,
+    CONFIRM_TIMEOUT,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_ERROR_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DEFAULT_WRITE_SUPPRESSION_MAX_AGE,
+    DOMAIN,
+    PROPERTY_TIERS,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
     UPDATE_INTERVAL,
 )
+from .models import ChargerState
+from .write_buffer import IXcommandWriteBuffer
+
+if TYPE_CHECKING:
+    from .hub import IXcommandHub
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class IXcommandCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Data coordinator for iXcommand EV Charger."""
+class IXcommandCoordinator(DataUpdateCoordinator[ChargerState]):
+    """Data coordinator for iXcommand EV Charger.
+
+    The coordinator has no timer of its own; the hub for its API key
+    schedules the refreshes of all chargers together. After every refresh
+    the coordinator picks its next interval from the charger's state: fast
+    while charging or boosting and slow while idle. Chargers sharing a site
+    current limit are always polled fast. While polls fail the
+    interval doubles with every failure, up to the error interval, and the
+    last snapshot keeps being served as stale data for a grace period
+    before the entities become unavailable.
+
+    Properties are fetched in tiers: every poll asks only for the fast tier
+    plus any slower tier whose cadence has elapsed, and the partial response
+    is parsed into a new immutable ChargerState snapshot.
+
+    Entities register with the property keys they display as their listener
+    context. Each new snapshot is diffed against the last one and only the
+    entities whose keys changed are notified.
+
+    The last good snapshot is persisted so that after a restart entities can
+    be served from it immediately while the first live refresh runs. Whether
+    the load balancer paused the charger is persisted along with it.
+    """
 
     def __init__(
-        self, hass: HomeAssistant, config_entry: ConfigEntry, api_client: IXcommandApiClient
+        self, hass: HomeAssistant, config_entry: ConfigEntry, hub: IXcommandHub
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=f"iXcommand {config_entry.data[CONF_SERIAL_NUMBER]}",
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
-            always_update=True,
+            update_interval=None,
+            always_update=False,
         )
-        self.api_client = api_client
+        self.hub = hub
+        self.api_client = hub.api_client
         self.serial_number = config_entry.data[CONF_SERIAL_NUMBER]
+        self.active_interval: int = config_entry.options.get(
+            CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL
+        )
+        self.idle_interval: int = config_entry.options.get(
+            CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL
+        )
+        self.error_interval: int = config_entry.options.get(
+            CONF_ERROR_INTERVAL, DEFAULT_ERROR_INTERVAL
+        )
+        self.stale_grace_period: int = config_entry.options.get(
+            CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD
+        )
+        self.last_successful_update: datetime | None = None
+        self.write_suppression_max_age: int = config_entry.options.get(
+            CONF_WRITE_SUPPRESSION_MAX_AGE, DEFAULT_WRITE_SUPPRESSION_MAX_AGE
+        )
+        self.poll_interval: float = UPDATE_INTERVAL
+        self.next_poll: float = 0.0
+        # Fraction of the poll interval this charger's polls are offset by
+        self.poll_phase: float = 0.0
+        self._consecutive_errors = 0
+        self.auth_failed = False
+        # Loop time each property tier was last fetched, by index in PROPERTY_TIERS
+        self._tier_fetched: list[float] = [-math.inf] * len(PROPERTY_TIERS)
+        # Loop time each property was last read from the charger
+        self._property_fetched: dict[str, float] = {}
+        self.write_buffer = IXcommandWriteBuffer(hass, self)
+        # Property key -> listeners displaying it, for targeted notifications
+        self._listeners_by_key: dict[str, dict[CALLBACK_TYPE, CALLBACK_TYPE]] = {}
+        self._notified_data: ChargerState | None = None
+        self._notified_success = True
+        self._notified_stale = False
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
+        # True while serving a restored snapshot or riding out failing polls
+        self.data_is_stale = False
+        # Whether the site load balancer paused charging, kept across restarts
+        self.load_balancer_paused = False
+        # Balanced chargers are polled fast so a plugged-in vehicle is seen soon
+        self.load_balanced = False
+
+    async def async_load_snapshot(self) -> dict[str, Any] | None:
+        """Return the persisted snapshot as stored, None without one."""
+        return await self._store.async_load()
+
+    async def async_restore_snapshot(self) -> bool:
+        """Publish the last persisted snapshot, returning whether one existed."""
+        stored = await self.async_load_snapshot()
+        if not stored:
+            return False
+        self.load_balancer_paused = stored.get("load_balancer_paused", False)
+        if not stored.get("data"):
+            return False
+        _LOGGER.debug(
+            "Restored snapshot of charger %s saved at %s", self.serial_number, stored["saved_at"]
+        )
+        self.data_is_stale = True
+        if updated_at := stored.get("updated_at"):
+            self.last_successful_update = dt_util.parse_datetime(updated_at)
+        self.async_set_updated_data(ChargerState.from_properties(stored["data"]))
+        return True
+
+    @callback
+    def _async_snapshot_to_store(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "updated_at": self.last_successful_update.isoformat()
+            if self.last_successful_update
+            else None,
+            "data": self.data.as_dict() if self.data else None,
+            "load_balancer_paused": self.load_balancer_paused,
+        }
+
+    @callback
+    def async_set_load_balancer_paused(self, paused: bool) -> None:
+        """Record whether the load balancer paused charging and persist it."""
+        if paused != self.load_balancer_paused:
+            self.load_balancer_paused = paused
+            self._store.async_delay_save(self._async_snapshot_to_store, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexed by the property keys in context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if context is None:
+            return remove_listener
+
+        for key in context:
+            self._listeners_by_key.setdefault(key, {})[remove_listener] = update_callback
+
+        @callback
+        def remove_indexed_listener() -> None:
+            """Remove the listener and its index entries."""
+            remove_listener()
+            for key in context:
+                self._listeners_by_key[key].pop(remove_listener, None)
+
+        return remove_indexed_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners whose property keys changed.
+
+        Every listener is notified when availability or staleness flips or
+        there is no previous snapshot to diff against; listeners without a
+        context are always notified.
+        """
+        previous, self._notified_data = self._notified_data, self.data
+        success_changed = self._notified_success != self.last_update_success
+        self._notified_success = self.last_update_success
+        stale_changed = self._notified_stale != self.data_is_stale
+        self._notified_stale = self.data_is_stale
+        if previous is None or self.data is None or success_changed or stale_changed:
+            super().async_update_listeners()
+            return
+
+        to_notify: dict[CALLBACK_TYPE, CALLBACK_TYPE] = {}
+        for key in self.data.changed_properties(previous):
+            to_notify.update(self._listeners_by_key.get(key, {}))
+        for remove_listener, (update_callback, context) in self._listeners.items():
+            if context is None:
+                to_notify[remove_listener] = update_callback
+        for update_callback in list(to_notify.values()):
+            update_callback()
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled work, including writes still being debounced."""
+        await super().async_shutdown()
+        self.write_buffer.async_cancel()
+
+    @callback
+    def async_set_local_properties(self, properties: dict[str, Any]) -> None:
+        """Update coordinator data optimistically after a successful write."""
+        if self.data:
+            self.async_set_updated_data(self.data.merge(properties))
+
+    async def async_confirm_properties(self, properties: dict[str, Any]) -> None:
+        """Re-read written properties until the charger reports them back.
+
+        Only the written keys are fetched, with a growing backoff between
+        attempts. Raises IXcommandWriteNotConfirmedError with the mismatching
+        values if they still differ when the deadline passes.
+        """
+        loop = self.hass.loop
+        deadline = loop.time() + CONFIRM_TIMEOUT
+        delay = CONFIRM_INITIAL_DELAY
+        keys = list(properties)
+        while True:
+            await asyncio.sleep(delay)
+            async with self.hub.semaphore:
+                result = await self.api_client.get_properties(self.serial_number, keys)
+            fetched = loop.time()
+            for key in result:
+                self._property_fetched[key] = fetched
+            if self.data:
+                self.async_set_updated_data(self.data.merge(result))
+
+            mismatched = {
+                key: result.get(key)
+                for key, value in properties.items()
+                if result.get(key) != value
+            }
+            if not mismatched:
+                _LOGGER.debug("Charger %s confirmed %s", self.serial_number, properties)
+                return
+
+            delay = min(delay * 2, CONFIRM_MAX_DELAY)
+            if loop.time() + delay > deadline:
+                expected = {key: properties[key] for key in mismatched}
+                raise IXcommandWriteNotConfirmedError(
+                    f"Charger reports {mismatched} instead of {expected}"
+                )
+
+    def _tiers_due(self, now: float) -> list[int]:
+        """Return the indexes of the property tiers to fetch at this poll."""
+        if self.data is None:
+            return list(range(len(PROPERTY_TIERS)))
+        return [
+            index
+            for index, (_, interval) in enumerate(PROPERTY_TIERS)
+            if now - self._tier_fetched[index] >= interval
+        ]
+
+    def _compute_poll_interval(self, data: ChargerState | None) -> float:
+        """Return the interval profile matching the last known state.
+
+        Every consecutive failure doubles the interval, up to the error
+        interval; the first success returns to the normal profile.
+        """
+        if data is None:
+            interval: float = UPDATE_INTERVAL
+        elif data.charging_status in ACTIVE_CHARGING_STATUSES or data.boost_state or self.load_balanced:
+            interval = self.active_interval
+        else:
+            interval = self.idle_interval
+        if self._consecutive_errors:
+            # Capping the exponent keeps the power small during long outages
+            backoff = interval * 2 ** min(self._consecutive_errors, 16)
+            interval = max(interval, min(backoff, self.error_interval))
+        return interval
+
+    def property_age(self, key: str) -> float | None:
+        """Return the seconds since a property was read, None if unknown or stale.
+
+        Properties on the slower tiers age between their own fetches even
+        while every poll succeeds; values restored from the persisted
+        snapshot have no age.
+        """
+        if self.data is None or self.data_is_stale:
+            return None
+        if (fetched := self._property_fetched.get(key)) is None:
+            return None
+        return self.hass.loop.time() - fetched
+
+    def _in_grace_period(self) -> bool:
+        """Return whether the last snapshot may still be served after a failure."""
+        if self.data is None or self.last_successful_update is None:
+            return False
+        age = (dt_util.utcnow() - self.last_successful_update).total_seconds()
+        return age < self.stale_grace_period
+
+    @callback
+    def _async_set_stale(self, stale: bool) -> None:
+        """Flag the snapshot as stale or fresh, notifying entities of a change.
+
+        The refresh only notifies listeners when the data changed, so a flip
+        without new data has to be announced here.
+        """
+        if stale == self.data_is_stale:
+            return
+        self.data_is_stale = stale
+        if self._notified_data is not None:
+            self.async_update_listeners()
+
+    def _next_slot(self, earliest: float) -> float:
+        """Return the first time at or after earliest on this charger's poll grid.
+
+        The grid repeats every poll interval, shifted by the charger's poll
+        phase, so chargers with different phases never poll together.
+        """
+        interval = self.poll_interval
+        offset = self.poll_phase * interval
+        return math.ceil((earliest - offset) / interval) * interval + offset
+
+    def set_poll_phase(self, phase: float) -> None:
+        """Move the charger's polls to a new phase of the interval.
+
+        A scheduled poll moves to the nearest slot of the new grid; a
+        charger that was never polled takes the next slot from now.
+        """
+        self.poll_phase = phase
+        if not math.isfinite(self.next_poll):
+            # A refresh is running or polling stopped; it reschedules itself
+            return
+        now = self.hass.loop.time()
+        self.next_poll = self._next_slot(max(now, self.next_poll - self.poll_interval / 2))
+
+    def _reschedule(self, data: ChargerState | None) -> None:
+        """Set the time the hub should next refresh this charger."""
+        if self.auth_failed:
+            # Polling stays stopped until reauth reloads the entry
+            self.next_poll = math.inf
+            return
+        self.poll_interval = self._compute_poll_interval(data)
+        # Half an interval of slack keeps the grid slot despite request latency
+        self.next_poll = self._next_slot(self.hass.loop.time() + self.poll_interval / 2)
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> ChargerState:
         """Fetch data from the API."""
+        data = self.data
+        now = self.hass.loop.time()
+        tiers = self._tiers_due(now)
+        keys = [key for index in tiers for key in PROPERTY_TIERS[index][0]]
         try:
-            _LOGGER.debug("Fetching data for charger %s", self.serial_number)
-            data = await self.api_client.get_properties(
-                self.serial_number, ALL_READABLE_PROPERTIES
-            )
-            _LOGGER.debug("Successfully fetched %d properties for charger %s", len(data), self.serial_number)
+            _LOGGER.debug("Fetching %d properties for charger %s", len(keys), self.serial_number)
+            async with self.hub.semaphore:
+                result = await self.api_client.get_properties(self.serial_number, keys)
+            _LOGGER.debug("Successfully fetched %d properties for charger %s", len(result), self.serial_number)
+            data = (self.data or ChargerState()).merge(result)
+            for index in tiers:
+                self._tier_fetched[index] = now
+            for key in result:
+                self._property_fetched[key] = now
+            self._consecutive_errors = 0
+            self.last_successful_update = dt_util.utcnow()
+            self._async_set_stale(False)
+            self._store.async_delay_save(self._async_snapshot_to_store, SNAPSHOT_SAVE_DELAY)
             return data
         except IXcommandApiAuthError as err:
             # This will trigger a config entry reauth flow
+            self._consecutive_errors += 1
+            self.auth_failed = True
             _LOGGER.error("Authentication failed for charger %s: %s", self.serial_number, err)
-            raise UpdateFailed("Authentication failed") from err
+            raise ConfigEntryAuthFailed("Authentication failed") from err
         except IXcommandApiError as err:
+            self._consecutive_errors += 1
+            if self._in_grace_period():
+                _LOGGER.warning(
+                    "Error communicating with API for charger %s, serving data from %s: %s",
+                    self.serial_number,
+                    self.last_successful_update,
+                    err,
+                )
+                self._async_set_stale(True)
+                return data
             _LOGGER.error("Error communicating with API for charger %s: %s", self.serial_number, err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        finally:
+            self._reschedule(data)
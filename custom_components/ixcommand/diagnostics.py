@@ -0,0 +1,66 @@
+"""Diagnostics support for iXcommand EV Charger."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, DOMAIN, PROP_BSSID, PROP_SSID
+from .coordinator import IXcommandCoordinator
+from .hub import IXcommandHub
+
+TO_REDACT = {CONF_API_KEY, PROP_SSID, PROP_BSSID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    The API section covers every charger sharing the entry's API key, with
+    the request metrics broken down per method, endpoint and charger. The
+    API key and the charger's WiFi network are redacted everywhere,
+    including the snapshot persisted for the next start.
+    """
+    coordinator: IXcommandCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    hub: IXcommandHub = hass.data[DOMAIN][entry.entry_id]["hub"]
+    api_client = hub.api_client
+    rate_limiter = api_client.rate_limiter
+    last_update = coordinator.last_successful_update
+    stored = await coordinator.async_load_snapshot()
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "charger": {
+            "data": async_redact_data(coordinator.data.as_dict(), TO_REDACT)
+            if coordinator.data
+            else None,
+            "stored_snapshot": async_redact_data(stored, TO_REDACT) if stored else None,
+            "last_update_success": coordinator.last_update_success,
+            "last_successful_update": last_update.isoformat() if last_update else None,
+            "data_is_stale": coordinator.data_is_stale,
+            "poll_interval": coordinator.poll_interval,
+            "sent_writes": coordinator.write_buffer.sent_writes,
+            "suppressed_writes": coordinator.write_buffer.suppressed_writes,
+        },
+        "api": {
+            "chargers": sorted(hub.coordinators),
+            "circuit_breaker": {
+                "state": api_client.circuit_breaker.state,
+                "consecutive_failures": api_client.circuit_breaker.failures,
+            },
+            "rate_limiter": {
+                "queue_depth": rate_limiter.queue_depth,
+                "peak_waiting_reads": rate_limiter.peak_waiting_reads,
+                "peak_waiting_writes": rate_limiter.peak_waiting_writes,
+                "throttled_requests": rate_limiter.throttled_requests,
+            },
+            "metrics": api_client.metrics.as_dict(),
+        },
+    }
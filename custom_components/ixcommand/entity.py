@@ -1,23 +1,44 @@
 """Base entity for iXcommand EV Charger."""
 
+from collections.abc import Iterable
+from operator import attrgetter
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_SERIAL_NUMBER, DOMAIN, MANUFACTURER, MODEL
 from .coordinator import IXcommandCoordinator
+from .models import ChargerState
 
 
 class IXcommandEntity(CoordinatorEntity[IXcommandCoordinator]):
-    """Base entity for iXcommand EV Charger."""
+    """Base entity for iXcommand EV Charger.
+
+    Subclasses set their _attr_ values once per coordinator update in
+    _update_from_data instead of computing them in properties that Home
+    Assistant reads several times per state write. The state is only
+    written when availability or one of the _tracked_attrs changed.
+    """
+
+    # _attr_ names set by _update_from_data
+    _tracked_attrs: tuple[str, ...] = ("_attr_native_value",)
 
     def __init__(
         self,
         coordinator: IXcommandCoordinator,
         config_entry: ConfigEntry,
         entity_suffix: str,
+        property_keys: Iterable[str] | None = None,
     ) -> None:
-        """Initialize the entity."""
+        """Initialize the entity.
+
+        property_keys lists the API properties the entity displays; the
+        coordinator only notifies the entity when one of them changes.
+        Entities without keys are notified on every update.
+        """
         # Set up unique_id BEFORE super().__init__
         serial = config_entry.data[CONF_SERIAL_NUMBER]
         self._attr_unique_id = f"{DOMAIN}_{serial}_{entity_suffix}"
@@ -35,9 +56,60 @@ class IXcommandEntity(CoordinatorEntity[IXcommandCoordinator]):
         )
 
         # Call super last
-        super().__init__(coordinator)
+        context = frozenset(property_keys) if property_keys is not None else None
+        super().__init__(coordinator, context)
         self.config_entry = config_entry
         self.entity_suffix = entity_suffix
+        self._get_tracked = attrgetter(*self._tracked_attrs)
+        self._written_state: tuple[bool, Any] | None = None
+
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the entity's attributes from a new snapshot."""
+
+    def _refresh_attrs(self) -> bool:
+        """Recompute the attributes, returning whether the state changed."""
+        state: tuple[bool, Any]
+        if (data := self.coordinator.data) is None:
+            state = (self.available, None)
+        else:
+            self._update_from_data(data)
+            state = (self.available, self._get_tracked(self))
+        if state == self._written_state:
+            return False
+        if not self._should_write(state):
+            self._restore_written_attrs()
+            return False
+        self._written_state = state
+        return True
+
+    def _restore_written_attrs(self) -> None:
+        """Put back the attributes last written after a change was held back.
+
+        Otherwise the held-back values would go out with the next write made
+        for another reason, such as an availability change.
+        """
+        if self._written_state is None:
+            return
+        values = self._written_state[1]
+        if len(self._tracked_attrs) == 1:
+            values = (values,)
+        for name, value in zip(self._tracked_attrs, values, strict=True):
+            setattr(self, name, value)
+
+    def _should_write(self, state: tuple[bool, Any]) -> bool:
+        """Return whether a changed (available, value) state should be written."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the attributes before the initial state is written."""
+        await super().async_added_to_hass()
+        self._refresh_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state if the new snapshot changed what the entity shows."""
+        if self._refresh_attrs():
+            self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
@@ -0,0 +1,159 @@
+"""Fleet hub for iXcommand EV Chargers sharing one API key."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import zlib
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+
+from .api import IXcommandApiClient
+from .const import (
+    API_BASE_URL,
+    DATA_HUBS,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS,
+    SCHEDULER_TICK,
+)
+from .load_balancer import IXcommandLoadBalancer
+
+if TYPE_CHECKING:
+    from .coordinator import IXcommandCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def poll_phases(serials: list[str]) -> dict[str, float]:
+    """Spread the chargers' polls evenly over the poll interval.
+
+    Each serial hashes to a stable point on the interval. The chargers keep
+    the order of those points but get evenly spaced phases, starting at the
+    lowest point, so a lone charger polls at its own hashed offset and
+    adding or removing one only shifts the others to keep the spacing.
+    """
+    seeds = sorted((zlib.crc32(serial.encode()) / 2**32, serial) for serial in serials)
+    if not seeds:
+        return {}
+    start = seeds[0][0]
+    return {
+        serial: (start + index / len(seeds)) % 1
+        for index, (_, serial) in enumerate(seeds)
+    }
+
+
+class IXcommandHub:
+    """Single scheduler polling every charger configured with one API key.
+
+    Charger coordinators register here instead of running their own timers.
+    The hub checks once per tick which chargers are due, refreshes them and
+    caps how many property requests are in flight at once. Each coordinator
+    decides its own next due time, so chargers can poll at different rates;
+    the hub gives each one a phase within its interval so that chargers on
+    the same interval poll one after another instead of all at once.
+    The chargers of a hub can also share a site current limit through its
+    load balancer.
+    """
+
+    def __init__(self, hass: HomeAssistant, api_client: IXcommandApiClient) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.api_client = api_client
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._coordinators: dict[str, IXcommandCoordinator] = {}
+        self._unsub_poll: Callable[[], None] | None = None
+        self.load_balancer = IXcommandLoadBalancer(hass, self)
+
+    @property
+    def coordinators(self) -> dict[str, IXcommandCoordinator]:
+        """Return the registered charger coordinators by serial number."""
+        return self._coordinators
+
+    @callback
+    def async_add_coordinator(self, coordinator: IXcommandCoordinator) -> None:
+        """Register a charger coordinator and start polling if needed."""
+        self._coordinators[coordinator.serial_number] = coordinator
+        self._async_rebalance_phases()
+        if self._unsub_poll is None:
+            self._unsub_poll = async_track_time_interval(
+                self.hass,
+                self._async_handle_tick,
+                timedelta(seconds=SCHEDULER_TICK),
+                name=f"{DOMAIN} hub poll",
+            )
+
+    @callback
+    def async_remove_coordinator(self, coordinator: IXcommandCoordinator) -> None:
+        """Unregister a charger coordinator and stop polling when none are left."""
+        self._coordinators.pop(coordinator.serial_number, None)
+        self._async_rebalance_phases()
+        self.load_balancer.async_remove_charger(coordinator)
+        if not self._coordinators and self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+
+    @callback
+    def _async_rebalance_phases(self) -> None:
+        """Give every charger an evenly spaced poll phase."""
+        for serial, phase in poll_phases(list(self._coordinators)).items():
+            self._coordinators[serial].set_poll_phase(phase)
+
+    @callback
+    def _async_handle_tick(self, _now: datetime) -> None:
+        """Start refreshing every charger whose next poll is due."""
+        now = self.hass.loop.time()
+        due = [
+            coordinator
+            for coordinator in self._coordinators.values()
+            if coordinator.next_poll <= now
+        ]
+        if not due:
+            return
+        for coordinator in due:
+            # Not due again until its refresh reschedules it
+            coordinator.next_poll = math.inf
+        self.hass.async_create_background_task(
+            self.async_poll(due), f"{DOMAIN} fleet poll"
+        )
+
+    async def async_poll(
+        self, coordinators: list[IXcommandCoordinator] | None = None
+    ) -> None:
+        """Refresh the given chargers, or all of them, with bounded concurrency."""
+        if coordinators is None:
+            coordinators = list(self._coordinators.values())
+        _LOGGER.debug("Polling %d chargers", len(coordinators))
+        await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in coordinators)
+        )
+
+
+@callback
+def async_get_hub(
+    hass: HomeAssistant, api_key: str, base_url: str = API_BASE_URL
+) -> IXcommandHub:
+    """Return the hub for an API key, creating it on first use."""
+    hubs: dict[str, IXcommandHub] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_HUBS, {}
+    )
+    if (hub := hubs.get(api_key)) is None:
+        api_client = IXcommandApiClient(
+            api_key, async_get_clientsession(hass), base_url=base_url
+        )
+        hub = hubs[api_key] = IXcommandHub(hass, api_client)
+    return hub
+
+
+async def async_release_hub(hass: HomeAssistant, api_key: str) -> None:
+    """Drop the hub for an API key once no charger uses it anymore."""
+    hubs: dict[str, IXcommandHub] = hass.data[DOMAIN][DATA_HUBS]
+    hub = hubs.get(api_key)
+    if hub is not None and not hub.coordinators:
+        del hubs[api_key]
+        await hub.api_client.close()
@@ -0,0 +1,344 @@
+"""Site load balancing for iXcommand EV Chargers behind a shared fuse."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .api import IXcommandApiError
+from .const import (
+    ACTIVE_CHARGING_STATUSES,
+    DOMAIN,
+    LOAD_BALANCE_HEADROOM,
+    LOAD_BALANCE_INTERVAL,
+    MIN_CHARGING_CURRENT,
+    PROP_CHARGING_ENABLE,
+    PROP_TARGET_CURRENT,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import IXcommandCoordinator
+    from .hub import IXcommandHub
+    from .models import ChargerState
+
+_LOGGER = logging.getLogger(__name__)
+
+# Charging status of a charger without a vehicle plugged in
+STATUS_UNPLUGGED = "IDLE"
+# Charging status of a charger with a vehicle plugged in but not charging
+STATUS_CONNECTED = "CONNECTED"
+
+
+@dataclass(slots=True)
+class ChargerDemand:
+    """What the allocator needs to know about one charger.
+
+    maximum_current is the most the charger can use right now, which may be
+    below its rated maximum when the vehicle draws less. Active chargers
+    reserve capacity; inactive ones do not.
+    """
+
+    serial: str
+    maximum_current: int
+    active: bool
+
+
+def allocate_currents(
+    demands: Iterable[ChargerDemand],
+    capacity: float,
+    minimum: int = MIN_CHARGING_CURRENT,
+) -> dict[str, int | None]:
+    """Split a per-phase capacity fairly between the active chargers.
+
+    Every charger draws from L1, single-phase ones only from it, so L1
+    carries the sum of all allocations and is the binding phase. Active
+    chargers get a max-min fair share of the capacity, each between the
+    minimum and its own maximum current. When the capacity cannot give every
+    active charger the minimum, chargers earlier in ``demands`` are served
+    first and the rest get None. Inactive chargers get the minimum without
+    reserving capacity, so a newly plugged vehicle starts low.
+    """
+    result: dict[str, int | None] = {}
+    active: list[ChargerDemand] = []
+    for demand in demands:
+        if demand.active:
+            active.append(demand)
+        else:
+            result[demand.serial] = minimum
+
+    served_count = min(len(active), max(0, int(capacity // minimum)))
+    for demand in active[served_count:]:
+        result[demand.serial] = None
+
+    # Water-filling: chargers with the lowest caps are settled first and the
+    # share of the remaining capacity grows for the others
+    served = sorted(active[:served_count], key=lambda demand: demand.maximum_current)
+    remaining = capacity
+    for index, demand in enumerate(served):
+        share = remaining / (served_count - index)
+        target = max(minimum, min(demand.maximum_current, int(share)))
+        result[demand.serial] = target
+        remaining -= target
+    return result
+
+
+def measured_draw(data: ChargerState) -> float | None:
+    """Return the current a charger draws on its busiest phase.
+
+    A single-phase charger only loads L1, so readings of its other phases
+    are ignored. Returns None before any phase current was reported.
+    """
+    phases: tuple[float | None, ...] = (data.charging_current,)
+    if not data.single_phase:
+        phases += (data.charging_current_l2, data.charging_current_l3)
+    currents = [current for current in phases if current is not None]
+    return max(currents) if currents else None
+
+
+class IXcommandLoadBalancer:
+    """Control loop keeping the chargers of one hub within a site current limit.
+
+    Every LOAD_BALANCE_INTERVAL seconds the loop reads each member charger's
+    snapshot and the optional grid meter, allocates the available current
+    and writes only the targets that changed. Decreases are sent before
+    increases so the site stays under its limit while targets move. Active
+    chargers that cannot get the minimum current are paused with
+    chargingEnable and resumed once capacity returns; which chargers the
+    balancer paused is persisted by their coordinators, so a restart does
+    not leave them disabled.
+
+    A charging vehicle that draws clearly less than its target is only
+    offered LOAD_BALANCE_HEADROOM amps above its measured draw, so the
+    unused current goes to the other chargers. If the vehicle later wants
+    more, its share grows by the headroom each time the snapshot shows it
+    using what it was given. A vehicle plugged in but not charging reserves
+    the minimum current. Chargers without a vehicle get the minimum without
+    reserving it, so capacity is not held back for empty chargers. Members
+    are polled at the active interval even while idle, which bounds how long
+    a newly plugged vehicle draws that minimum unbudgeted to one active
+    poll plus one loop iteration.
+    """
+
+    def __init__(self, hass: HomeAssistant, hub: IXcommandHub) -> None:
+        """Initialize the load balancer."""
+        self.hass = hass
+        self.hub = hub
+        # serial -> (site current limit, grid sensor entity id)
+        self._members: dict[str, tuple[float, str | None]] = {}
+        # Chargers this balancer has paused with chargingEnable
+        self.paused: set[str] = set()
+        self._unsub_loop: Callable[[], None] | None = None
+        self._apply_task: asyncio.Task[None] | None = None
+        self.site_current_limit: float = 0
+        self.grid_sensor: str | None = None
+
+    def _update_settings(self) -> None:
+        """Derive the site settings from the members' options.
+
+        The lowest configured limit wins so a mistyped higher value on one
+        charger can never raise the limit.
+        """
+        if not self._members:
+            return
+        self.site_current_limit = min(limit for limit, _ in self._members.values())
+        sensors = sorted({sensor for _, sensor in self._members.values() if sensor})
+        if len(sensors) > 1:
+            _LOGGER.warning("Chargers configure different grid sensors %s, using %s", sensors, sensors[0])
+        self.grid_sensor = sensors[0] if sensors else None
+
+    @callback
+    def async_add_charger(
+        self, coordinator: IXcommandCoordinator, limit: float, grid_sensor: str | None
+    ) -> None:
+        """Balance a charger and start the control loop if needed."""
+        self._members[coordinator.serial_number] = (limit, grid_sensor)
+        coordinator.load_balanced = True
+        if coordinator.load_balancer_paused:
+            # Paused before a restart; resumed once capacity allows
+            self.paused.add(coordinator.serial_number)
+        self._update_settings()
+        if self._unsub_loop is None:
+            self._unsub_loop = async_track_time_interval(
+                self.hass,
+                self._async_handle_tick,
+                timedelta(seconds=LOAD_BALANCE_INTERVAL),
+                name=f"{DOMAIN} load balancer",
+            )
+
+    @callback
+    def async_remove_charger(self, coordinator: IXcommandCoordinator) -> None:
+        """Stop balancing a charger, resuming it if the balancer paused it."""
+        serial = coordinator.serial_number
+        if self._members.pop(serial, None) is None:
+            return
+        coordinator.load_balanced = False
+        self._update_settings()
+        if serial in self.paused:
+            self.paused.discard(serial)
+            self.hass.async_create_background_task(
+                self._async_resume(coordinator), f"{DOMAIN} resume {serial}"
+            )
+        if not self._members and self._unsub_loop is not None:
+            self._unsub_loop()
+            self._unsub_loop = None
+
+    async def _async_resume(self, coordinator: IXcommandCoordinator) -> None:
+        """Re-enable charging on a charger leaving the balancer."""
+        try:
+            await coordinator.api_client.set_properties(
+                coordinator.serial_number, {PROP_CHARGING_ENABLE: True}
+            )
+        except IXcommandApiError as err:
+            _LOGGER.warning("Failed to resume charger %s: %s", coordinator.serial_number, err)
+            return
+        coordinator.async_set_load_balancer_paused(False)
+
+    @callback
+    def _async_set_paused(self, serial: str, paused: bool) -> None:
+        """Track whether this balancer paused a charger, persisting it."""
+        if paused:
+            self.paused.add(serial)
+        else:
+            self.paused.discard(serial)
+        if (coordinator := self.hub.coordinators.get(serial)) is not None:
+            coordinator.async_set_load_balancer_paused(paused)
+
+    @callback
+    def _async_handle_tick(self, _now: datetime) -> None:
+        """Run one control loop iteration unless writes are still in flight."""
+        if self._apply_task is not None and not self._apply_task.done():
+            return
+        if writes := self.async_plan():
+            self._apply_task = self.hass.async_create_background_task(
+                self.async_apply(writes), f"{DOMAIN} load balancer writes"
+            )
+
+    def _available_capacity(self, states: list[tuple[str, ChargerState]]) -> float | None:
+        """Return the per-phase current the chargers may use together.
+
+        With a grid meter, the load of everything else on the site is the
+        metered current minus what the chargers draw on their busiest
+        phase. Returns None when the meter cannot be read.
+        """
+        capacity = self.site_current_limit
+        if (sensor := self.grid_sensor) is None:
+            return capacity
+        state = self.hass.states.get(sensor)
+        try:
+            grid_current = float(state.state) if state is not None else None
+        except ValueError:
+            grid_current = None
+        if grid_current is None:
+            _LOGGER.debug("Grid sensor %s unavailable, holding current targets", sensor)
+            return None
+        phase_draw = [0.0, 0.0, 0.0]
+        for _, data in states:
+            phase_draw[0] += data.charging_current or 0
+            if not data.single_phase:
+                phase_draw[1] += data.charging_current_l2 or 0
+                phase_draw[2] += data.charging_current_l3 or 0
+        return capacity - max(0.0, grid_current - max(phase_draw))
+
+    @callback
+    def async_plan(self) -> dict[str, dict[str, Any]]:
+        """Compute the properties to write to each charger this iteration."""
+        coordinators = self.hub.coordinators
+        states = [
+            (serial, coordinators[serial].data)
+            for serial in self._members
+            if serial in coordinators and coordinators[serial].data is not None
+        ]
+        if not states or (capacity := self._available_capacity(states)) is None:
+            return {}
+
+        writes: dict[str, dict[str, Any]] = {}
+        demands = []
+        # Chargers still charging keep their place when capacity runs short,
+        # ahead of paused chargers and vehicles waiting to start
+        for serial, data in sorted(
+            states,
+            key=lambda item: (
+                item[0] in self.paused,
+                item[1].charging_status not in ACTIVE_CHARGING_STATUSES,
+                item[0],
+            ),
+        ):
+            if serial in self.paused and data.charging_status == STATUS_UNPLUGGED:
+                # The vehicle left while paused; leave the charger enabled
+                self._async_set_paused(serial, False)
+                writes[serial] = {PROP_CHARGING_ENABLE: True}
+            demands.append(self._demand(serial, data))
+
+        targets = allocate_currents(demands, capacity)
+        for serial, data in states:
+            properties = writes.setdefault(serial, {})
+            target = targets[serial]
+            if target is None:
+                if serial not in self.paused and data.charging_enable is not False:
+                    properties[PROP_CHARGING_ENABLE] = False
+            else:
+                if data.target_current != target:
+                    properties[PROP_TARGET_CURRENT] = target
+                if serial in self.paused:
+                    properties[PROP_CHARGING_ENABLE] = True
+            if not properties:
+                del writes[serial]
+        return writes
+
+    def _demand(self, serial: str, data: ChargerState) -> ChargerDemand:
+        """Return what one charger asks of the allocator."""
+        maximum = data.maximum_current or MIN_CHARGING_CURRENT
+        if serial in self.paused:
+            return ChargerDemand(serial, maximum, True)
+        if data.charging_status == STATUS_CONNECTED:
+            return ChargerDemand(serial, MIN_CHARGING_CURRENT, True)
+        if data.charging_status not in ACTIVE_CHARGING_STATUSES:
+            return ChargerDemand(serial, maximum, False)
+        draw = measured_draw(data)
+        target = data.target_current
+        if draw is not None and target is not None and draw + LOAD_BALANCE_HEADROOM < target:
+            maximum = min(maximum, max(MIN_CHARGING_CURRENT, math.ceil(draw + LOAD_BALANCE_HEADROOM)))
+        return ChargerDemand(serial, maximum, True)
+
+    async def async_apply(self, writes: dict[str, dict[str, Any]]) -> None:
+        """Send the planned writes, lowering currents before raising them."""
+        coordinators = self.hub.coordinators
+        lowering: list[tuple[str, dict[str, Any]]] = []
+        raising: list[tuple[str, dict[str, Any]]] = []
+        for serial, properties in writes.items():
+            if (coordinator := coordinators.get(serial)) is None:
+                continue
+            current = coordinator.data.target_current if coordinator.data else None
+            target = properties.get(PROP_TARGET_CURRENT)
+            if properties.get(PROP_CHARGING_ENABLE) is True or (
+                target is not None and current is not None and target > current
+            ):
+                raising.append((serial, properties))
+            else:
+                lowering.append((serial, properties))
+
+        _LOGGER.debug("Load balancer lowering %s, raising %s", lowering, raising)
+        for batch in (lowering, raising):
+            await asyncio.gather(*(self._async_write(serial, properties) for serial, properties in batch))
+
+    async def _async_write(self, serial: str, properties: dict[str, Any]) -> None:
+        """Write one charger's properties and track pausing."""
+        coordinator = self.hub.coordinators.get(serial)
+        if coordinator is None:
+            return
+        try:
+            await coordinator.write_buffer.async_write(properties)
+        except IXcommandApiError as err:
+            _LOGGER.warning("Load balancer failed to write %s to charger %s: %s", properties, serial, err)
+            return
+        enable = properties.get(PROP_CHARGING_ENABLE)
+        if enable is not None:
+            self._async_set_paused(serial, not enable)
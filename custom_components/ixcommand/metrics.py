@@ -0,0 +1,121 @@
+"""Request metrics for the iXcommand API."""
+
+from __future__ import annotations
+
+import bisect
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import API_LATENCY_BUCKETS, API_LATENCY_WINDOW
+
+# Charger endpoints are counted per charger and under one endpoint label
+_CHARGER_ENDPOINT = re.compile(r"^/thing/([^/]+)")
+
+
+@dataclass(slots=True)
+class RequestStats:
+    """Counters for one group of API requests.
+
+    Every attempt counts as a request, retries included. The latency
+    histogram holds how many requests finished within each bound of
+    API_LATENCY_BUCKETS, plus a last bin for slower ones.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    latency_total: float = 0.0
+    latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(API_LATENCY_BUCKETS) + 1)
+    )
+    errors_by_type: dict[str, int] = field(default_factory=dict)
+    recent_latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=API_LATENCY_WINDOW)
+    )
+
+    def record(self, latency: float, received: int, error: str | None) -> None:
+        """Count one finished request."""
+        self.requests += 1
+        self.bytes_received += received
+        self.latency_total += latency
+        self.latency_histogram[bisect.bisect_left(API_LATENCY_BUCKETS, latency)] += 1
+        self.recent_latencies.append(latency)
+        if error is not None:
+            self.errors += 1
+            self.errors_by_type[error] = self.errors_by_type.get(error, 0) + 1
+
+    @property
+    def recent_latency(self) -> float | None:
+        """Return the mean latency of the last requests in seconds, None without any."""
+        if not self.recent_latencies:
+            return None
+        return sum(self.recent_latencies) / len(self.recent_latencies)
+
+    def histogram(self) -> dict[str, int]:
+        """Return the latency histogram keyed by its upper bounds."""
+        bounds = [str(bound) for bound in API_LATENCY_BUCKETS] + ["+Inf"]
+        return dict(zip(bounds, self.latency_histogram, strict=True))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "errors_by_type": dict(self.errors_by_type),
+            "bytes_received": self.bytes_received,
+            "mean_latency": self.latency_total / self.requests if self.requests else None,
+            "recent_latency": self.recent_latency,
+            "latency_histogram": self.histogram(),
+        }
+
+
+class ApiMetrics:
+    """Request metrics of one API client, and so of one API key.
+
+    Requests are counted in total, per HTTP method, per endpoint and per
+    charger. Endpoints are labelled with the method and the path, with
+    the serial number replaced by a placeholder so that all chargers share
+    one label.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.total = RequestStats()
+        self.by_method: dict[str, RequestStats] = {}
+        self.by_endpoint: dict[str, RequestStats] = {}
+        self.by_charger: dict[str, RequestStats] = {}
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        latency: float,
+        received: int,
+        error: str | None = None,
+    ) -> None:
+        """Count one finished request attempt."""
+        groups = [
+            self.total,
+            self.by_method.setdefault(method, RequestStats()),
+        ]
+        if match := _CHARGER_ENDPOINT.match(endpoint):
+            groups.append(self.by_charger.setdefault(match[1], RequestStats()))
+            endpoint = f"/thing/{{serial}}{endpoint[match.end():]}"
+        groups.append(self.by_endpoint.setdefault(f"{method} {endpoint}", RequestStats()))
+        for stats in groups:
+            stats.record(latency, received, error)
+
+    def charger(self, serial_number: str) -> RequestStats:
+        """Return the counters of one charger, empty before its first request."""
+        return self.by_charger.get(serial_number) or RequestStats()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all counters for diagnostics."""
+        return {
+            "total": self.total.as_dict(),
+            "by_method": {key: stats.as_dict() for key, stats in self.by_method.items()},
+            "by_endpoint": {key: stats.as_dict() for key, stats in self.by_endpoint.items()},
+            "by_charger": {key: stats.as_dict() for key, stats in self.by_charger.items()},
+        }
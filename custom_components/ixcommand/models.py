@@ -0,0 +1,185 @@
+"""Data models for iXcommand EV Charger."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from .api import IXcommandApiError
+from .const import (
+    PROP_BOOST_CURRENT,
+    PROP_BOOST_REMAINING,
+    PROP_BOOST_STATE,
+    PROP_BOOST_TIME,
+    PROP_BSSID,
+    PROP_CHARGING_CURRENT,
+    PROP_CHARGING_CURRENT_L2,
+    PROP_CHARGING_CURRENT_L3,
+    PROP_CHARGING_ENABLE,
+    PROP_CHARGING_STATE,
+    PROP_CHARGING_STATUS,
+    PROP_CURRENT_CHARGING_POWER,
+    PROP_MAXIMUM_CURRENT,
+    PROP_SIGNAL,
+    PROP_SINGLE_PHASE,
+    PROP_SSID,
+    PROP_TARGET_CURRENT,
+    PROP_TOTAL_ENERGY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Phase current (A) below which a phase is not counted as charging
+ACTIVE_PHASE_CURRENT = 0.5
+
+
+def _parse_int(value: Any) -> int:
+    """Return an integer property, accepting integral floats."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        raise TypeError(f"expected an integer, got {value!r}")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"expected an integer, got {value!r}")
+        return int(value)
+    return value
+
+
+def _parse_float(value: Any) -> float:
+    """Return a numeric property as a float."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        raise TypeError(f"expected a number, got {value!r}")
+    return float(value)
+
+
+def _parse_bool(value: Any) -> bool:
+    """Return a boolean property."""
+    if not isinstance(value, bool):
+        raise TypeError(f"expected a boolean, got {value!r}")
+    return value
+
+
+def _parse_str(value: Any) -> str:
+    """Return a string property."""
+    if not isinstance(value, str):
+        raise TypeError(f"expected a string, got {value!r}")
+    return value
+
+
+# API property key -> (ChargerState field, parser)
+PROPERTY_FIELDS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    PROP_BOOST_CURRENT: ("boost_current", _parse_int),
+    PROP_TARGET_CURRENT: ("target_current", _parse_int),
+    PROP_SINGLE_PHASE: ("single_phase", _parse_bool),
+    PROP_BOOST_TIME: ("boost_time", _parse_int),
+    PROP_MAXIMUM_CURRENT: ("maximum_current", _parse_int),
+    PROP_CHARGING_ENABLE: ("charging_enable", _parse_bool),
+    PROP_CHARGING_CURRENT: ("charging_current", _parse_float),
+    PROP_BOOST_REMAINING: ("boost_remaining", _parse_int),
+    PROP_CHARGING_STATE: ("charging_state", _parse_str),
+    PROP_SIGNAL: ("signal", _parse_int),
+    PROP_BOOST_STATE: ("boost_state", _parse_bool),
+    PROP_TOTAL_ENERGY: ("total_energy", _parse_float),
+    PROP_CURRENT_CHARGING_POWER: ("current_charging_power", _parse_float),
+    PROP_CHARGING_CURRENT_L2: ("charging_current_l2", _parse_float),
+    PROP_CHARGING_CURRENT_L3: ("charging_current_l3", _parse_float),
+    PROP_CHARGING_STATUS: ("charging_status", _parse_str),
+    PROP_SSID: ("ssid", _parse_str),
+    PROP_BSSID: ("bssid", _parse_str),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ChargerState:
+    """Parsed snapshot of one charger's properties.
+
+    Instances are immutable: merge() returns a new snapshot with the changed
+    fields, or the same instance when nothing changed. Properties the API
+    has not reported yet are None. Values of the wrong type are logged and
+    dropped so the previous value is kept.
+    """
+
+    boost_current: int | None = None
+    target_current: int | None = None
+    single_phase: bool | None = None
+    boost_time: int | None = None
+    maximum_current: int | None = None
+    charging_enable: bool | None = None
+    charging_current: float | None = None
+    boost_remaining: int | None = None
+    charging_state: str | None = None
+    signal: int | None = None
+    boost_state: bool | None = None
+    total_energy: float | None = None
+    current_charging_power: float | None = None
+    charging_current_l2: float | None = None
+    charging_current_l3: float | None = None
+    charging_status: str | None = None
+    ssid: str | None = None
+    bssid: str | None = None
+    # Derived from the phase currents
+    total_current: float | None = field(default=None, init=False, compare=False)
+    phase_count: int = field(default=0, init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the derived values."""
+        currents = [
+            current
+            for current in (self.charging_current, self.charging_current_l2, self.charging_current_l3)
+            if current is not None
+        ]
+        if currents:
+            object.__setattr__(self, "total_current", round(sum(currents), 2))
+        object.__setattr__(
+            self,
+            "phase_count",
+            sum(1 for current in currents if current >= ACTIVE_PHASE_CURRENT),
+        )
+
+    @classmethod
+    def from_properties(cls, properties: Mapping[str, Any]) -> ChargerState:
+        """Parse a snapshot from an API properties payload."""
+        return cls().merge(properties)
+
+    def merge(self, properties: Mapping[str, Any]) -> ChargerState:
+        """Return a snapshot with the given API properties applied."""
+        if not isinstance(properties, Mapping):
+            raise IXcommandApiError(f"Malformed properties payload: {properties!r}")
+
+        changes: dict[str, Any] = {}
+        for key, value in properties.items():
+            if (spec := PROPERTY_FIELDS.get(key)) is None:
+                continue
+            name, parse = spec
+            if value is not None:
+                try:
+                    value = parse(value)
+                except (TypeError, ValueError) as err:
+                    _LOGGER.warning("Ignoring malformed property %s: %s", key, err)
+                    continue
+            if getattr(self, name) != value:
+                changes[name] = value
+        return replace(self, **changes) if changes else self
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a property by its API key."""
+        value = getattr(self, PROPERTY_FIELDS[key][0])
+        return default if value is None else value
+
+    def changed_properties(self, other: ChargerState) -> list[str]:
+        """Return the API keys whose values differ from another snapshot."""
+        return [
+            key
+            for key, (name, _) in PROPERTY_FIELDS.items()
+            if getattr(self, name) != getattr(other, name)
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the reported properties keyed by API key."""
+        return {
+            key: value
+            for key, (name, _) in PROPERTY_FIELDS.items()
+            if (value := getattr(self, name)) is not None
+        }
+
@@ -12,9 +12,10 @@ from .const import (
     PROP_MAXIMUM_CURRENT,
     PROP_TARGET_CURRENT,
 )
-from .controllable_entity import IXcommandControllableEntity
+from .controllable_entity import WRITE_COALESCE_DELAY, IXcommandControllableEntity
 from .coordinator import IXcommandCoordinator
 from .entity import IXcommandEntity
+from .models import ChargerState
 
 
 async def async_setup_entry(
@@ -43,7 +44,9 @@ class IXcommandTargetCurrentNumber(IXcommandControllableEntity, IXcommandEntity,
     _attr_native_min_value = 6
     _attr_native_step = 1
     _attr_native_unit_of_measurement = "A"
+    _write_delay = WRITE_COALESCE_DELAY
     _property_key = PROP_TARGET_CURRENT
+    _tracked_attrs = ("_attr_native_value", "_attr_native_max_value")
 
     def __init__(
         self,
@@ -54,19 +57,13 @@ class IXcommandTargetCurrentNumber(IXcommandControllableEntity, IXcommandEntity,
         friendly_name: str,
     ) -> None:
         """Initialize the number entity."""
-        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix)
+        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix, (self._property_key, PROP_MAXIMUM_CURRENT))
         IXcommandControllableEntity.__init__(self, coordinator, api_client)
 
-    @property
-    def native_max_value(self) -> float:
-        """Return the maximum allowed current based on maximum_current setting."""
-        max_current = self.coordinator.data.get(PROP_MAXIMUM_CURRENT, 16)
-        return float(max_current)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current target current."""
-        return self.coordinator.data.get(PROP_TARGET_CURRENT)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the target current, capped by the maximum_current setting."""
+        self._attr_native_max_value = float(data.get(PROP_MAXIMUM_CURRENT, 16))
+        self._attr_native_value = data.target_current
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the target current."""
@@ -80,7 +77,9 @@ class IXcommandBoostCurrentNumber(IXcommandControllableEntity, IXcommandEntity,
     _attr_native_min_value = 6
     _attr_native_step = 1
     _attr_native_unit_of_measurement = "A"
+    _write_delay = WRITE_COALESCE_DELAY
     _property_key = PROP_BOOST_CURRENT
+    _tracked_attrs = ("_attr_native_value", "_attr_native_max_value")
 
     def __init__(
         self,
@@ -91,19 +90,13 @@ class IXcommandBoostCurrentNumber(IXcommandControllableEntity, IXcommandEntity,
         friendly_name: str,
     ) -> None:
         """Initialize the number entity."""
-        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix)
+        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix, (self._property_key, PROP_MAXIMUM_CURRENT))
         IXcommandControllableEntity.__init__(self, coordinator, api_client)
 
-    @property
-    def native_max_value(self) -> float:
-        """Return the maximum allowed current based on maximum_current setting."""
-        max_current = self.coordinator.data.get(PROP_MAXIMUM_CURRENT, 16)
-        return float(max_current)
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current boost current."""
-        return self.coordinator.data.get(PROP_BOOST_CURRENT)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the boost current, capped by the maximum_current setting."""
+        self._attr_native_max_value = float(data.get(PROP_MAXIMUM_CURRENT, 16))
+        self._attr_native_value = data.boost_current
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the boost current."""
@@ -118,6 +111,7 @@ class IXcommandMaximumCurrentNumber(IXcommandControllableEntity, IXcommandEntity
     _attr_native_max_value = 16
     _attr_native_step = 1
     _attr_native_unit_of_measurement = "A"
+    _write_delay = WRITE_COALESCE_DELAY
     _property_key = PROP_MAXIMUM_CURRENT
 
     def __init__(
@@ -129,13 +123,12 @@ class IXcommandMaximumCurrentNumber(IXcommandControllableEntity, IXcommandEntity
         friendly_name: str,
     ) -> None:
         """Initialize the number entity."""
-        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix)
+        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix, (self._property_key,))
         IXcommandControllableEntity.__init__(self, coordinator, api_client)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current maximum current."""
-        return self.coordinator.data.get(PROP_MAXIMUM_CURRENT)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the maximum current."""
+        self._attr_native_value = data.maximum_current
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the maximum current."""
@@ -150,6 +143,7 @@ class IXcommandBoostTimeNumber(IXcommandControllableEntity, IXcommandEntity, Num
     _attr_native_max_value = 86400
     _attr_native_step = 60
     _attr_native_unit_of_measurement = "s"
+    _write_delay = WRITE_COALESCE_DELAY
     _property_key = PROP_BOOST_TIME
 
     def __init__(
@@ -161,13 +155,12 @@ class IXcommandBoostTimeNumber(IXcommandControllableEntity, IXcommandEntity, Num
         friendly_name: str,
     ) -> None:
         """Initialize the number entity."""
-        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix)
+        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix, (self._property_key,))
         IXcommandControllableEntity.__init__(self, coordinator, api_client)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current boost time."""
-        return self.coordinator.data.get(PROP_BOOST_TIME)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the boost time."""
+        self._attr_native_value = data.boost_time
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the boost time."""
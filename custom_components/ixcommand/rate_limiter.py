@@ -0,0 +1,105 @@
+"""Client-side rate limiting for the iXcommand API."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from .const import READ_BURST, READ_RATE, WRITE_BURST, WRITE_RATE
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token if one is available.
+
+        Returns 0 when a token was taken, otherwise the number of seconds
+        until the next token becomes available.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+
+class IXcommandRateLimiter:
+    """Rate limiter shared by every request made with one API key.
+
+    Reads and writes draw from separate token buckets. Writes have priority:
+    while any write is waiting for a token, reads hold back so a burst of
+    polls cannot delay a user's control command.
+    """
+
+    def __init__(
+        self,
+        read_rate: float = READ_RATE,
+        read_burst: float = READ_BURST,
+        write_rate: float = WRITE_RATE,
+        write_burst: float = WRITE_BURST,
+    ) -> None:
+        """Initialize the rate limiter."""
+        self._read_bucket = TokenBucket(read_rate, read_burst)
+        self._write_bucket = TokenBucket(write_rate, write_burst)
+        self._writes_idle = asyncio.Event()
+        self._writes_idle.set()
+        self.waiting_reads = 0
+        self.waiting_writes = 0
+        self.peak_waiting_reads = 0
+        self.peak_waiting_writes = 0
+        self.throttled_requests = 0
+
+    @property
+    def queue_depth(self) -> dict[str, int]:
+        """Return how many reads and writes are waiting for a token."""
+        return {"read": self.waiting_reads, "write": self.waiting_writes}
+
+    async def async_acquire(self, write: bool) -> None:
+        """Wait until a read or write may be sent."""
+        if write:
+            await self._async_acquire_write()
+        else:
+            await self._async_acquire_read()
+
+    async def _async_acquire_write(self) -> None:
+        """Wait for a write token, holding reads back meanwhile."""
+        if (delay := self._write_bucket.take()) == 0:
+            return
+        self.throttled_requests += 1
+        self.waiting_writes += 1
+        self.peak_waiting_writes = max(self.peak_waiting_writes, self.waiting_writes)
+        self._writes_idle.clear()
+        try:
+            while delay:
+                await asyncio.sleep(delay)
+                delay = self._write_bucket.take()
+        finally:
+            self.waiting_writes -= 1
+            if not self.waiting_writes:
+                self._writes_idle.set()
+
+    async def _async_acquire_read(self) -> None:
+        """Wait for a read token once no write is waiting."""
+        if self._writes_idle.is_set() and (delay := self._read_bucket.take()) == 0:
+            return
+        self.throttled_requests += 1
+        self.waiting_reads += 1
+        self.peak_waiting_reads = max(self.peak_waiting_reads, self.waiting_reads)
+        try:
+            while True:
+                await self._writes_idle.wait()
+                if (delay := self._read_bucket.take()) == 0:
+                    return
+                await asyncio.sleep(delay)
+        finally:
+            self.waiting_reads -= 1
@@ -1,17 +1,42 @@
 """Sensor entities for iXcommand EV Charger."""
 
+import math
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import Any
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
 from .const import (
+    API_DIAGNOSTIC_INTERVAL,
     CHARGING_STATUSES,
+    CIRCUIT_STATES,
+    CONF_CURRENT_DEADBAND,
+    CONF_CURRENT_MIN_INTERVAL,
+    CONF_POWER_DEADBAND,
+    CONF_POWER_MIN_INTERVAL,
+    CONF_SIGNAL_DEADBAND,
+    CONF_SIGNAL_MIN_INTERVAL,
+    DEFAULT_CURRENT_DEADBAND,
+    DEFAULT_CURRENT_MIN_INTERVAL,
+    DEFAULT_POWER_DEADBAND,
+    DEFAULT_POWER_MIN_INTERVAL,
+    DEFAULT_SIGNAL_DEADBAND,
+    DEFAULT_SIGNAL_MIN_INTERVAL,
+    ENERGY_INTERPOLATION_STEP,
+    INTERPOLATION_INTERVAL,
     PROP_BOOST_REMAINING,
+    PROP_BOOST_STATE,
     PROP_BSSID,
     PROP_CHARGING_CURRENT,
     PROP_CHARGING_CURRENT_L2,
@@ -24,6 +49,8 @@ from .const import (
 )
 from .coordinator import IXcommandCoordinator
 from .entity import IXcommandEntity
+from .metrics import RequestStats
+from .models import ChargerState
 
 
 async def async_setup_entry(
@@ -50,18 +77,194 @@ async def async_setup_entry(
         IXcommandChargingStatusSensor(coordinator, config_entry, "charging_status", "Charging Status"),
         IXcommandTextSensor(coordinator, config_entry, "wifi_ssid", "WiFi SSID", PROP_SSID),
         IXcommandTextSensor(coordinator, config_entry, "wifi_bssid", "WiFi BSSID", PROP_BSSID),
+
+        # Diagnostic sensors
+        IXcommandApiStatusSensor(coordinator, config_entry, "api_status", "API Status"),
+        IXcommandLastUpdateSensor(coordinator, config_entry, "last_successful_update", "Last Successful Update"),
+        IXcommandApiRequestsSensor(coordinator, config_entry, "api_requests", "API Requests"),
+        IXcommandApiErrorsSensor(coordinator, config_entry, "api_errors", "API Errors"),
+        IXcommandApiLatencySensor(coordinator, config_entry, "api_latency", "API Latency"),
+        IXcommandApiBytesSensor(coordinator, config_entry, "api_bytes_received", "API Bytes Received"),
     ]
 
     async_add_entities(entities)
 
 
-class IXcommandPowerSensor(IXcommandEntity, SensorEntity):
+class IXcommandFilteredSensor(IXcommandEntity, SensorEntity):
+    """Numeric sensor that only writes significant changes.
+
+    A new value is written once it differs from the last written value by
+    at least the deadband and the minimum interval since the last write has
+    passed; a significant change arriving too early is written when the
+    interval ends. The first value, the first value after being unavailable
+    and any value arriving with a charging status transition are always
+    written.
+    """
+
+    # (option key, default) of the deadband and the minimum interval
+    _deadband_option: tuple[str, float]
+    _min_interval_option: tuple[str, float]
+
+    def __init__(
+        self,
+        coordinator: IXcommandCoordinator,
+        config_entry: ConfigEntry,
+        entity_suffix: str,
+        property_keys: Iterable[str],
+    ) -> None:
+        """Initialize the sensor and read its filter options."""
+        # Listen to the status too so transitions can force a write
+        super().__init__(
+            coordinator, config_entry, entity_suffix, (*property_keys, PROP_CHARGING_STATUS)
+        )
+        self._deadband: float = config_entry.options.get(*self._deadband_option)
+        self._min_interval: float = config_entry.options.get(*self._min_interval_option)
+        self._status: str | None = None
+        self._status_changed = False
+        self._written_at = -math.inf
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Cancel a delayed write when the entity is removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_flush)
+
+    @callback
+    def _async_cancel_flush(self) -> None:
+        """Cancel the delayed write, if any."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+    @callback
+    def _async_flush(self, _now: Any) -> None:
+        """Write a change that was held back by the minimum interval."""
+        self._unsub_flush = None
+        self._handle_coordinator_update()
+
+    def _refresh_attrs(self) -> bool:
+        """Note charging status transitions before filtering."""
+        status = self.coordinator.data.charging_status if self.coordinator.data else None
+        self._status_changed = status != self._status
+        self._status = status
+        return super()._refresh_attrs()
+
+    def _should_write(self, state: tuple[bool, Any]) -> bool:
+        """Return whether the change passes the deadband and minimum interval."""
+        available, value = state
+        written = self._written_state
+        now = time.monotonic()
+        if (
+            written is not None
+            and written[0]
+            and available
+            and not self._status_changed
+            and value is not None
+            and written[1] is not None
+        ):
+            if abs(value - written[1]) < self._deadband:
+                return False
+            if (wait := self._written_at + self._min_interval - now) > 0:
+                if self._unsub_flush is None and self.hass is not None:
+                    self._unsub_flush = async_call_later(self.hass, wait, self._async_flush)
+                return False
+
+        self._async_cancel_flush()
+        self._written_at = now
+        return True
+
+
+class IXcommandInterpolatedSensor(IXcommandEntity, SensorEntity):
+    """Sensor estimating its value between polls.
+
+    Whenever the properties in the sensor's context change, the new
+    readings are stored with the monotonic time they arrived. While
+    _is_moving() is true, a timer re-estimates the value from the stored
+    readings every INTERPOLATION_INTERVAL and writes it when it changed.
+    No API request is made for the estimates. The estimate is held while
+    the coordinator serves stale data.
+    """
+
+    def __init__(
+        self,
+        coordinator: IXcommandCoordinator,
+        config_entry: ConfigEntry,
+        entity_suffix: str,
+        property_keys: Iterable[str],
+    ) -> None:
+        """Initialize the sensor."""
+        self._property_keys = tuple(property_keys)
+        super().__init__(coordinator, config_entry, entity_suffix, self._property_keys)
+        self._readings: tuple[Any, ...] | None = None
+        self._read_at = 0.0
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Stop estimating when the entity is removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_stop_ticking)
+
+    def _resync(self, readings: tuple[Any, ...]) -> None:
+        """Take new readings from a poll."""
+
+    def _estimate(self, elapsed: float) -> Any:
+        """Return the value ``elapsed`` seconds after the readings arrived."""
+        raise NotImplementedError
+
+    def _is_moving(self) -> bool:
+        """Return whether the value changes between polls."""
+        raise NotImplementedError
+
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Resync on new readings and estimate the current value."""
+        now = time.monotonic()
+        readings = tuple(data.get(key) for key in self._property_keys)
+        if readings != self._readings:
+            self._resync(readings)
+            self._readings = readings
+            self._read_at = now
+        elif self.coordinator.data_is_stale:
+            return
+        self._attr_native_value = self._estimate(now - self._read_at)
+
+    def _refresh_attrs(self) -> bool:
+        """Start or stop the estimate timer after every refresh."""
+        changed = super()._refresh_attrs()
+        if self.hass is not None:
+            if self.available and not self.coordinator.data_is_stale and self._is_moving():
+                if self._unsub_tick is None:
+                    self._unsub_tick = async_track_time_interval(
+                        self.hass,
+                        self._async_handle_tick,
+                        timedelta(seconds=INTERPOLATION_INTERVAL),
+                        name=f"{self.entity_id} estimate",
+                    )
+            else:
+                self._async_stop_ticking()
+        return changed
+
+    @callback
+    def _async_handle_tick(self, _now: Any) -> None:
+        """Write a new estimate."""
+        self._handle_coordinator_update()
+
+    @callback
+    def _async_stop_ticking(self) -> None:
+        """Stop the estimate timer, if running."""
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+
+class IXcommandPowerSensor(IXcommandFilteredSensor):
     """Sensor for current charging power."""
 
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "W"
     _attr_suggested_display_precision = 0
+    _deadband_option = (CONF_POWER_DEADBAND, DEFAULT_POWER_DEADBAND)
+    _min_interval_option = (CONF_POWER_MIN_INTERVAL, DEFAULT_POWER_MIN_INTERVAL)
 
     def __init__(
         self,
@@ -71,16 +274,22 @@ class IXcommandPowerSensor(IXcommandEntity, SensorEntity):
         friendly_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, config_entry, entity_suffix)
+        super().__init__(coordinator, config_entry, entity_suffix, (PROP_CURRENT_CHARGING_POWER,))
+
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the current charging power."""
+        self._attr_native_value = data.current_charging_power
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current charging power."""
-        return self.coordinator.data.get(PROP_CURRENT_CHARGING_POWER)
 
+class IXcommandEnergySensor(IXcommandInterpolatedSensor):
+    """Sensor for total energy consumption.
 
-class IXcommandEnergySensor(IXcommandEntity, SensorEntity):
-    """Sensor for total energy consumption."""
+    Between polls the energy is extrapolated from the charging power in
+    ENERGY_INTERPOLATION_STEP increments, for at most one poll interval.
+    The value never drops below one already shown, so statistics do not
+    see a meter reset when a poll reports less than was extrapolated; only
+    a decrease of the charger's own counter is passed through.
+    """
 
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
@@ -95,21 +304,48 @@ class IXcommandEnergySensor(IXcommandEntity, SensorEntity):
         friendly_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, config_entry, entity_suffix)
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the total energy consumption."""
-        return self.coordinator.data.get(PROP_TOTAL_ENERGY)
-
-
-class IXcommandCurrentSensor(IXcommandEntity, SensorEntity):
+        super().__init__(
+            coordinator, config_entry, entity_suffix, (PROP_TOTAL_ENERGY, PROP_CURRENT_CHARGING_POWER)
+        )
+        # Lowest value the estimate may show
+        self._floor: float | None = None
+
+    def _resync(self, readings: tuple[Any, ...]) -> None:
+        """Keep the shown value as the floor unless the counter went down."""
+        energy = readings[0]
+        previous = self._readings[0] if self._readings else None
+        if energy is None or previous is None or energy < previous:
+            self._floor = None
+        else:
+            self._floor = self._attr_native_value
+
+    def _estimate(self, elapsed: float) -> float | None:
+        """Add the energy charged since the last reading."""
+        assert self._readings is not None
+        energy, power = self._readings
+        if energy is None:
+            return None
+        elapsed = min(elapsed, self.coordinator.poll_interval)
+        charged = (power or 0) * elapsed / 3600
+        estimate = energy + charged // ENERGY_INTERPOLATION_STEP * ENERGY_INTERPOLATION_STEP
+        if self._floor is not None:
+            estimate = max(estimate, self._floor)
+        return estimate
+
+    def _is_moving(self) -> bool:
+        """Return whether the charger is drawing power."""
+        return self._readings is not None and self._readings[0] is not None and bool(self._readings[1])
+
+
+class IXcommandCurrentSensor(IXcommandFilteredSensor):
     """Sensor for charging current."""
 
     _attr_device_class = SensorDeviceClass.CURRENT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "A"
     _attr_suggested_display_precision = 1
+    _deadband_option = (CONF_CURRENT_DEADBAND, DEFAULT_CURRENT_DEADBAND)
+    _min_interval_option = (CONF_CURRENT_MIN_INTERVAL, DEFAULT_CURRENT_MIN_INTERVAL)
 
     def __init__(
         self,
@@ -120,17 +356,16 @@ class IXcommandCurrentSensor(IXcommandEntity, SensorEntity):
         property_key: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, config_entry, entity_suffix)
+        super().__init__(coordinator, config_entry, entity_suffix, (property_key,))
         self._property_key = property_key
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the charging current."""
-        return self.coordinator.data.get(self._property_key)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the charging current."""
+        self._attr_native_value = data.get(self._property_key)
 
 
-class IXcommandDurationSensor(IXcommandEntity, SensorEntity):
-    """Sensor for boost remaining time."""
+class IXcommandDurationSensor(IXcommandInterpolatedSensor):
+    """Sensor for boost remaining time, counting down every second during a boost."""
 
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -145,19 +380,28 @@ class IXcommandDurationSensor(IXcommandEntity, SensorEntity):
         friendly_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, config_entry, entity_suffix)
+        super().__init__(coordinator, config_entry, entity_suffix, (PROP_BOOST_REMAINING, PROP_BOOST_STATE))
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the boost remaining time."""
-        return self.coordinator.data.get(PROP_BOOST_REMAINING)
+    def _estimate(self, elapsed: float) -> int | None:
+        """Count the remaining time down while the boost runs."""
+        assert self._readings is not None
+        remaining, boosting = self._readings
+        if remaining is None or not boosting:
+            return remaining
+        return max(0, remaining - int(elapsed))
 
+    def _is_moving(self) -> bool:
+        """Return whether a boost is counting down."""
+        return self._readings is not None and bool(self._readings[1]) and bool(self._attr_native_value)
 
-class IXcommandSignalStrengthSensor(IXcommandEntity, SensorEntity):
+
+class IXcommandSignalStrengthSensor(IXcommandFilteredSensor):
     """Sensor for WiFi signal strength."""
 
     _attr_native_unit_of_measurement = "%"
     _attr_suggested_display_precision = 0
+    _deadband_option = (CONF_SIGNAL_DEADBAND, DEFAULT_SIGNAL_DEADBAND)
+    _min_interval_option = (CONF_SIGNAL_MIN_INTERVAL, DEFAULT_SIGNAL_MIN_INTERVAL)
 
     def __init__(
         self,
@@ -167,12 +411,11 @@ class IXcommandSignalStrengthSensor(IXcommandEntity, SensorEntity):
         friendly_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, config_entry, entity_suffix)
+        super().__init__(coordinator, config_entry, entity_suffix, (PROP_SIGNAL,))
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the WiFi signal strength."""
-        return self.coordinator.data.get(PROP_SIGNAL)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the WiFi signal strength."""
+        self._attr_native_value = data.signal
 
 
 class IXcommandChargingStatusSensor(IXcommandEntity, SensorEntity):
@@ -189,12 +432,11 @@ class IXcommandChargingStatusSensor(IXcommandEntity, SensorEntity):
         friendly_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, config_entry, entity_suffix)
+        super().__init__(coordinator, config_entry, entity_suffix, (PROP_CHARGING_STATUS,))
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the charging status."""
-        return self.coordinator.data.get(PROP_CHARGING_STATUS)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the charging status."""
+        self._attr_native_value = data.charging_status
 
 
 class IXcommandTextSensor(IXcommandEntity, SensorEntity):
@@ -209,10 +451,191 @@ class IXcommandTextSensor(IXcommandEntity, SensorEntity):
         property_key: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, config_entry, entity_suffix)
+        super().__init__(coordinator, config_entry, entity_suffix, (property_key,))
         self._property_key = property_key
 
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set the text value."""
+        self._attr_native_value = data.get(self._property_key)
+
+
+class IXcommandApiDiagnosticSensor(IXcommandEntity, SensorEntity):
+    """Diagnostic sensor reporting on the communication with the API.
+
+    What it shows changes with every request, also between coordinator
+    updates and while failing polls notify nobody, so the sensor
+    re-reads it every API_DIAGNOSTIC_INTERVAL and writes its state when it
+    changed. It stays available while polling fails.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _tracked_attrs: tuple[str, ...] = ("_attr_native_value", "_attr_extra_state_attributes")
+
+    def __init__(
+        self,
+        coordinator: IXcommandCoordinator,
+        config_entry: ConfigEntry,
+        entity_suffix: str,
+        friendly_name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        # No property keys: snapshots never change what the sensor shows
+        super().__init__(coordinator, config_entry, entity_suffix, ())
+
     @property
-    def native_value(self) -> str | None:
-        """Return the text value."""
-        return self.coordinator.data.get(self._property_key)
+    def available(self) -> bool:
+        """Return True; the communication state is known even while polling fails."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the sensor periodically while the entity exists."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_handle_tick,
+                timedelta(seconds=API_DIAGNOSTIC_INTERVAL),
+                name=f"{self.entity_id} refresh",
+            )
+        )
+
+    @callback
+    def _async_handle_tick(self, _now: Any) -> None:
+        """Write the state if it changed."""
+        self._handle_coordinator_update()
+
+    def _refresh_attrs(self) -> bool:
+        """Recompute the attributes from the API client, returning whether they changed."""
+        self._update_from_api()
+        state = (True, self._get_tracked(self))
+        if state == self._written_state:
+            return False
+        self._written_state = state
+        return True
+
+    def _update_from_api(self) -> None:
+        """Set the entity's attributes from the API client and the coordinator."""
+        raise NotImplementedError
+
+
+class IXcommandLastUpdateSensor(IXcommandApiDiagnosticSensor):
+    """Sensor for the time of the charger's last successful poll.
+
+    Entities only write their state when their values change, so this
+    sensor is the one place showing how old the served data is.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _tracked_attrs = ("_attr_native_value",)
+
+    def _update_from_api(self) -> None:
+        """Set the time of the last successful poll."""
+        self._attr_native_value = self.coordinator.last_successful_update
+
+
+class IXcommandApiStatusSensor(IXcommandApiDiagnosticSensor):
+    """Sensor for the circuit breaker state of the iXcommand API."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = CIRCUIT_STATES
+
+    def _update_from_api(self) -> None:
+        """Set the circuit breaker state and the failure and queue counters."""
+        api_client = self.coordinator.api_client
+        rate_limiter = api_client.rate_limiter
+        self._attr_native_value = api_client.circuit_breaker.state
+        self._attr_extra_state_attributes = {
+            "consecutive_failures": api_client.circuit_breaker.failures,
+            "queued_reads": rate_limiter.waiting_reads,
+            "queued_writes": rate_limiter.waiting_writes,
+            "throttled_requests": rate_limiter.throttled_requests,
+            "sent_writes": self.coordinator.write_buffer.sent_writes,
+            "suppressed_writes": self.coordinator.write_buffer.suppressed_writes,
+        }
+
+
+class IXcommandApiMetricSensor(IXcommandApiDiagnosticSensor):
+    """Disabled-by-default sensor for the API requests made for a charger.
+
+    The value covers the charger's own requests; the attributes add the
+    totals of every charger sharing the API key.
+    """
+
+    _attr_entity_registry_enabled_default = False
+
+    def _update_from_api(self) -> None:
+        """Read the charger's and the API key's counters."""
+        metrics = self.coordinator.api_client.metrics
+        self._update_from_metrics(metrics.charger(self.coordinator.serial_number), metrics.total)
+
+    def _update_from_metrics(self, charger: RequestStats, total: RequestStats) -> None:
+        """Set the value from the charger's and the API key's counters."""
+        raise NotImplementedError
+
+
+class IXcommandApiRequestsSensor(IXcommandApiMetricSensor):
+    """Sensor counting the API requests made for a charger."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _unrecorded_attributes = frozenset({"api_key_requests", "by_method", "by_endpoint"})
+
+    def _update_from_metrics(self, charger: RequestStats, total: RequestStats) -> None:
+        """Set the request counts."""
+        metrics = self.coordinator.api_client.metrics
+        self._attr_native_value = charger.requests
+        self._attr_extra_state_attributes = {
+            "api_key_requests": total.requests,
+            "by_method": {key: stats.requests for key, stats in metrics.by_method.items()},
+            "by_endpoint": {key: stats.requests for key, stats in metrics.by_endpoint.items()},
+        }
+
+
+class IXcommandApiErrorsSensor(IXcommandApiMetricSensor):
+    """Sensor counting the failed API requests made for a charger."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _unrecorded_attributes = frozenset({"errors_by_type", "api_key_errors", "api_key_errors_by_type"})
+
+    def _update_from_metrics(self, charger: RequestStats, total: RequestStats) -> None:
+        """Set the error counts by type."""
+        self._attr_native_value = charger.errors
+        self._attr_extra_state_attributes = {
+            "errors_by_type": dict(charger.errors_by_type),
+            "api_key_errors": total.errors,
+            "api_key_errors_by_type": dict(total.errors_by_type),
+        }
+
+
+class IXcommandApiLatencySensor(IXcommandApiMetricSensor):
+    """Sensor for the mean latency of the charger's recent API requests."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "ms"
+    _attr_suggested_display_precision = 0
+    _unrecorded_attributes = frozenset({"latency_histogram", "api_key_latency", "api_key_latency_histogram"})
+
+    def _update_from_metrics(self, charger: RequestStats, total: RequestStats) -> None:
+        """Set the recent mean latency and the latency histograms."""
+        latency = charger.recent_latency
+        api_key_latency = total.recent_latency
+        self._attr_native_value = round(latency * 1000) if latency is not None else None
+        self._attr_extra_state_attributes = {
+            "latency_histogram": charger.histogram(),
+            "api_key_latency": round(api_key_latency * 1000) if api_key_latency is not None else None,
+            "api_key_latency_histogram": total.histogram(),
+        }
+
+
+class IXcommandApiBytesSensor(IXcommandApiMetricSensor):
+    """Sensor for the bytes received from the API for a charger."""
+
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "B"
+    _unrecorded_attributes = frozenset({"api_key_bytes_received"})
+
+    def _update_from_metrics(self, charger: RequestStats, total: RequestStats) -> None:
+        """Set the received byte counts."""
+        self._attr_native_value = charger.bytes_received
+        self._attr_extra_state_attributes = {"api_key_bytes_received": total.bytes_received}
@@ -0,0 +1,147 @@
+"""Services for iXcommand EV Charger."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .api import IXcommandApiError
+from .const import (
+    ATTR_DEVICE_ID,
+    ATTR_PROPERTIES,
+    ATTR_SERIAL_NUMBER,
+    DATA_HUBS,
+    DOMAIN,
+    MAX_CONCURRENT_WRITES,
+    MIN_CHARGING_CURRENT,
+    PROP_BOOST_CURRENT,
+    PROP_BOOST_TIME,
+    PROP_CHARGING_ENABLE,
+    PROP_MAXIMUM_CURRENT,
+    PROP_SINGLE_PHASE,
+    PROP_TARGET_CURRENT,
+    SERVICE_SET_PROPERTIES,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import IXcommandCoordinator
+    from .hub import IXcommandHub
+
+_LOGGER = logging.getLogger(__name__)
+
+CURRENT_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=MIN_CHARGING_CURRENT))
+
+# Writable property -> value validator
+PROPERTY_VALIDATORS: dict[str, Any] = {
+    PROP_BOOST_CURRENT: CURRENT_VALIDATOR,
+    PROP_TARGET_CURRENT: CURRENT_VALIDATOR,
+    PROP_SINGLE_PHASE: cv.boolean,
+    PROP_BOOST_TIME: vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+    PROP_MAXIMUM_CURRENT: CURRENT_VALIDATOR,
+    PROP_CHARGING_ENABLE: cv.boolean,
+}
+
+SET_PROPERTIES_SCHEMA = vol.All(
+    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_SERIAL_NUMBER),
+    vol.Schema(
+        {
+            vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_SERIAL_NUMBER): vol.All(cv.ensure_list, [cv.string]),
+            vol.Required(ATTR_PROPERTIES): vol.All(
+                vol.Schema(
+                    {vol.Optional(key): validator for key, validator in PROPERTY_VALIDATORS.items()}
+                ),
+                vol.Length(min=1),
+            ),
+        }
+    ),
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def _async_set_properties(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_set_properties(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PROPERTIES,
+        _async_set_properties,
+        schema=SET_PROPERTIES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _resolve_coordinators(hass: HomeAssistant, call: ServiceCall) -> list[IXcommandCoordinator]:
+    """Return the coordinators of the targeted chargers.
+
+    Raises ServiceValidationError before anything is written when a device
+    or serial number does not belong to a loaded charger.
+    """
+    hubs: dict[str, IXcommandHub] = hass.data.get(DOMAIN, {}).get(DATA_HUBS, {})
+    coordinators = {
+        serial: coordinator
+        for hub in hubs.values()
+        for serial, coordinator in hub.coordinators.items()
+    }
+
+    serials = list(call.data.get(ATTR_SERIAL_NUMBER, []))
+    for device_id in call.data.get(ATTR_DEVICE_ID, []):
+        identifiers = []
+        if (device := dr.async_get(hass).async_get(device_id)) is not None:
+            identifiers = [serial for domain, serial in device.identifiers if domain == DOMAIN]
+        if not identifiers:
+            raise ServiceValidationError(f"Device {device_id} is not an iXcommand charger")
+        serials.extend(identifiers)
+
+    if unknown := sorted({serial for serial in serials if serial not in coordinators}):
+        raise ServiceValidationError(f"Unknown iXcommand chargers: {', '.join(unknown)}")
+    # dict.fromkeys drops duplicates while keeping the order
+    return [coordinators[serial] for serial in dict.fromkeys(serials)]
+
+
+async def async_handle_set_properties(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Write the same properties to several chargers in parallel.
+
+    Every charger gets one PATCH through its write buffer, at most
+    MAX_CONCURRENT_WRITES chargers at a time. A failing charger does not
+    stop the others; the response reports the outcome per serial number.
+    """
+    coordinators = _resolve_coordinators(hass, call)
+    properties: dict[str, Any] = call.data[ATTR_PROPERTIES]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
+
+    async def _async_write(coordinator: IXcommandCoordinator) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                await coordinator.write_buffer.async_write(properties)
+            except IXcommandApiError as err:
+                _LOGGER.warning(
+                    "Failed to set %s on charger %s: %s", properties, coordinator.serial_number, err
+                )
+                return {"success": False, "error": str(err)}
+        return {"success": True}
+
+    _LOGGER.debug("Setting %s on %d chargers", properties, len(coordinators))
+    results = await asyncio.gather(*(_async_write(coordinator) for coordinator in coordinators))
+    return {
+        "chargers": {
+            coordinator.serial_number: result
+            for coordinator, result in zip(coordinators, results, strict=True)
+        }
+    }
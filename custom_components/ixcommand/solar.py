@@ -0,0 +1,121 @@
+"""Solar surplus charging for iXcommand EV Chargers."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from .const import (
+    DEFAULT_SOLAR_HYSTERESIS,
+    DEFAULT_SOLAR_MIN_WRITE_INTERVAL,
+    MIN_CHARGING_CURRENT,
+    PHASE_VOLTAGE,
+    PROP_CHARGING_ENABLE,
+    PROP_SINGLE_PHASE,
+    PROP_TARGET_CURRENT,
+    SOLAR_MODE_SWITCH_INTERVAL,
+)
+from .models import ChargerState
+
+
+class SurplusWindow:
+    """Rolling average of the power available for charging."""
+
+    def __init__(self, window: float) -> None:
+        """Initialize an empty window spanning ``window`` seconds."""
+        self.window = window
+        self._samples: deque[tuple[float, float]] = deque()
+        self._total = 0.0
+
+    def add(self, now: float, power: float) -> None:
+        """Add a sample and drop the ones that left the window."""
+        self._samples.append((now, power))
+        self._total += power
+        while self._samples[0][0] <= now - self.window:
+            self._total -= self._samples.popleft()[1]
+
+    def clear(self) -> None:
+        """Forget all samples."""
+        self._samples.clear()
+        self._total = 0.0
+
+    @property
+    def mean(self) -> float | None:
+        """Return the average power, or None without samples."""
+        if not self._samples:
+            return None
+        return self._total / len(self._samples)
+
+
+def charging_phases(data: ChargerState) -> int:
+    """Return the phases a charger is set to charge on, 0 when disabled."""
+    if data.charging_enable is False:
+        return 0
+    return 1 if data.single_phase else 3
+
+
+@dataclass(slots=True)
+class SolarSurplusController:
+    """Decide the charger settings that follow a solar surplus.
+
+    The surplus is the smoothed power that would be exported without the
+    charger. It is turned into a whole-amp target current on one or three
+    phases. Switching to more phases, or resuming from a pause, needs the
+    surplus to clear the minimum current's power by ``hysteresis``;
+    switching down happens as soon as it no longer covers the minimum.
+
+    Writes are strictly rate-limited: nothing is returned within
+    ``min_write_interval`` of the previous write, and the phase count or
+    charging enable changes at most once per ``mode_switch_interval`` to
+    spare the charger's contactors. Until a mode switch is allowed the
+    current mode is kept at the nearest valid current.
+    """
+
+    hysteresis: float = DEFAULT_SOLAR_HYSTERESIS
+    min_write_interval: float = DEFAULT_SOLAR_MIN_WRITE_INTERVAL
+    mode_switch_interval: float = SOLAR_MODE_SWITCH_INTERVAL
+    minimum_current: int = MIN_CHARGING_CURRENT
+    voltage: float = PHASE_VOLTAGE
+    last_write: float = -math.inf
+    last_mode_change: float = -math.inf
+
+    def select_phases(self, surplus: float, phases: int) -> int:
+        """Return the phases to charge on for a surplus, 0 to pause."""
+        for candidate in (3, 1):
+            threshold = self.minimum_current * self.voltage * candidate
+            if candidate > phases:
+                threshold += self.hysteresis
+            if surplus >= threshold:
+                return candidate
+        return 0
+
+    def plan(self, surplus: float, data: ChargerState, now: float) -> dict[str, Any]:
+        """Return the properties to write now, empty to leave the charger be."""
+        current = charging_phases(data)
+        phases = self.select_phases(surplus, current)
+        if phases != current and now - self.last_mode_change < self.mode_switch_interval:
+            phases = current
+
+        properties: dict[str, Any] = {}
+        if phases == 0:
+            if data.charging_enable is not False:
+                properties[PROP_CHARGING_ENABLE] = False
+        else:
+            maximum = data.maximum_current or self.minimum_current
+            target = int(surplus // (self.voltage * phases))
+            target = max(self.minimum_current, min(maximum, target))
+            if data.charging_enable is False:
+                properties[PROP_CHARGING_ENABLE] = True
+            if data.single_phase != (phases == 1):
+                properties[PROP_SINGLE_PHASE] = phases == 1
+            if data.target_current != target:
+                properties[PROP_TARGET_CURRENT] = target
+
+        if not properties or now - self.last_write < self.min_write_interval:
+            return {}
+        self.last_write = now
+        if phases != current:
+            self.last_mode_change = now
+        return properties
@@ -1,15 +1,43 @@
 """Switch entities for iXcommand EV Charger."""
 
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_ON, UnitOfPower
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.restore_state import RestoreEntity
 
-from .api import IXcommandApiClient
-from .const import PROP_BOOST_STATE, PROP_CHARGING_ENABLE, PROP_SINGLE_PHASE
+from .api import IXcommandApiClient, IXcommandApiError
+from .const import (
+    CONF_SITE_CURRENT_LIMIT,
+    CONF_SOLAR_EXPORT_SENSOR,
+    CONF_SOLAR_HYSTERESIS,
+    CONF_SOLAR_MIN_WRITE_INTERVAL,
+    CONF_SOLAR_WINDOW,
+    DEFAULT_SOLAR_HYSTERESIS,
+    DEFAULT_SOLAR_MIN_WRITE_INTERVAL,
+    DEFAULT_SOLAR_WINDOW,
+    DOMAIN,
+    PROP_BOOST_STATE,
+    PROP_CHARGING_ENABLE,
+    PROP_SINGLE_PHASE,
+    SOLAR_CONTROL_INTERVAL,
+)
 from .controllable_entity import IXcommandControllableEntity
 from .coordinator import IXcommandCoordinator
 from .entity import IXcommandEntity
+from .models import ChargerState
+from .solar import SolarSurplusController, SurplusWindow
+
+_LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
@@ -26,6 +54,19 @@ async def async_setup_entry(
         IXcommandSinglePhaseSwitch(coordinator, config_entry, api_client, "single_phase", "Single Phase Mode"),
         IXcommandBoostStateSwitch(coordinator, config_entry, "boost_state", "Boost Mode"),
     ]
+    export_sensor = config_entry.options.get(CONF_SOLAR_EXPORT_SENSOR)
+    if export_sensor and config_entry.options.get(CONF_SITE_CURRENT_LIMIT):
+        # Saved before the options flow rejected the combination; balancing wins
+        _LOGGER.warning(
+            "Charger %s is load balanced, not adding solar surplus charging",
+            coordinator.serial_number,
+        )
+    elif export_sensor:
+        entities.append(
+            IXcommandSolarSurplusSwitch(
+                coordinator, config_entry, api_client, export_sensor, "solar_surplus", "Solar Surplus Charging"
+            )
+        )
 
     async_add_entities(entities)
 
@@ -33,6 +74,8 @@ async def async_setup_entry(
 class IXcommandChargingEnableSwitch(IXcommandControllableEntity, IXcommandEntity, SwitchEntity):
     """Switch for charging enable/disable."""
 
+    _tracked_attrs = ("_attr_is_on",)
+
     def __init__(
         self,
         coordinator: IXcommandCoordinator,
@@ -42,13 +85,12 @@ class IXcommandChargingEnableSwitch(IXcommandControllableEntity, IXcommandEntity
         friendly_name: str,
     ) -> None:
         """Initialize the switch."""
-        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix)
+        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix, (PROP_CHARGING_ENABLE,))
         IXcommandControllableEntity.__init__(self, coordinator, api_client)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if charging is enabled."""
-        return self.coordinator.data.get(PROP_CHARGING_ENABLE)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set whether charging is enabled."""
+        self._attr_is_on = data.charging_enable
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on charging."""
@@ -62,6 +104,8 @@ class IXcommandChargingEnableSwitch(IXcommandControllableEntity, IXcommandEntity
 class IXcommandSinglePhaseSwitch(IXcommandControllableEntity, IXcommandEntity, SwitchEntity):
     """Switch for single phase mode."""
 
+    _tracked_attrs = ("_attr_is_on",)
+
     def __init__(
         self,
         coordinator: IXcommandCoordinator,
@@ -71,13 +115,12 @@ class IXcommandSinglePhaseSwitch(IXcommandControllableEntity, IXcommandEntity, S
         friendly_name: str,
     ) -> None:
         """Initialize the switch."""
-        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix)
+        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix, (PROP_SINGLE_PHASE,))
         IXcommandControllableEntity.__init__(self, coordinator, api_client)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if single phase mode is enabled."""
-        return self.coordinator.data.get(PROP_SINGLE_PHASE)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set whether single phase mode is enabled."""
+        self._attr_is_on = data.single_phase
 
     async def async_turn_on(self, **kwargs) -> None:
         """Enable single phase mode."""
@@ -91,6 +134,8 @@ class IXcommandSinglePhaseSwitch(IXcommandControllableEntity, IXcommandEntity, S
 class IXcommandBoostStateSwitch(IXcommandEntity, SwitchEntity):
     """Read-only switch for boost state."""
 
+    _tracked_attrs = ("_attr_is_on",)
+
     def __init__(
         self,
         coordinator: IXcommandCoordinator,
@@ -99,14 +144,144 @@ class IXcommandBoostStateSwitch(IXcommandEntity, SwitchEntity):
         friendly_name: str,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, config_entry, entity_suffix)
+        super().__init__(coordinator, config_entry, entity_suffix, (PROP_BOOST_STATE,))
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if boost mode is active."""
-        return self.coordinator.data.get(PROP_BOOST_STATE)
+    def _update_from_data(self, data: ChargerState) -> None:
+        """Set whether boost mode is active."""
+        self._attr_is_on = data.boost_state
 
     @property
     def available(self) -> bool:
         """Return if entity is available (read-only switch is always available if coordinator is)."""
         return super().available
+
+
+class IXcommandSolarSurplusSwitch(IXcommandControllableEntity, IXcommandEntity, SwitchEntity, RestoreEntity):
+    """Switch for charging from the solar surplus.
+
+    While on, the export sensor and the charger's own power are sampled
+    every SOLAR_CONTROL_INTERVAL seconds into a rolling window, and the
+    averaged surplus drives targetCurrent, singlePhase and chargingEnable
+    through SolarSurplusController. The switch state is restored after a
+    restart; a charger found with charging disabled is taken to have been
+    paused by the switch, so turning it off resumes it.
+    """
+
+    _tracked_attrs = ("_attr_is_on",)
+
+    def __init__(
+        self,
+        coordinator: IXcommandCoordinator,
+        config_entry: ConfigEntry,
+        api_client: IXcommandApiClient,
+        export_sensor: str,
+        entity_suffix: str,
+        friendly_name: str,
+    ) -> None:
+        """Initialize the switch and read its control options."""
+        # The switch state is its own, no property change needs to reach it
+        IXcommandEntity.__init__(self, coordinator, config_entry, entity_suffix, ())
+        IXcommandControllableEntity.__init__(self, coordinator, api_client)
+        options = config_entry.options
+        self.export_sensor = export_sensor
+        self.window = SurplusWindow(options.get(CONF_SOLAR_WINDOW, DEFAULT_SOLAR_WINDOW))
+        self.controller = SolarSurplusController(
+            hysteresis=options.get(CONF_SOLAR_HYSTERESIS, DEFAULT_SOLAR_HYSTERESIS),
+            min_write_interval=options.get(CONF_SOLAR_MIN_WRITE_INTERVAL, DEFAULT_SOLAR_MIN_WRITE_INTERVAL),
+        )
+        # Whether this switch paused charging and must resume it when turned off
+        self.paused = False
+        self._attr_is_on = False
+        self._unsub_loop: Callable[[], None] | None = None
+        self._write_task: asyncio.Task[None] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the switch state and stop the control loop on removal."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_stop_loop)
+        if (last_state := await self.async_get_last_state()) is not None and last_state.state == STATE_ON:
+            self._attr_is_on = True
+            # The snapshot is warm-started from disk, so it is known this early
+            if (data := self.coordinator.data) is not None and data.charging_enable is False:
+                self.paused = True
+            self._async_start_loop()
+
+    @callback
+    def _async_start_loop(self) -> None:
+        """Start sampling and controlling with an empty window."""
+        self.window.clear()
+        if self._unsub_loop is None:
+            self._unsub_loop = async_track_time_interval(
+                self.hass,
+                self._async_handle_tick,
+                timedelta(seconds=SOLAR_CONTROL_INTERVAL),
+                name=f"{DOMAIN} solar surplus {self.coordinator.serial_number}",
+            )
+
+    @callback
+    def _async_stop_loop(self) -> None:
+        """Stop the control loop."""
+        if self._unsub_loop is not None:
+            self._unsub_loop()
+            self._unsub_loop = None
+
+    def _read_export_power(self) -> float | None:
+        """Return the exported power in W, or None when it cannot be read."""
+        state = self.hass.states.get(self.export_sensor)
+        if state is None:
+            return None
+        try:
+            power = float(state.state)
+        except ValueError:
+            return None
+        if state.attributes.get("unit_of_measurement") == UnitOfPower.KILO_WATT:
+            power *= 1000
+        return power
+
+    @callback
+    def _async_handle_tick(self, _now: datetime) -> None:
+        """Sample the surplus and send new settings when the controller asks."""
+        if (data := self.coordinator.data) is None or (export := self._read_export_power()) is None:
+            _LOGGER.debug("Solar surplus inputs unavailable, holding settings")
+            return
+        now = time.monotonic()
+        # The charger's own draw would be exported if it were not charging
+        self.window.add(now, export + (data.current_charging_power or 0))
+        if self._write_task is not None and not self._write_task.done():
+            return
+        surplus = self.window.mean
+        assert surplus is not None
+        if properties := self.controller.plan(surplus, data, now):
+            _LOGGER.debug("Solar surplus %.0f W, writing %s", surplus, properties)
+            self._write_task = self.hass.async_create_background_task(
+                self._async_write(properties), f"{DOMAIN} solar surplus writes"
+            )
+
+    async def _async_write(self, properties: dict[str, Any]) -> None:
+        """Send the properties; the write buffer merges them into one PATCH."""
+        try:
+            await asyncio.gather(*(self._async_control(key, value) for key, value in properties.items()))
+        except IXcommandApiError:
+            # Already logged; the next tick retries once the rate cap allows
+            return
+        enable = properties.get(PROP_CHARGING_ENABLE)
+        if enable is not None and self._attr_is_on:
+            self.paused = not enable
+
+    async def async_turn_on(self, **kwargs) -> None:
+        """Start following the solar surplus."""
+        self._attr_is_on = True
+        self._async_start_loop()
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Stop following the solar surplus, resuming charging if paused."""
+        self._async_stop_loop()
+        if self._write_task is not None:
+            # A pause still in flight must be recorded before checking it
+            await asyncio.wait((self._write_task,))
+        self._attr_is_on = False
+        self.async_write_ha_state()
+        if self.paused:
+            await self._async_control(PROP_CHARGING_ENABLE, True)
+            self.paused = False
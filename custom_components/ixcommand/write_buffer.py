@@ -0,0 +1,147 @@
+"""Write coalescing for iXcommand EV Charger controls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+if TYPE_CHECKING:
+    from .coordinator import IXcommandCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IXcommandWriteBuffer:
+    """Debounce and merge property writes for one charger.
+
+    Writes arriving within the debounce window are merged into a single
+    PATCH, with the latest value for each property winning. Every caller
+    waits until the PATCH carrying its write has completed and the charger
+    has reported the written values back.
+
+    Only one batch is in flight at a time, so PATCHes reach the charger in
+    the order they were made. Writes arriving meanwhile collapse into the
+    next batch, which is sent once the running one has been confirmed.
+
+    Values the snapshot already shows are dropped before sending when they
+    were read from the charger within the coordinator's write suppression
+    max age, so automations re-asserting a setting cost no request.
+    sent_writes and suppressed_writes count property values sent and dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: IXcommandCoordinator) -> None:
+        """Initialize the write buffer."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._pending: dict[str, Any] = {}
+        self._waiters: list[asyncio.Future[None]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self.sent_writes = 0
+        self.suppressed_writes = 0
+
+    async def async_write(self, properties: dict[str, Any], delay: float = 0) -> None:
+        """Queue properties for writing and wait until they have been sent.
+
+        A delay of zero sends the pending batch right away; otherwise the
+        flush is pushed back so further writes can join the same PATCH.
+        """
+        self._pending.update(properties)
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._waiters.append(future)
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = self.hass.loop.call_later(delay, self._async_start_flush)
+
+        await future
+
+    @callback
+    def _async_start_flush(self) -> None:
+        """Send the pending batch in a background task unless one is running."""
+        self._flush_handle = None
+        if self._flush_task is not None:
+            # The running task sends the pending batch when it is done
+            return
+        self._flush_task = self.hass.async_create_task(self._async_flush())
+
+    def _unchanged_properties(self, properties: dict[str, Any]) -> list[str]:
+        """Return the keys the charger recently reported with these values."""
+        coordinator = self.coordinator
+        max_age = coordinator.write_suppression_max_age
+        if not max_age:
+            return []
+        return [
+            key
+            for key, value in properties.items()
+            if (age := coordinator.property_age(key)) is not None
+            and age <= max_age
+            and coordinator.data.get(key) == value
+        ]
+
+    async def _async_flush(self) -> None:
+        """Send pending batches one after the other until none is due."""
+        try:
+            # A batch still being debounced is started by its own timer
+            while self._pending and self._flush_handle is None:
+                await self._async_send_batch()
+        finally:
+            self._flush_task = None
+
+    async def _async_send_batch(self) -> None:
+        """Send all pending properties in one PATCH and resolve their waiters."""
+        properties, self._pending = self._pending, {}
+        waiters, self._waiters = self._waiters, []
+        if not properties:
+            return
+
+        serial = self.coordinator.serial_number
+        try:
+            if unchanged := self._unchanged_properties(properties):
+                _LOGGER.debug("Charger %s already reports %s, not writing them", serial, unchanged)
+                self.suppressed_writes += len(unchanged)
+                properties = {
+                    key: value for key, value in properties.items() if key not in unchanged
+                }
+            if properties:
+                self.sent_writes += len(properties)
+                _LOGGER.debug(
+                    "Writing %s for charger %s (%d coalesced writes)",
+                    properties,
+                    serial,
+                    len(waiters),
+                )
+                await self.coordinator.api_client.set_properties(serial, properties)
+                self.coordinator.async_set_local_properties(properties)
+                await self.coordinator.async_confirm_properties(properties)
+        except asyncio.CancelledError:
+            for waiter in waiters:
+                waiter.cancel()
+            raise
+        except Exception as err:
+            # Every caller merged into this PATCH gets the same error
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+            return
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop pending writes and stop the running one, failing any callers still waiting."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        self._pending = {}
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.cancel()
@@ -0,0 +1,218 @@
+"""Micro-benchmark of the per-update cost of the iXcommand entities.
+
+Feeds a stream of charger snapshots to one coordinator carrying the full
+set of real sensor, switch and number entities, which write into a real
+Home Assistant state machine. Each variant is run several times,
+alternating, and the fastest run is reported:
+
+- ``before``: every notified entity writes its state and computes its
+  values in properties on each read, as entities did before values were
+  precomputed
+- ``after``: entities compute their values once per update and skip the
+  state write when nothing they show changed
+
+Usage::
+
+    python tests/benchmarks/bench_entity_update.py
+    python tests/benchmarks/bench_entity_update.py --updates 5000 --repeat 9
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ixcommand import number, sensor, switch
+from custom_components.ixcommand.api import IXcommandApiClient
+from custom_components.ixcommand.const import (
+    CONF_API_KEY,
+    CONF_SERIAL_NUMBER,
+    DOMAIN,
+    PROP_CHARGING_CURRENT,
+    PROP_CHARGING_CURRENT_L2,
+    PROP_CHARGING_CURRENT_L3,
+    PROP_CURRENT_CHARGING_POWER,
+    PROP_MAXIMUM_CURRENT,
+    PROP_SIGNAL,
+    PROP_TOTAL_ENERGY,
+)
+from custom_components.ixcommand.coordinator import IXcommandCoordinator
+from custom_components.ixcommand.entity import IXcommandEntity
+from custom_components.ixcommand.models import ChargerState
+from tests.mock_server import MockCharger
+
+DEFAULT_UPDATES = 2000
+DEFAULT_REPEAT = 5
+RESULTS_DIR = Path(__file__).parent / "results"
+MANIFEST = project_root / "custom_components" / "ixcommand" / "manifest.json"
+PLATFORMS = (sensor, switch, number)
+SERIAL = "BENCH-000"
+
+
+class LegacyValues:
+    """Compute the values in properties and write on every update."""
+
+    @property
+    def native_value(self) -> Any:
+        """Recompute the value on every read."""
+        self._update_from_data(self.coordinator.data)
+        return self._attr_native_value
+
+    @property
+    def native_max_value(self) -> float:
+        """Recompute the maximum on every read."""
+        self._update_from_data(self.coordinator.data)
+        return self._attr_native_max_value
+
+    @property
+    def is_on(self) -> bool | None:
+        """Recompute the switch state on every read."""
+        self._update_from_data(self.coordinator.data)
+        return self._attr_is_on
+
+    def _handle_coordinator_update(self) -> None:
+        """Write the state unconditionally."""
+        self.async_write_ha_state()
+
+
+def make_snapshots(count: int) -> list[ChargerState]:
+    """Return snapshots of a charging charger in which a few values move."""
+    charger = MockCharger(SERIAL, True, random.Random(0))
+    state = ChargerState.from_properties(charger.state)
+    snapshots = []
+    for index in range(count):
+        changes: dict[str, Any] = {
+            PROP_CURRENT_CHARGING_POWER: 6900 + index % 7 * 10,
+            PROP_TOTAL_ENERGY: 1_000_000 + index,
+            PROP_CHARGING_CURRENT: 10.0 - index % 3 * 0.1,
+            PROP_CHARGING_CURRENT_L2: 10.0 - index % 4 * 0.1,
+            PROP_CHARGING_CURRENT_L3: 10.0,
+        }
+        if index % 10 == 0:
+            changes[PROP_SIGNAL] = 60 + index % 20
+        if index % 50 == 0:
+            changes[PROP_MAXIMUM_CURRENT] = 16 if index % 100 else 13
+        state = state.merge(changes)
+        snapshots.append(state)
+    return snapshots
+
+
+async def run(hass: HomeAssistant, snapshots: list[ChargerState], legacy: bool) -> dict[str, Any]:
+    """Push the snapshots through one charger's entities."""
+    entry = MagicMock()
+    entry.entry_id = f"{SERIAL}-{legacy}"
+    entry.data = {CONF_API_KEY: "bench", CONF_SERIAL_NUMBER: SERIAL}
+    entry.options = {}
+    hub = MagicMock()
+    hub.api_client = IXcommandApiClient("bench", MagicMock())
+    coordinator = IXcommandCoordinator(hass, entry, hub)
+    coordinator.async_set_updated_data(snapshots[0])
+    hass.data[DOMAIN][entry.entry_id] = {
+        "coordinator": coordinator,
+        "api_client": hub.api_client,
+        "hub": hub,
+    }
+
+    entities: list[tuple[str, IXcommandEntity]] = []
+    for platform_module in PLATFORMS:
+        domain = platform_module.__name__.rsplit(".", 1)[1]
+        await platform_module.async_setup_entry(
+            hass, entry, lambda new, domain=domain: entities.extend((domain, e) for e in new)
+        )
+
+    writes = 0
+    variant = "before" if legacy else "after"
+    for domain, entity in entities:
+        if legacy:
+            entity.__class__ = type(f"Legacy{type(entity).__name__}", (LegacyValues, type(entity)), {})
+        entity.hass = hass
+        entity.entity_id = f"{domain}.bench_{variant}_{entity.entity_suffix}"
+        hass.states.async_remove(entity.entity_id)
+        entity._no_platform_reported = True
+        write_state = entity.async_write_ha_state
+
+        def counted_write(write_state=write_state) -> None:
+            nonlocal writes
+            writes += 1
+            write_state()
+
+        entity.async_write_ha_state = counted_write
+        if not legacy:
+            entity._refresh_attrs()
+        entity.async_write_ha_state()
+        coordinator.async_add_listener(entity._handle_coordinator_update, entity.coordinator_context)
+
+    writes = 0
+    start = time.perf_counter()
+    for snapshot in snapshots[1:]:
+        coordinator.async_set_updated_data(snapshot)
+    elapsed = time.perf_counter() - start
+    updates = len(snapshots) - 1
+    hass.data[DOMAIN].pop(entry.entry_id)
+    return {
+        "us_per_update": round(elapsed / updates * 1e6, 1),
+        "state_writes_per_update": round(writes / updates, 2),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run both variants and report the difference."""
+    logging.basicConfig(level=logging.WARNING)
+    snapshots = make_snapshots(args.updates + 1)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.data[DOMAIN] = {}
+        runs: dict[bool, list[dict[str, Any]]] = {True: [], False: []}
+        for _ in range(args.repeat):
+            for legacy in (True, False):
+                runs[legacy].append(await run(hass, snapshots, legacy))
+        await hass.async_stop(force=True)
+    before = min(runs[True], key=lambda row: row["us_per_update"])
+    after = min(runs[False], key=lambda row: row["us_per_update"])
+
+    result = {
+        "updates": args.updates,
+        "repeat": args.repeat,
+        "before": before,
+        "after": after,
+        "speedup": round(before["us_per_update"] / after["us_per_update"], 2),
+    }
+    print(json.dumps(result))  # noqa: T201
+
+    version = json.loads(MANIFEST.read_text())["version"]
+    report = {
+        "version": version,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "result": result,
+    }
+    output = args.output or RESULTS_DIR / f"bench_entity_update-{version}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=DEFAULT_UPDATES)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", type=Path)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,215 @@
+"""Throughput and latency benchmark for the iXcommand polling loop.
+
+Drives the real IXcommandApiClient, IXcommandHub and IXcommandCoordinator
+against the local mock cloud API for several fleet sizes and reports, per
+size:
+
+- polls per second
+- p50/p95/p99 refresh latency
+- entity state writes per poll cycle
+- CPU time per poll
+- peak Python memory
+
+Results are written as JSON so runs from different releases can be compared::
+
+    python tests/benchmarks/bench_polling.py
+    python tests/benchmarks/bench_polling.py --sizes 1 10 --compare tests/benchmarks/results/bench_polling-1.0.0.json
+
+Client-side rate limiting is lifted so the numbers reflect the integration's
+own overhead rather than the request budget. The mock server runs in the
+same process, so CPU time includes serving the requests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import aiohttp
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ixcommand import number, sensor, switch
+from custom_components.ixcommand.api import IXcommandApiClient
+from custom_components.ixcommand.const import CONF_API_KEY, CONF_SERIAL_NUMBER, DOMAIN
+from custom_components.ixcommand.coordinator import IXcommandCoordinator
+from custom_components.ixcommand.hub import IXcommandHub
+from custom_components.ixcommand.rate_limiter import IXcommandRateLimiter
+from tests.mock_server import MOCK_API_KEY, MockIXcommandServer
+
+DEFAULT_SIZES = [1, 10, 100, 500]
+DEFAULT_CYCLES = 5
+DEFAULT_LATENCY = 0.005  # seconds added by the mock server per request
+RESULTS_DIR = Path(__file__).parent / "results"
+MANIFEST = project_root / "custom_components" / "ixcommand" / "manifest.json"
+PLATFORMS = (sensor, switch, number)
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    """Return the given percentile of the samples."""
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def make_entry(serial: str) -> MagicMock:
+    """Return a minimal config entry for one simulated charger."""
+    entry = MagicMock()
+    entry.entry_id = serial
+    entry.data = {CONF_API_KEY: MOCK_API_KEY, CONF_SERIAL_NUMBER: serial}
+    entry.options = {}
+    return entry
+
+
+async def attach_entities(
+    hass: HomeAssistant, entry: MagicMock, coordinator: IXcommandCoordinator, writes: Counter[str]
+) -> None:
+    """Create the real entities of a charger and count their state writes."""
+    entities: list[Any] = []
+    for platform_module in PLATFORMS:
+        await platform_module.async_setup_entry(hass, entry, entities.extend)
+    for entity in entities:
+
+        def count_write(unique_id: str = entity.unique_id) -> None:
+            writes[unique_id] += 1
+
+        coordinator.async_add_listener(count_write, entity.coordinator_context)
+
+
+async def bench_size(
+    hass: HomeAssistant, session: aiohttp.ClientSession, chargers: int, cycles: int, latency: float
+) -> dict[str, Any]:
+    """Benchmark polling a fleet of the given size."""
+    async with MockIXcommandServer(chargers, latency=latency) as server:
+        api_client = IXcommandApiClient(
+            MOCK_API_KEY,
+            session,
+            base_url=server.base_url,
+            rate_limiter=IXcommandRateLimiter(read_rate=1e9, read_burst=1e9),
+        )
+        hub = IXcommandHub(hass, api_client)
+        writes: Counter[str] = Counter()
+        coordinators = []
+        for serial in server.serials:
+            entry = make_entry(serial)
+            coordinator = IXcommandCoordinator(hass, entry, hub)
+            hass.data[DOMAIN][entry.entry_id] = {
+                "coordinator": coordinator,
+                "api_client": api_client,
+                "hub": hub,
+            }
+            await coordinator.async_refresh()
+            await attach_entities(hass, entry, coordinator, writes)
+            coordinators.append(coordinator)
+
+        latencies: list[float] = []
+
+        async def timed_refresh(coordinator: IXcommandCoordinator) -> None:
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            latencies.append(time.perf_counter() - start)
+
+        writes.clear()
+        tracemalloc.start()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for _ in range(cycles):
+            await asyncio.gather(*(timed_refresh(coordinator) for coordinator in coordinators))
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        hass.data[DOMAIN].clear()
+
+    polls = len(latencies)
+    return {
+        "chargers": chargers,
+        "cycles": cycles,
+        "polls": polls,
+        "polls_per_second": round(polls / wall, 1),
+        "latency_ms": {
+            f"p{pct}": round(percentile(latencies, pct) * 1000, 2) for pct in (50, 95, 99)
+        },
+        "state_writes_per_cycle": round(sum(writes.values()) / cycles, 1),
+        "cpu_ms_per_poll": round(cpu / polls * 1000, 3),
+        "peak_memory_kib": round(peak_memory / 1024, 1),
+        "server_bytes_per_poll": round(server.bytes_sent / server.requests["GET"]),
+    }
+
+
+def compare(results: list[dict[str, Any]], baseline_path: Path) -> None:
+    """Print the relative change of each metric against a baseline file."""
+    baseline = {row["chargers"]: row for row in json.loads(baseline_path.read_text())["results"]}
+    for row in results:
+        if (base := baseline.get(row["chargers"])) is None:
+            continue
+        changes = []
+        for key in ("polls_per_second", "state_writes_per_cycle", "cpu_ms_per_poll", "peak_memory_kib"):
+            if base[key]:
+                changes.append(f"{key} {(row[key] - base[key]) / base[key]:+.0%}")
+        p95, base_p95 = row["latency_ms"]["p95"], base["latency_ms"]["p95"]
+        if base_p95:
+            changes.append(f"p95 {(p95 - base_p95) / base_p95:+.0%}")
+        print(f"{row['chargers']:>4} chargers: " + ", ".join(changes))  # noqa: T201
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark for every requested fleet size."""
+    logging.basicConfig(level=logging.WARNING)
+    results = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.data[DOMAIN] = {}
+        async with aiohttp.ClientSession() as session:
+            for size in args.sizes:
+                row = await bench_size(hass, session, size, args.cycles, args.latency)
+                results.append(row)
+                print(json.dumps(row))  # noqa: T201
+        await hass.async_stop(force=True)
+
+    version = json.loads(MANIFEST.read_text())["version"]
+    report = {
+        "version": version,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "mock_latency_s": args.latency,
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"bench_polling-{version}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {output}")  # noqa: T201
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES)
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path, help="earlier results file to diff against")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,252 @@
+"""Local stand-in for the iXcommand cloud API.
+
+Serves ``/api/v1/thing/{serial}/properties`` for a configurable number of
+simulated chargers whose state evolves over time. Latency, timeouts, 401s
+and 5xx responses can be injected to exercise the client's error handling
+without network access.
+
+Usage::
+
+    async with MockIXcommandServer(chargers=10) as server:
+        client = IXcommandApiClient(server.api_key, session, base_url=server.base_url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand.const import (
+    ALL_READABLE_PROPERTIES,
+    PROP_BOOST_CURRENT,
+    PROP_BOOST_REMAINING,
+    PROP_BOOST_STATE,
+    PROP_BOOST_TIME,
+    PROP_BSSID,
+    PROP_CHARGING_CURRENT,
+    PROP_CHARGING_CURRENT_L2,
+    PROP_CHARGING_CURRENT_L3,
+    PROP_CHARGING_ENABLE,
+    PROP_CHARGING_STATE,
+    PROP_CHARGING_STATUS,
+    PROP_CURRENT_CHARGING_POWER,
+    PROP_MAXIMUM_CURRENT,
+    PROP_SIGNAL,
+    PROP_SINGLE_PHASE,
+    PROP_SSID,
+    PROP_TARGET_CURRENT,
+    PROP_TOTAL_ENERGY,
+    WRITABLE_PROPERTIES,
+)
+
+MOCK_API_KEY = "mock-api-key"
+PHASE_VOLTAGE = 230
+
+
+def mock_serial(index: int) -> str:
+    """Return the serial number of the simulated charger at an index."""
+    return f"MCK-{index // 1000:03d}-{index % 1000:03d}"
+
+
+class MockCharger:
+    """Simulated charger whose measurements evolve with wall-clock time."""
+
+    def __init__(self, serial: str, charging: bool, rng: random.Random) -> None:
+        """Initialize the charger with plausible defaults."""
+        self.serial = serial
+        self._rng = rng
+        self._updated = time.monotonic()
+        self._energy = rng.uniform(0, 5_000_000)
+        self.state: dict[str, Any] = {
+            PROP_BOOST_CURRENT: 16,
+            PROP_TARGET_CURRENT: 10,
+            PROP_SINGLE_PHASE: False,
+            PROP_BOOST_TIME: 0,
+            PROP_MAXIMUM_CURRENT: 16,
+            PROP_CHARGING_ENABLE: True,
+            PROP_CHARGING_CURRENT: 0.0,
+            PROP_BOOST_REMAINING: 0,
+            PROP_CHARGING_STATE: "CHARGING" if charging else "IDLE",
+            PROP_SIGNAL: rng.randint(40, 95),
+            PROP_BOOST_STATE: False,
+            PROP_TOTAL_ENERGY: int(self._energy),
+            PROP_CURRENT_CHARGING_POWER: 0,
+            PROP_CHARGING_CURRENT_L2: 0.0,
+            PROP_CHARGING_CURRENT_L3: 0.0,
+            PROP_CHARGING_STATUS: "CHARGING" if charging else "IDLE",
+            PROP_SSID: "mock-wifi",
+            PROP_BSSID: "02:00:00:00:00:01",
+        }
+        self.evolve()
+
+    def evolve(self) -> None:
+        """Advance the simulated measurements to the current time."""
+        now = time.monotonic()
+        elapsed, self._updated = now - self._updated, now
+        state = self.state
+
+        if state[PROP_BOOST_REMAINING] > 0:
+            state[PROP_BOOST_REMAINING] = max(0, int(state[PROP_BOOST_REMAINING] - elapsed))
+        state[PROP_BOOST_STATE] = state[PROP_BOOST_REMAINING] > 0
+
+        charging = state[PROP_CHARGING_STATUS] == "CHARGING" and state[PROP_CHARGING_ENABLE]
+        if charging:
+            limit = state[PROP_BOOST_CURRENT] if state[PROP_BOOST_STATE] else state[PROP_TARGET_CURRENT]
+            limit = min(limit, state[PROP_MAXIMUM_CURRENT])
+            phases = 1 if state[PROP_SINGLE_PHASE] else 3
+            currents = [round(limit - self._rng.uniform(0, 0.4), 1) for _ in range(phases)]
+            currents += [0.0] * (3 - phases)
+        else:
+            currents = [0.0, 0.0, 0.0]
+
+        power = int(PHASE_VOLTAGE * sum(currents))
+        self._energy += power * elapsed / 3600
+        state[PROP_CHARGING_CURRENT] = currents[0]
+        state[PROP_CHARGING_CURRENT_L2] = currents[1]
+        state[PROP_CHARGING_CURRENT_L3] = currents[2]
+        state[PROP_CURRENT_CHARGING_POWER] = power
+        state[PROP_TOTAL_ENERGY] = int(self._energy)
+        state[PROP_SIGNAL] = max(0, min(100, state[PROP_SIGNAL] + self._rng.randint(-1, 1)))
+
+    def write(self, properties: dict[str, Any]) -> None:
+        """Apply written properties like the real charger would."""
+        self.evolve()
+        self.state.update(properties)
+        if PROP_BOOST_TIME in properties:
+            self.state[PROP_BOOST_REMAINING] = properties[PROP_BOOST_TIME]
+            self.state[PROP_BOOST_STATE] = properties[PROP_BOOST_TIME] > 0
+
+
+class MockIXcommandServer:
+    """aiohttp server imitating the iXcommand cloud API for N chargers.
+
+    Every third charger starts out charging. Faults are injected with
+    ``fail_next`` (HTTP status), ``timeout_next`` (hang past the client
+    timeout) and the ``latency`` attribute (seconds added to every request).
+    """
+
+    def __init__(
+        self,
+        chargers: int = 1,
+        *,
+        api_key: str = MOCK_API_KEY,
+        latency: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the server and its simulated chargers."""
+        self.api_key = api_key
+        self.latency = latency
+        self.hang_time = 3600.0
+        rng = random.Random(seed)
+        self.chargers = {
+            mock_serial(index): MockCharger(mock_serial(index), index % 3 == 0, rng)
+            for index in range(chargers)
+        }
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._faults: list[int | None] = []
+        self._server: TestServer | None = None
+
+    @property
+    def serials(self) -> list[str]:
+        """Return the serial numbers of all simulated chargers."""
+        return list(self.chargers)
+
+    @property
+    def base_url(self) -> str:
+        """Return the URL to pass as the client's base_url."""
+        assert self._server is not None
+        return str(self._server.make_url("/api/v1"))
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """Answer the next requests with an HTTP error status."""
+        self._faults.extend([status] * count)
+
+    def timeout_next(self, count: int = 1) -> None:
+        """Make the next requests hang until the client gives up."""
+        self._faults.extend([None] * count)
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        app = web.Application()
+        app.router.add_get("/api/v1/thing/{serial}/properties", self._handle_get)
+        app.router.add_patch("/api/v1/thing/{serial}/properties", self._handle_patch)
+        self._server = TestServer(app)
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    async def __aenter__(self) -> MockIXcommandServer:
+        """Start the server for an async with block."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server at the end of an async with block."""
+        await self.close()
+
+    async def _prepare(self, request: web.Request) -> MockCharger | web.Response:
+        """Apply latency, faults and authentication shared by every route.
+
+        Returns the addressed charger, or the error response to send instead.
+        """
+        self.requests[request.method] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._faults:
+            fault = self._faults.pop(0)
+            if fault is None:
+                await asyncio.sleep(self.hang_time)
+                fault = 504
+            return web.Response(status=fault, text=f"injected status {fault}")
+        if request.headers.get("X-API-KEY") != self.api_key:
+            return web.Response(status=401, text="invalid api key")
+        charger = self.chargers.get(request.match_info["serial"])
+        if charger is None:
+            return web.Response(status=404, text="unknown thing")
+        return charger
+
+    def _respond(self, payload: dict[str, Any]) -> web.Response:
+        """Return a JSON response and count its size."""
+        response = web.json_response(payload)
+        assert response.body is not None
+        self.bytes_sent += len(response.body)
+        return response
+
+    async def _handle_get(self, request: web.Request) -> web.Response:
+        """Return the requested properties of one charger."""
+        charger = await self._prepare(request)
+        if isinstance(charger, web.Response):
+            return charger
+        keys = request.query.getall("keys", ALL_READABLE_PROPERTIES)
+        charger.evolve()
+        return self._respond({key: charger.state[key] for key in keys if key in charger.state})
+
+    async def _handle_patch(self, request: web.Request) -> web.Response:
+        """Write properties to one charger."""
+        charger = await self._prepare(request)
+        if isinstance(charger, web.Response):
+            return charger
+        properties = await request.json()
+        invalid = set(properties) - set(WRITABLE_PROPERTIES)
+        if invalid:
+            return web.Response(status=400, text=f"read-only properties: {sorted(invalid)}")
+        charger.write(properties)
+        return self._respond({key: charger.state[key] for key in properties})
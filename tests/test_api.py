@@ -1,9 +1,13 @@
 """Tests for the iXcommand API client."""
 
+import asyncio
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+import aiohttp
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
@@ -11,16 +15,26 @@ if str(project_root) not in sys.path:
 
 # Import directly from the module - these tests don't need full HA mocking
 from custom_components.ixcommand.api import (
+    CircuitBreaker,
     IXcommandApiClient,
     IXcommandApiError,
     IXcommandApiAuthError,
+    IXcommandApiUnavailableError,
+    IXcommandConnectionError,
+    IXcommandServerError,
 )
 from custom_components.ixcommand.const import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
     PROP_CHARGING_ENABLE,
+    PROP_CHARGING_STATUS,
+    PROP_CURRENT_CHARGING_POWER,
     PROP_TARGET_CURRENT,
     PROP_SINGLE_PHASE,
     WRITABLE_PROPERTIES,
 )
+from tests.mock_server import MOCK_API_KEY, MockIXcommandServer
 
 
 class TestIXcommandApiExceptions:
@@ -82,6 +96,263 @@ class TestApiClientInit:
         assert headers["Content-Type"] == "application/json"
         assert "X-API-KEY" in headers
 
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_session_open(self):
+        """Test that closing a client does not close a borrowed session."""
+        session = MagicMock()
+        session.close = AsyncMock()
+        client = IXcommandApiClient("test_key", session)
+        await client.close()
+        session.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_own_session(self):
+        """Test that a client closes the session it created itself."""
+        client = IXcommandApiClient("test_key")
+        await client.close()
+        assert client._session.closed
+
+
+def _make_retrying_client(*outcomes) -> IXcommandApiClient:
+    """Create a client whose request attempts yield the given outcomes."""
+    client = IXcommandApiClient("test_key", MagicMock(), retry_backoff=0)
+    client.circuit_breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    client._make_single_request = AsyncMock(side_effect=list(outcomes))
+    return client
+
+
+class TestRetries:
+    """Test cases for request retries."""
+
+    @pytest.mark.asyncio
+    async def test_get_retried_after_transient_error(self):
+        """Test that a GET succeeds after a timeout and a 5xx."""
+        client = _make_retrying_client(
+            IXcommandConnectionError("timeout"), IXcommandServerError("502"), {"ok": 1}
+        )
+        assert await client._make_request("GET", "/thing/x/properties") == {"ok": 1}
+        assert client._make_single_request.await_count == 3
+        assert client.circuit_breaker.state == CIRCUIT_CLOSED
+
+    @pytest.mark.asyncio
+    async def test_patch_not_retried(self):
+        """Test that a non-idempotent PATCH is attempted only once."""
+        client = _make_retrying_client(IXcommandServerError("502"), {"ok": 1})
+        with pytest.raises(IXcommandServerError):
+            await client._make_request("PATCH", "/thing/x/properties", data={})
+        assert client._make_single_request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_auth_error_not_retried(self):
+        """Test that a 401 is raised immediately."""
+        client = _make_retrying_client(IXcommandApiAuthError("401"), {"ok": 1})
+        with pytest.raises(IXcommandApiAuthError):
+            await client._make_request("GET", "/thing/x/properties")
+        assert client._make_single_request.await_count == 1
+
+
+class TestCircuitBreaker:
+    """Test cases for the circuit breaker."""
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_CLOSED
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_OPEN
+        with pytest.raises(IXcommandApiUnavailableError):
+            breaker.before_request()
+
+    def test_half_open_probe_closes_on_success(self):
+        """Test that a single probe is allowed after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.before_request()
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        with pytest.raises(IXcommandApiUnavailableError):
+            breaker.before_request()
+        breaker.record_success()
+        assert breaker.state == CIRCUIT_CLOSED
+
+    def test_half_open_probe_reopens_on_failure(self):
+        """Test that a failed probe opens the circuit again."""
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0)
+        breaker.state = CIRCUIT_OPEN
+        breaker.opened_at = 0
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_OPEN
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_short_circuits_requests(self):
+        """Test that no request is sent while the circuit is open."""
+        client = _make_retrying_client(*([IXcommandConnectionError("down")] * 3))
+        with pytest.raises(IXcommandConnectionError):
+            await client._make_request("GET", "/thing/x/properties")
+        assert client.circuit_breaker.state == CIRCUIT_OPEN
+        with pytest.raises(IXcommandApiUnavailableError):
+            await client._make_request("GET", "/thing/x/properties")
+        assert client._make_single_request.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_releases_probe(self):
+        """Test that a probe failing with a non-API error lets the next one through."""
+        client = _make_retrying_client(ValueError("bad body"), {"ok": 1})
+        client.circuit_breaker.state = CIRCUIT_OPEN
+        client.circuit_breaker.opened_at = 0
+        with pytest.raises(ValueError):
+            await client._make_request("GET", "/thing/x/properties")
+        assert await client._make_request("GET", "/thing/x/properties") == {"ok": 1}
+        assert client.circuit_breaker.state == CIRCUIT_CLOSED
+
+
+def _make_slow_client() -> IXcommandApiClient:
+    """Create a client whose GETs echo the requested keys after a short delay."""
+    client = IXcommandApiClient("test_key", MagicMock())
+
+    async def fake_request(method, endpoint, data=None, params=None):
+        await asyncio.sleep(0.01)
+        return {key: f"{endpoint}:{key}" for _, key in params}
+
+    client._make_request = AsyncMock(side_effect=fake_request)
+    return client
+
+
+class TestSingleFlight:
+    """Test cases for collapsing concurrent property reads."""
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_share_one_request(self):
+        """Test that concurrent identical reads send a single GET."""
+        client = _make_slow_client()
+        first, second = await asyncio.gather(
+            client.get_properties("SN1", ["power", "status"]),
+            client.get_properties("SN1", ["power", "status"]),
+        )
+        assert first == second
+        assert client._make_request.await_count == 1
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_subset_served_from_superset_in_flight(self):
+        """Test that a read of fewer keys joins a larger read in flight."""
+        client = _make_slow_client()
+        full, subset = await asyncio.gather(
+            client.get_properties("SN1", ["power", "status", "signal"]),
+            client.get_properties("SN1", ["status"]),
+        )
+        assert subset == {"status": full["status"]}
+        assert client._make_request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_overlap_fetches_only_missing_keys(self):
+        """Test that a partially overlapping read only requests the rest."""
+        client = _make_slow_client()
+        _, result = await asyncio.gather(
+            client.get_properties("SN1", ["power", "status"]),
+            client.get_properties("SN1", ["status", "signal"]),
+        )
+        assert set(result) == {"status", "signal"}
+        assert client._make_request.await_count == 2
+        assert client._make_request.await_args.kwargs["params"] == [("keys", "signal")]
+
+    @pytest.mark.asyncio
+    async def test_different_chargers_not_shared(self):
+        """Test that reads of different chargers are sent separately."""
+        client = _make_slow_client()
+        await asyncio.gather(
+            client.get_properties("SN1", ["power"]),
+            client.get_properties("SN2", ["power"]),
+        )
+        assert client._make_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_delivered_to_every_reader(self):
+        """Test that a failed shared read raises in every caller."""
+        client = IXcommandApiClient("test_key", MagicMock())
+
+        async def failing_request(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            raise IXcommandConnectionError("down")
+
+        client._make_request = AsyncMock(side_effect=failing_request)
+        results = await asyncio.gather(
+            client.get_properties("SN1", ["power"]),
+            client.get_properties("SN1", ["power"]),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, IXcommandConnectionError) for result in results)
+        assert client._make_request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reader_does_not_cancel_shared_read(self):
+        """Test that other readers still get a result if one is cancelled."""
+        client = _make_slow_client()
+        first = asyncio.ensure_future(client.get_properties("SN1", ["power"]))
+        second = asyncio.ensure_future(client.get_properties("SN1", ["power"]))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == {"power": "/thing/SN1/properties:power"}
+
+
+class TestApiAgainstMockServer:
+    """Test cases running the client against the local mock cloud API."""
+
+    @pytest.mark.asyncio
+    async def test_get_properties_sends_repeated_keys(self):
+        """Test that only the requested keys are returned."""
+        async with MockIXcommandServer(chargers=2) as server, aiohttp.ClientSession() as session:
+            client = IXcommandApiClient(MOCK_API_KEY, session, base_url=server.base_url)
+            data = await client.get_properties(
+                server.serials[0], [PROP_CHARGING_STATUS, PROP_CURRENT_CHARGING_POWER]
+            )
+        assert set(data) == {PROP_CHARGING_STATUS, PROP_CURRENT_CHARGING_POWER}
+        assert data[PROP_CHARGING_STATUS] == "CHARGING"
+
+    @pytest.mark.asyncio
+    async def test_set_properties_patches_charger(self):
+        """Test that a PATCH changes the simulated charger."""
+        async with MockIXcommandServer() as server, aiohttp.ClientSession() as session:
+            client = IXcommandApiClient(MOCK_API_KEY, session, base_url=server.base_url)
+            serial = server.serials[0]
+            await client.set_properties(serial, {PROP_TARGET_CURRENT: 13})
+            data = await client.get_properties(serial, [PROP_TARGET_CURRENT])
+        assert data == {PROP_TARGET_CURRENT: 13}
+        assert server.requests == {"PATCH": 1, "GET": 1}
+
+    @pytest.mark.asyncio
+    async def test_invalid_key_raises_auth_error(self):
+        """Test that a 401 from the server raises IXcommandApiAuthError."""
+        async with MockIXcommandServer() as server, aiohttp.ClientSession() as session:
+            client = IXcommandApiClient("wrong-key", session, base_url=server.base_url)
+            with pytest.raises(IXcommandApiAuthError):
+                await client.get_properties(server.serials[0])
+        assert server.requests["GET"] == 1
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_retried(self):
+        """Test that an injected 503 is retried transparently."""
+        async with MockIXcommandServer() as server, aiohttp.ClientSession() as session:
+            client = IXcommandApiClient(
+                MOCK_API_KEY, session, base_url=server.base_url, retry_backoff=0
+            )
+            server.fail_next(503)
+            data = await client.get_properties(server.serials[0], [PROP_TARGET_CURRENT])
+        assert data == {PROP_TARGET_CURRENT: 10}
+        assert server.requests["GET"] == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_connection_error(self):
+        """Test that a hanging request raises IXcommandConnectionError."""
+        async with MockIXcommandServer() as server, aiohttp.ClientSession() as session:
+            client = IXcommandApiClient(
+                MOCK_API_KEY, session, base_url=server.base_url, timeout=0.1, max_retries=0
+            )
+            server.timeout_next()
+            with pytest.raises(IXcommandConnectionError):
+                await client.get_properties(server.serials[0])
+
 
 if __name__ == "__main__":
     import pytest
@@ -0,0 +1,64 @@
+"""Tests for the iXcommand options flow."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.ixcommand.config_flow import IXcommandOptionsFlow
+from custom_components.ixcommand.const import (
+    CONF_SITE_CURRENT_LIMIT,
+    CONF_SOLAR_EXPORT_SENSOR,
+    DOMAIN,
+)
+
+
+def _make_flow() -> IXcommandOptionsFlow:
+    """Create an options flow for an entry without options."""
+    entry = MagicMock()
+    entry.options = {}
+    flow = IXcommandOptionsFlow(entry)
+    flow.hass = MagicMock()
+    flow.handler = DOMAIN
+    flow.flow_id = "flow"
+    return flow
+
+
+class TestOptionsFlow:
+    """Test cases for validating the options."""
+
+    @pytest.mark.asyncio
+    async def test_solar_with_load_balancing_rejected(self):
+        """Test that a charger cannot be balanced and follow the surplus."""
+        result = await _make_flow().async_step_init(
+            {CONF_SITE_CURRENT_LIMIT: 32, CONF_SOLAR_EXPORT_SENSOR: "sensor.export"}
+        )
+        assert result["type"] == FlowResultType.FORM
+        assert result["errors"] == {"base": "solar_with_load_balancing"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "user_input",
+        [
+            {CONF_SITE_CURRENT_LIMIT: 32},
+            {CONF_SITE_CURRENT_LIMIT: 0, CONF_SOLAR_EXPORT_SENSOR: "sensor.export"},
+        ],
+    )
+    async def test_either_feature_accepted(self, user_input):
+        """Test that load balancing or solar charging alone is saved."""
+        result = await _make_flow().async_step_init(user_input)
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert result["data"] == user_input
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
@@ -74,6 +74,15 @@ class TestConstants:
         for prop in const.WRITABLE_PROPERTIES:
             assert prop in const.ALL_READABLE_PROPERTIES
 
+    def test_property_tiers_cover_all_readable_properties(self):
+        """Test that every readable property belongs to exactly one tier."""
+        tiered = [prop for props, _ in const.PROPERTY_TIERS for prop in props]
+        assert sorted(tiered) == sorted(const.ALL_READABLE_PROPERTIES)
+
+    def test_fast_tier_fetched_every_poll(self):
+        """Test that the first tier is refreshed on every poll."""
+        assert const.PROPERTY_TIERS[0] == (const.FAST_PROPERTIES, 0)
+
 
 if __name__ == "__main__":
     import pytest
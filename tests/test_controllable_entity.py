@@ -12,10 +12,19 @@ if str(project_root) not in sys.path:
 class TestControllableEntityLogic:
     """Test cases for controllable entity logic (without full HA mocking)."""
 
-    def test_control_update_delay_constant(self):
-        """Test that control update delay is defined."""
-        from custom_components.ixcommand.controllable_entity import CONTROL_UPDATE_DELAY
-        assert CONTROL_UPDATE_DELAY == 2
+    def test_write_coalesce_delay_constant(self):
+        """Test that the write debounce window is defined."""
+        from custom_components.ixcommand.controllable_entity import WRITE_COALESCE_DELAY
+        assert 0 < WRITE_COALESCE_DELAY < 1
+
+    def test_confirm_constants(self):
+        """Test that the read-back confirmation backoff is bounded by its deadline."""
+        from custom_components.ixcommand.const import (
+            CONFIRM_INITIAL_DELAY,
+            CONFIRM_MAX_DELAY,
+            CONFIRM_TIMEOUT,
+        )
+        assert 0 < CONFIRM_INITIAL_DELAY <= CONFIRM_MAX_DELAY < CONFIRM_TIMEOUT
 
     def test_property_key_constants(self):
         """Test property key constants are defined."""
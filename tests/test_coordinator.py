@@ -0,0 +1,414 @@
+"""Tests for the iXcommand data coordinator."""
+
+import asyncio
+import math
+import sys
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand import coordinator as coordinator_module
+from custom_components.ixcommand.api import IXcommandApiError, IXcommandWriteNotConfirmedError
+from custom_components.ixcommand.const import (
+    PROP_CURRENT_CHARGING_POWER,
+    PROP_MAXIMUM_CURRENT,
+    PROP_TARGET_CURRENT,
+    PROPERTY_TIERS,
+    SLOW_TIER_INTERVAL,
+    UPDATE_INTERVAL,
+)
+from custom_components.ixcommand.coordinator import IXcommandCoordinator
+from custom_components.ixcommand.hub import poll_phases
+from custom_components.ixcommand.models import ChargerState
+
+
+def _make_coordinator() -> IXcommandCoordinator:
+    """Create a coordinator without Home Assistant for pure logic tests."""
+    coordinator = IXcommandCoordinator.__new__(IXcommandCoordinator)
+    coordinator.active_interval = 10
+    coordinator.idle_interval = 120
+    coordinator.error_interval = 300
+    coordinator._consecutive_errors = 0
+    coordinator._tier_fetched = [-math.inf] * len(PROPERTY_TIERS)
+    coordinator._property_fetched = {}
+    coordinator.data = None
+    coordinator.data_is_stale = False
+    coordinator.auth_failed = False
+    coordinator.load_balanced = False
+    coordinator.poll_interval = UPDATE_INTERVAL
+    coordinator.poll_phase = 0.0
+    coordinator.next_poll = 0.0
+    return coordinator
+
+
+class TestAdaptivePolling:
+    """Test cases for the adaptive polling profiles."""
+
+    def test_initial_interval_without_data(self):
+        """Test that the default interval is used before the first poll."""
+        coordinator = _make_coordinator()
+        assert coordinator._compute_poll_interval(None) == UPDATE_INTERVAL
+
+    def test_charging_uses_active_profile(self):
+        """Test that a charging charger is polled fast."""
+        coordinator = _make_coordinator()
+        data = ChargerState(charging_status="CHARGING", boost_state=False)
+        assert coordinator._compute_poll_interval(data) == 10
+
+    def test_boost_uses_active_profile(self):
+        """Test that an active boost is polled fast."""
+        coordinator = _make_coordinator()
+        data = ChargerState(charging_status="CONNECTED", boost_state=True)
+        assert coordinator._compute_poll_interval(data) == 10
+
+    def test_idle_uses_idle_profile(self):
+        """Test that an idle charger is polled slowly."""
+        coordinator = _make_coordinator()
+        data = ChargerState(charging_status="IDLE", boost_state=False)
+        assert coordinator._compute_poll_interval(data) == 120
+
+    def test_load_balanced_idle_uses_active_profile(self):
+        """Test that a load balanced charger is polled fast even while idle."""
+        coordinator = _make_coordinator()
+        coordinator.load_balanced = True
+        data = ChargerState(charging_status="IDLE", boost_state=False)
+        assert coordinator._compute_poll_interval(data) == 10
+
+    def test_errors_back_off_exponentially(self):
+        """Test that every consecutive error doubles the interval."""
+        coordinator = _make_coordinator()
+        data = ChargerState(charging_status="CHARGING")
+        intervals = []
+        for errors in range(1, 7):
+            coordinator._consecutive_errors = errors
+            intervals.append(coordinator._compute_poll_interval(data))
+        assert intervals == [20, 40, 80, 160, 300, 300]
+
+    def test_long_outage_stays_at_error_interval(self):
+        """Test that the backoff is capped during very long outages."""
+        coordinator = _make_coordinator()
+        coordinator._consecutive_errors = 10_000
+        assert coordinator._compute_poll_interval(ChargerState(charging_status="IDLE")) == 300
+
+    def test_success_returns_to_normal_profile(self):
+        """Test that the first success drops the backoff."""
+        coordinator = _make_coordinator()
+        coordinator._consecutive_errors = 0
+        assert coordinator._compute_poll_interval(ChargerState(charging_status="CHARGING")) == 10
+
+
+class TestStaggeredPolling:
+    """Test cases for spreading polls over the interval."""
+
+    def test_phases_evenly_spaced(self):
+        """Test that chargers get evenly spaced phases in a stable order."""
+        serials = [f"ABC-123-{index:03d}" for index in range(4)]
+        phases = poll_phases(serials)
+        gaps = sorted((phase - min(phases.values())) % 1 for phase in phases.values())
+        assert gaps == pytest.approx([0, 0.25, 0.5, 0.75])
+        assert poll_phases(list(reversed(serials))) == phases
+
+    def test_single_charger_uses_hashed_offset(self):
+        """Test that the phase of a lone charger is derived from its serial."""
+        first = poll_phases(["ABC-123-DEF"])["ABC-123-DEF"]
+        second = poll_phases(["GHI-456-JKL"])["GHI-456-JKL"]
+        assert 0 <= first < 1
+        assert first != second
+
+    def test_reschedule_lands_on_phase_slot(self):
+        """Test that the next poll keeps the charger's slot despite latency."""
+        coordinator = _make_coordinator()
+        coordinator.hass = MagicMock()
+        coordinator.hass.loop.time.return_value = 1001.5
+        coordinator.poll_phase = 0.5
+        coordinator._reschedule(ChargerState(charging_status="CHARGING"))
+        assert coordinator.poll_interval == 10
+        assert coordinator.next_poll == 1015
+
+    def test_set_poll_phase_moves_scheduled_poll(self):
+        """Test that a rebalance moves the next poll to the nearest new slot."""
+        coordinator = _make_coordinator()
+        coordinator.hass = MagicMock()
+        coordinator.hass.loop.time.return_value = 1000
+        coordinator.next_poll = 1020
+        coordinator.set_poll_phase(0.2)
+        assert coordinator.next_poll == 1026
+
+    def test_set_poll_phase_schedules_first_poll(self):
+        """Test that a never polled charger waits for its slot."""
+        coordinator = _make_coordinator()
+        coordinator.hass = MagicMock()
+        coordinator.hass.loop.time.return_value = 1000
+        coordinator.set_poll_phase(0.5)
+        assert coordinator.next_poll == 1005
+
+    def test_refresh_in_flight_not_moved(self):
+        """Test that a charger being refreshed is left to reschedule itself."""
+        coordinator = _make_coordinator()
+        coordinator.hass = MagicMock()
+        coordinator.next_poll = math.inf
+        coordinator.set_poll_phase(0.5)
+        assert coordinator.next_poll == math.inf
+
+
+class TestTieredPolling:
+    """Test cases for tiered property polling."""
+
+    def test_first_poll_fetches_every_tier(self):
+        """Test that all tiers are fetched before there is a snapshot."""
+        coordinator = _make_coordinator()
+        assert coordinator._tiers_due(0.0) == [0, 1, 2]
+
+    def test_fast_tier_only_between_slow_refreshes(self):
+        """Test that only the fast tier is fetched until slower tiers expire."""
+        coordinator = _make_coordinator()
+        coordinator.data = ChargerState(charging_status="IDLE")
+        coordinator._tier_fetched = [100.0, 100.0, 100.0]
+        assert coordinator._tiers_due(130.0) == [0]
+
+    def test_slow_tier_due_after_its_interval(self):
+        """Test that a slower tier is fetched once its cadence elapsed."""
+        coordinator = _make_coordinator()
+        coordinator.data = ChargerState(charging_status="IDLE")
+        coordinator._tier_fetched = [100.0, 100.0, 100.0]
+        assert coordinator._tiers_due(100.0 + SLOW_TIER_INTERVAL) == [0, 1]
+
+    def test_property_age_follows_its_own_fetch(self):
+        """Test that slow properties age between their fetches while fast ones stay fresh."""
+        coordinator = _make_coordinator()
+        coordinator.hass = MagicMock()
+        coordinator.hass.loop.time.return_value = 350.0
+        coordinator.data = ChargerState(target_current=10, current_charging_power=7000)
+        coordinator._property_fetched = {PROP_CURRENT_CHARGING_POWER: 340.0, PROP_TARGET_CURRENT: 100.0}
+        assert coordinator.property_age(PROP_CURRENT_CHARGING_POWER) == 10.0
+        assert coordinator.property_age(PROP_TARGET_CURRENT) == 250.0
+        assert coordinator.property_age(PROP_MAXIMUM_CURRENT) is None
+
+    def test_stale_data_has_no_age(self):
+        """Test that properties served from a stale snapshot have no age."""
+        coordinator = _make_coordinator()
+        coordinator.hass = MagicMock()
+        coordinator.hass.loop.time.return_value = 350.0
+        coordinator.data = ChargerState(target_current=10)
+        coordinator.data_is_stale = True
+        coordinator._property_fetched = {PROP_TARGET_CURRENT: 340.0}
+        assert coordinator.property_age(PROP_TARGET_CURRENT) is None
+
+
+class TestWriteConfirmation:
+    """Test cases for read-back confirmation of writes."""
+
+    @pytest.fixture(autouse=True)
+    def fast_backoff(self, monkeypatch):
+        """Shrink the confirmation timings so tests run quickly."""
+        monkeypatch.setattr(coordinator_module, "CONFIRM_INITIAL_DELAY", 0.001)
+        monkeypatch.setattr(coordinator_module, "CONFIRM_MAX_DELAY", 0.004)
+        monkeypatch.setattr(coordinator_module, "CONFIRM_TIMEOUT", 0.05)
+
+    def _make_confirming_coordinator(self, *results: dict) -> IXcommandCoordinator:
+        """Create a coordinator whose read-backs return the given results."""
+        coordinator = _make_coordinator()
+        coordinator.hass = MagicMock()
+        coordinator.hass.loop = asyncio.get_running_loop()
+        coordinator.hub = MagicMock()
+        coordinator.hub.semaphore = asyncio.Semaphore(1)
+        coordinator.serial_number = "ABC-123-DEF"
+        coordinator.api_client = MagicMock()
+        coordinator.api_client.get_properties = AsyncMock(side_effect=list(results))
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_reads_back_only_written_keys(self):
+        """Test that confirmation stops at the first matching read-back."""
+        coordinator = self._make_confirming_coordinator(
+            {PROP_TARGET_CURRENT: 8}, {PROP_TARGET_CURRENT: 10}
+        )
+        await coordinator.async_confirm_properties({PROP_TARGET_CURRENT: 10})
+        assert coordinator.api_client.get_properties.await_count == 2
+        coordinator.api_client.get_properties.assert_awaited_with(
+            "ABC-123-DEF", [PROP_TARGET_CURRENT]
+        )
+        assert PROP_TARGET_CURRENT in coordinator._property_fetched
+
+    @pytest.mark.asyncio
+    async def test_mismatch_after_deadline_raises(self):
+        """Test that a value never reported back raises a distinct error."""
+        coordinator = self._make_confirming_coordinator(
+            *([{PROP_TARGET_CURRENT: 8}] * 50)
+        )
+        with pytest.raises(IXcommandWriteNotConfirmedError):
+            await coordinator.async_confirm_properties({PROP_TARGET_CURRENT: 10})
+
+
+class TestChangeDetection:
+    """Test cases for per-property listener notifications."""
+
+    def _make_listening_coordinator(self) -> IXcommandCoordinator:
+        """Create a coordinator with a mocked Home Assistant instance."""
+        entry = MagicMock()
+        entry.data = {"serial_number": "ABC-123-DEF"}
+        entry.options = {}
+        return IXcommandCoordinator(MagicMock(), entry, MagicMock())
+
+    def test_only_changed_keys_are_notified(self):
+        """Test that listeners of unchanged properties are not called."""
+        coordinator = self._make_listening_coordinator()
+        power, target, status = MagicMock(), MagicMock(), MagicMock()
+        coordinator.async_add_listener(power, frozenset({PROP_CURRENT_CHARGING_POWER}))
+        coordinator.async_add_listener(
+            target, frozenset({PROP_TARGET_CURRENT, PROP_MAXIMUM_CURRENT})
+        )
+        coordinator.async_add_listener(status)
+
+        data = ChargerState.from_properties(
+            {PROP_CURRENT_CHARGING_POWER: 0, PROP_TARGET_CURRENT: 10, PROP_MAXIMUM_CURRENT: 16}
+        )
+        coordinator.async_set_updated_data(data)
+        assert (power.call_count, target.call_count, status.call_count) == (1, 1, 1)
+
+        coordinator.async_set_updated_data(data.merge({PROP_MAXIMUM_CURRENT: 13}))
+        assert (power.call_count, target.call_count, status.call_count) == (1, 2, 2)
+
+    def test_availability_change_notifies_everyone(self):
+        """Test that all listeners are notified when availability flips."""
+        coordinator = self._make_listening_coordinator()
+        power = MagicMock()
+        coordinator.async_add_listener(power, frozenset({PROP_CURRENT_CHARGING_POWER}))
+        coordinator.async_set_updated_data(ChargerState(current_charging_power=0))
+        coordinator.async_set_update_error(Exception("down"))
+        assert power.call_count == 2
+
+    def test_removed_listener_not_notified(self):
+        """Test that removing a listener also drops it from the key index."""
+        coordinator = self._make_listening_coordinator()
+        power = MagicMock()
+        remove = coordinator.async_add_listener(
+            power, frozenset({PROP_CURRENT_CHARGING_POWER})
+        )
+        coordinator.async_set_updated_data(ChargerState(current_charging_power=0))
+        remove()
+        coordinator.async_set_updated_data(ChargerState(current_charging_power=5))
+        assert power.call_count == 1
+
+
+class TestStaleData:
+    """Test cases for serving the last snapshot while polls fail."""
+
+    def _make_failing_coordinator(self, age: float, grace: int = 900) -> IXcommandCoordinator:
+        """Create a coordinator whose last success was ``age`` seconds ago."""
+        entry = MagicMock()
+        entry.data = {"serial_number": "ABC-123-DEF"}
+        entry.options = {"stale_grace_period": grace}
+        hub = MagicMock()
+        hub.semaphore = asyncio.Semaphore(1)
+        hub.api_client.get_properties = AsyncMock(side_effect=IXcommandApiError("down"))
+        hass = MagicMock()
+        hass.loop.time.return_value = 1000.0
+        coordinator = IXcommandCoordinator(hass, entry, hub)
+        coordinator.async_set_updated_data(ChargerState(target_current=10))
+        coordinator.last_successful_update = dt_util.utcnow() - timedelta(seconds=age)
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_snapshot_within_grace_period(self):
+        """Test that a failure within the grace period keeps the data."""
+        coordinator = self._make_failing_coordinator(age=60)
+        listener = MagicMock()
+        coordinator.async_add_listener(listener, frozenset({PROP_TARGET_CURRENT}))
+        assert await coordinator._async_update_data() == ChargerState(target_current=10)
+        assert coordinator.data_is_stale
+        assert listener.call_count == 1
+        assert coordinator.poll_interval == coordinator.idle_interval * 2
+
+    @pytest.mark.asyncio
+    async def test_unavailable_after_grace_period(self):
+        """Test that failures past the grace period raise."""
+        coordinator = self._make_failing_coordinator(age=1000)
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    @pytest.mark.asyncio
+    async def test_success_clears_stale_flag(self):
+        """Test that the first success records its time and clears staleness."""
+        coordinator = self._make_failing_coordinator(age=60)
+        await coordinator._async_update_data()
+        coordinator._store = MagicMock()
+        coordinator.api_client.get_properties = AsyncMock(return_value={PROP_TARGET_CURRENT: 10})
+        await coordinator._async_update_data()
+        assert not coordinator.data_is_stale
+        assert (dt_util.utcnow() - coordinator.last_successful_update).total_seconds() < 5
+        assert coordinator.poll_interval == coordinator.idle_interval
+
+
+class TestWarmStart:
+    """Test cases for restoring the persisted snapshot."""
+
+    def _make_restoring_coordinator(self, stored: dict | None) -> IXcommandCoordinator:
+        """Create a coordinator whose store returns the given content."""
+        entry = MagicMock()
+        entry.data = {"serial_number": "ABC-123-DEF"}
+        entry.options = {}
+        coordinator = IXcommandCoordinator(MagicMock(), entry, MagicMock())
+        coordinator._store = MagicMock()
+        coordinator._store.async_load = AsyncMock(return_value=stored)
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_restores_stored_snapshot_as_stale(self):
+        """Test that a stored snapshot is published and flagged stale."""
+        coordinator = self._make_restoring_coordinator(
+            {"saved_at": "2026-01-01T00:00:00+00:00", "data": {PROP_TARGET_CURRENT: 12}}
+        )
+        assert await coordinator.async_restore_snapshot()
+        assert coordinator.data == ChargerState(target_current=12)
+        assert coordinator.last_successful_update is None
+        assert coordinator.data_is_stale
+        assert coordinator.last_update_success
+
+    @pytest.mark.asyncio
+    async def test_restores_last_successful_update(self):
+        """Test that the time of the last successful poll survives a restart."""
+        coordinator = self._make_restoring_coordinator(
+            {
+                "saved_at": "2026-01-01T00:01:00+00:00",
+                "updated_at": "2026-01-01T00:00:00+00:00",
+                "data": {PROP_TARGET_CURRENT: 12},
+            }
+        )
+        await coordinator.async_restore_snapshot()
+        assert coordinator.last_successful_update == dt_util.parse_datetime("2026-01-01T00:00:00+00:00")
+
+    @pytest.mark.asyncio
+    async def test_load_balancer_pause_persisted(self):
+        """Test that a pause by the load balancer is saved and restored."""
+        coordinator = self._make_restoring_coordinator(None)
+        coordinator.async_set_updated_data(ChargerState(target_current=12))
+        coordinator.async_set_load_balancer_paused(True)
+        save = coordinator._store.async_delay_save.call_args.args[0]
+        stored = save()
+        assert stored["load_balancer_paused"] is True
+
+        restored = self._make_restoring_coordinator(stored)
+        assert await restored.async_restore_snapshot()
+        assert restored.load_balancer_paused
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_restore(self):
+        """Test that setup falls back to a blocking refresh without a snapshot."""
+        coordinator = self._make_restoring_coordinator(None)
+        assert not await coordinator.async_restore_snapshot()
+        assert coordinator.data is None
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,346 @@
+"""Tests for the iXcommand base entity."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand import sensor as sensor_module
+from custom_components.ixcommand.api import CircuitBreaker
+from custom_components.ixcommand.const import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_OPEN,
+    CONF_CURRENT_DEADBAND,
+    CONF_CURRENT_MIN_INTERVAL,
+    CONF_SERIAL_NUMBER,
+    PROP_CHARGING_CURRENT,
+)
+from custom_components.ixcommand.coordinator import IXcommandCoordinator
+from custom_components.ixcommand.metrics import ApiMetrics
+from custom_components.ixcommand.models import ChargerState
+from custom_components.ixcommand.number import IXcommandTargetCurrentNumber
+from custom_components.ixcommand.sensor import (
+    IXcommandApiErrorsSensor,
+    IXcommandApiLatencySensor,
+    IXcommandApiStatusSensor,
+    IXcommandCurrentSensor,
+    IXcommandDurationSensor,
+    IXcommandEnergySensor,
+    IXcommandLastUpdateSensor,
+    IXcommandPowerSensor,
+)
+
+
+def _make_entry() -> MagicMock:
+    """Create a minimal config entry."""
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {CONF_SERIAL_NUMBER: "ABC-123-DEF"}
+    entry.options = {}
+    return entry
+
+
+class TestPrecomputedValues:
+    """Test cases for values computed once per coordinator update."""
+
+    def test_state_written_only_when_value_changes(self):
+        """Test that an update leaving the value unchanged skips the write."""
+        entry = _make_entry()
+        coordinator = IXcommandCoordinator(MagicMock(), entry, MagicMock())
+        sensor = IXcommandPowerSensor(coordinator, entry, "power", "Power")
+        sensor.async_write_ha_state = MagicMock()
+
+        coordinator.data = ChargerState(current_charging_power=2300, signal=80)
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 2300
+
+        coordinator.data = coordinator.data.merge({"signal": 70})
+        sensor._handle_coordinator_update()
+        coordinator.data = coordinator.data.merge({"currentChargingPower": 0})
+        sensor._handle_coordinator_update()
+        assert sensor.native_value == 0
+        assert sensor.async_write_ha_state.call_count == 2
+
+    def test_availability_change_is_written(self):
+        """Test that losing availability writes the state even without new values."""
+        entry = _make_entry()
+        coordinator = IXcommandCoordinator(MagicMock(), entry, MagicMock())
+        sensor = IXcommandPowerSensor(coordinator, entry, "power", "Power")
+        sensor.async_write_ha_state = MagicMock()
+
+        coordinator.data = ChargerState(current_charging_power=2300)
+        sensor._handle_coordinator_update()
+        coordinator.last_update_success = False
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 2
+
+    def test_stale_flip_not_written(self):
+        """Test that entering stale mode with the same value skips the write."""
+        entry = _make_entry()
+        coordinator = IXcommandCoordinator(MagicMock(), entry, MagicMock())
+        sensor = IXcommandPowerSensor(coordinator, entry, "power", "Power")
+        sensor.async_write_ha_state = MagicMock()
+
+        coordinator.data = ChargerState(current_charging_power=2300)
+        sensor._handle_coordinator_update()
+        coordinator.data_is_stale = True
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 1
+
+    def test_number_max_follows_maximum_current(self):
+        """Test that the slider limit is recomputed with the value."""
+        entry = _make_entry()
+        coordinator = IXcommandCoordinator(MagicMock(), entry, MagicMock())
+        number = IXcommandTargetCurrentNumber(
+            coordinator, entry, MagicMock(), "target_current", "Target Current"
+        )
+        number.async_write_ha_state = MagicMock()
+
+        coordinator.data = ChargerState(target_current=10, maximum_current=16)
+        number._handle_coordinator_update()
+        coordinator.data = coordinator.data.merge({"maximumCurrent": 13})
+        number._handle_coordinator_update()
+        assert (number.native_value, number.native_max_value) == (10, 13.0)
+        assert number.async_write_ha_state.call_count == 2
+
+
+class TestSensorFilters:
+    """Test cases for deadband and minimum interval state write filters."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the monotonic clock used by the filters."""
+        clock = MagicMock()
+        clock.monotonic.return_value = 1000.0
+        monkeypatch.setattr(sensor_module, "time", clock)
+        return clock
+
+    def _make_current_sensor(self, **options) -> IXcommandCurrentSensor:
+        """Create an L1 current sensor with the given filter options."""
+        entry = _make_entry()
+        entry.options = options
+        coordinator = IXcommandCoordinator(MagicMock(), entry, MagicMock())
+        sensor = IXcommandCurrentSensor(
+            coordinator, entry, "charging_current_l1", "L1", PROP_CHARGING_CURRENT
+        )
+        sensor.async_write_ha_state = MagicMock()
+        return sensor
+
+    def _publish(self, sensor: IXcommandCurrentSensor, **values) -> None:
+        """Publish a snapshot to the sensor."""
+        coordinator = sensor.coordinator
+        coordinator.data = (coordinator.data or ChargerState()).merge(values)
+        sensor._handle_coordinator_update()
+
+    def test_jitter_within_deadband_suppressed(self, clock):
+        """Test that small changes are not written until they add up."""
+        sensor = self._make_current_sensor(**{CONF_CURRENT_DEADBAND: 0.3})
+        self._publish(sensor, chargingStatus="CHARGING", chargingCurrent=10.0)
+        self._publish(sensor, chargingCurrent=10.1)
+        self._publish(sensor, chargingCurrent=9.9)
+        assert sensor.async_write_ha_state.call_count == 1
+        self._publish(sensor, chargingCurrent=10.4)
+        assert sensor.async_write_ha_state.call_count == 2
+
+    def test_suppressed_value_not_shown(self, clock):
+        """Test that a change held back by the deadband stays off the shown state."""
+        sensor = self._make_current_sensor(**{CONF_CURRENT_DEADBAND: 0.3})
+        self._publish(sensor, chargingStatus="CHARGING", chargingCurrent=10.0)
+        self._publish(sensor, chargingCurrent=10.1)
+        assert sensor.native_value == 10.0
+        assert sensor._written_state == (True, 10.0)
+
+    def test_status_transition_always_written(self, clock):
+        """Test that a value arriving with a status change bypasses the deadband."""
+        sensor = self._make_current_sensor(**{CONF_CURRENT_DEADBAND: 1.0})
+        self._publish(sensor, chargingStatus="CHARGING", chargingCurrent=0.3)
+        self._publish(sensor, chargingStatus="CONNECTED", chargingCurrent=0.0)
+        assert sensor.async_write_ha_state.call_count == 2
+        assert sensor.native_value == 0.0
+
+    def test_first_value_after_unavailable_written(self, clock):
+        """Test that recovering from unavailable writes the current value."""
+        sensor = self._make_current_sensor(**{CONF_CURRENT_DEADBAND: 1.0})
+        self._publish(sensor, chargingStatus="CHARGING", chargingCurrent=10.0)
+        sensor.coordinator.last_update_success = False
+        sensor._handle_coordinator_update()
+        sensor.coordinator.last_update_success = True
+        self._publish(sensor, chargingCurrent=10.1)
+        assert sensor.async_write_ha_state.call_count == 3
+
+    def test_min_interval_delays_write(self, clock, monkeypatch):
+        """Test that a change inside the minimum interval is written when it ends."""
+        call_later = MagicMock()
+        monkeypatch.setattr(sensor_module, "async_call_later", call_later)
+        sensor = self._make_current_sensor(
+            **{CONF_CURRENT_DEADBAND: 0, CONF_CURRENT_MIN_INTERVAL: 60}
+        )
+        sensor.hass = MagicMock()
+        self._publish(sensor, chargingStatus="CHARGING", chargingCurrent=10.0)
+        clock.monotonic.return_value = 1020.0
+        self._publish(sensor, chargingCurrent=12.0)
+        assert sensor.async_write_ha_state.call_count == 1
+        assert call_later.call_args.args[1] == 40
+
+        clock.monotonic.return_value = 1060.0
+        sensor._async_flush(None)
+        assert sensor.async_write_ha_state.call_count == 2
+        assert sensor.native_value == 12.0
+
+
+class TestInterpolatedSensors:
+    """Test cases for values estimated between polls."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the monotonic clock used by the estimates."""
+        clock = MagicMock()
+        clock.monotonic.return_value = 1000.0
+        monkeypatch.setattr(sensor_module, "time", clock)
+        return clock
+
+    def _make_sensor(self, sensor_class):
+        """Create a sensor with a timer-less Home Assistant mock."""
+        entry = _make_entry()
+        coordinator = IXcommandCoordinator(MagicMock(), entry, MagicMock())
+        coordinator.poll_interval = 30
+        sensor = sensor_class(coordinator, entry, "sensor", "Sensor")
+        sensor.async_write_ha_state = MagicMock()
+        return sensor
+
+    def _publish(self, sensor, **values) -> None:
+        """Publish a snapshot to the sensor."""
+        coordinator = sensor.coordinator
+        coordinator.data = (coordinator.data or ChargerState()).merge(values)
+        sensor._handle_coordinator_update()
+
+    def test_boost_counts_down_between_polls(self, clock):
+        """Test that the boost countdown ticks every second and resyncs on polls."""
+        sensor = self._make_sensor(IXcommandDurationSensor)
+        self._publish(sensor, boostState=True, boostRemaining=600)
+        clock.monotonic.return_value = 1005.4
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == 595
+        self._publish(sensor, boostRemaining=597)
+        assert sensor.native_value == 597
+        assert sensor.async_write_ha_state.call_count == 3
+
+    def test_boost_holds_without_boost(self, clock):
+        """Test that the remaining time does not move when no boost runs."""
+        sensor = self._make_sensor(IXcommandDurationSensor)
+        self._publish(sensor, boostState=False, boostRemaining=600)
+        clock.monotonic.return_value = 1010.0
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == 600
+        assert not sensor._is_moving()
+
+    def test_energy_extrapolated_from_power(self, clock):
+        """Test that energy grows with the charging power in whole steps."""
+        sensor = self._make_sensor(IXcommandEnergySensor)
+        self._publish(sensor, totalEnergy=1000.0, currentChargingPower=7200.0)
+        clock.monotonic.return_value = 1012.0
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == 1020.0
+        clock.monotonic.return_value = 1100.0
+        sensor._async_handle_tick(None)
+        # Capped at one poll interval past the reading
+        assert sensor.native_value == 1060.0
+
+    def test_energy_never_decreases_on_resync(self, clock):
+        """Test that a poll below the extrapolated value holds the shown value."""
+        sensor = self._make_sensor(IXcommandEnergySensor)
+        self._publish(sensor, totalEnergy=1000.0, currentChargingPower=7200.0)
+        clock.monotonic.return_value = 1020.0
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == 1040.0
+        self._publish(sensor, totalEnergy=1030.0, currentChargingPower=0.0)
+        assert sensor.native_value == 1040.0
+        self._publish(sensor, totalEnergy=1050.0)
+        assert sensor.native_value == 1050.0
+
+    def test_energy_counter_reset_passed_through(self, clock):
+        """Test that a decrease of the charger's counter is shown."""
+        sensor = self._make_sensor(IXcommandEnergySensor)
+        self._publish(sensor, totalEnergy=1000.0, currentChargingPower=0.0)
+        self._publish(sensor, totalEnergy=5.0)
+        assert sensor.native_value == 5.0
+
+    def test_stale_data_holds_estimate(self, clock):
+        """Test that estimates stop while the coordinator serves stale data."""
+        sensor = self._make_sensor(IXcommandDurationSensor)
+        self._publish(sensor, boostState=True, boostRemaining=600)
+        sensor.coordinator.data_is_stale = True
+        clock.monotonic.return_value = 1010.0
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == 600
+
+
+class TestApiDiagnosticSensors:
+    """Test cases for the sensors reporting on the API client."""
+
+    def _make_sensor(self, sensor_class):
+        """Create a metric sensor for a coordinator whose client has metrics."""
+        entry = _make_entry()
+        coordinator = IXcommandCoordinator(MagicMock(), entry, MagicMock())
+        coordinator.api_client.metrics = ApiMetrics()
+        sensor = sensor_class(coordinator, entry, "metric", "Metric")
+        sensor.async_write_ha_state = MagicMock()
+        return sensor
+
+    def test_charger_value_with_api_key_totals(self):
+        """Test that the value is the charger's and the attributes the API key's."""
+        sensor = self._make_sensor(IXcommandApiErrorsSensor)
+        metrics = sensor.coordinator.api_client.metrics
+        metrics.record("GET", "/thing/ABC-123-DEF/properties", 0.1, 0, "timeout")
+        metrics.record("GET", "/thing/OTHER/properties", 0.1, 0, "http_503")
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == 1
+        assert sensor.extra_state_attributes["api_key_errors"] == 2
+        assert sensor.extra_state_attributes["errors_by_type"] == {"timeout": 1}
+
+    def test_written_only_when_metrics_change(self):
+        """Test that ticks without new requests do not write the state."""
+        sensor = self._make_sensor(IXcommandApiLatencySensor)
+        metrics = sensor.coordinator.api_client.metrics
+        metrics.record("GET", "/thing/ABC-123-DEF/properties", 0.25, 0)
+        sensor._async_handle_tick(None)
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == 250
+        assert sensor.async_write_ha_state.call_count == 1
+        assert sensor.entity_registry_enabled_default is False
+
+    def test_api_status_follows_breaker_without_coordinator_update(self):
+        """Test that the breaker state is shown even when no poll notifies."""
+        sensor = self._make_sensor(IXcommandApiStatusSensor)
+        sensor.coordinator.api_client.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == CIRCUIT_CLOSED
+        sensor.coordinator.api_client.circuit_breaker.record_failure()
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == CIRCUIT_OPEN
+        assert sensor.extra_state_attributes["consecutive_failures"] == 1
+
+    def test_last_update_follows_polls_without_value_changes(self):
+        """Test that the last successful poll is shown even when no value changed."""
+        sensor = self._make_sensor(IXcommandLastUpdateSensor)
+        sensor.coordinator.data = ChargerState(current_charging_power=2300)
+        sensor._async_handle_tick(None)
+        assert sensor.native_value is None
+        updated = dt_util.parse_datetime("2026-01-01T00:00:00+00:00")
+        sensor.coordinator.last_successful_update = updated
+        sensor._async_handle_tick(None)
+        assert sensor.native_value == updated
+        assert sensor.async_write_ha_state.call_count == 2
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
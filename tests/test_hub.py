@@ -0,0 +1,205 @@
+"""Tests for the iXcommand fleet hub scheduler."""
+
+import asyncio
+import math
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand import hub as hub_module
+from custom_components.ixcommand.const import (
+    DATA_HUBS,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS,
+    PROP_TARGET_CURRENT,
+)
+from custom_components.ixcommand.coordinator import IXcommandCoordinator
+from custom_components.ixcommand.hub import IXcommandHub, async_release_hub, poll_phases
+
+
+def _make_hub() -> IXcommandHub:
+    """Create a hub over a mocked Home Assistant and API client."""
+    hass = MagicMock()
+    hass.loop.time.return_value = 100.0
+    api_client = MagicMock()
+    api_client.close = AsyncMock()
+    return IXcommandHub(hass, api_client)
+
+
+def _make_member(serial: str, next_poll: float = 0.0) -> MagicMock:
+    """Create a registered coordinator stand-in due at ``next_poll``."""
+    coordinator = MagicMock()
+    coordinator.serial_number = serial
+    coordinator.next_poll = next_poll
+    return coordinator
+
+
+class TestHubTimer:
+    """Test cases for starting and stopping the shared poll timer."""
+
+    @pytest.fixture(autouse=True)
+    def track_interval(self, monkeypatch):
+        """Replace the time interval tracker with a mock."""
+        self.unsub = MagicMock()
+        self.track = MagicMock(return_value=self.unsub)
+        monkeypatch.setattr(hub_module, "async_track_time_interval", self.track)
+
+    def test_timer_started_once(self):
+        """Test that the first charger starts the timer and later ones reuse it."""
+        hub = _make_hub()
+        hub.async_add_coordinator(_make_member("A"))
+        hub.async_add_coordinator(_make_member("B"))
+        assert self.track.call_count == 1
+        assert set(hub.coordinators) == {"A", "B"}
+
+    def test_timer_stopped_with_last_charger(self):
+        """Test that the timer runs until the last charger leaves."""
+        hub = _make_hub()
+        first, second = _make_member("A"), _make_member("B")
+        hub.async_add_coordinator(first)
+        hub.async_add_coordinator(second)
+        hub.async_remove_coordinator(first)
+        self.unsub.assert_not_called()
+        hub.async_remove_coordinator(second)
+        self.unsub.assert_called_once()
+
+        hub.async_add_coordinator(first)
+        assert self.track.call_count == 2
+
+    def test_members_get_poll_phases(self):
+        """Test that registering and leaving rebalance the poll phases."""
+        hub = _make_hub()
+        first, second = _make_member("A"), _make_member("B")
+        hub.async_add_coordinator(first)
+        hub.async_add_coordinator(second)
+        spacing = first.set_poll_phase.call_args.args[0] - second.set_poll_phase.call_args.args[0]
+        assert abs(spacing) == pytest.approx(0.5)
+
+        hub.async_remove_coordinator(first)
+        second.set_poll_phase.assert_called_with(poll_phases(["B"])["B"])
+
+
+class TestHubTick:
+    """Test cases for picking the chargers due on a tick."""
+
+    def _tick(self, hub: IXcommandHub) -> list:
+        """Run one tick and return the chargers handed to the poll task."""
+        polled = []
+
+        async def _poll(coordinators):
+            polled.extend(coordinators)
+
+        hub.async_poll = _poll
+        hub._async_handle_tick(MagicMock())
+        if not hub.hass.async_create_background_task.called:
+            return []
+        coroutine = hub.hass.async_create_background_task.call_args.args[0]
+        with pytest.raises(StopIteration):
+            coroutine.send(None)
+        return polled
+
+    def test_only_due_chargers_polled(self):
+        """Test that chargers scheduled after now are left for later ticks."""
+        hub = _make_hub()
+        due, early, later = _make_member("A", 99.0), _make_member("B", 100.0), _make_member("C", 101.0)
+        hub._coordinators = {"A": due, "B": early, "C": later}
+        assert self._tick(hub) == [due, early]
+        assert due.next_poll == math.inf
+        assert early.next_poll == math.inf
+        assert later.next_poll == 101.0
+
+    def test_refreshing_charger_not_polled_again(self):
+        """Test that a charger is not picked again before its refresh reschedules it."""
+        hub = _make_hub()
+        hub._coordinators = {"A": _make_member("A", 50.0)}
+        assert len(self._tick(hub)) == 1
+        hub.hass.async_create_background_task.reset_mock()
+        assert self._tick(hub) == []
+
+    def test_no_task_without_due_chargers(self):
+        """Test that an idle tick does not start a task."""
+        hub = _make_hub()
+        hub._coordinators = {"A": _make_member("A", 200.0)}
+        assert self._tick(hub) == []
+        hub.hass.async_create_background_task.assert_not_called()
+
+
+class TestHubPoll:
+    """Test cases for polling the fleet."""
+
+    @pytest.mark.asyncio
+    async def test_requests_in_flight_are_bounded(self):
+        """Test that the hub semaphore caps concurrent property requests."""
+        hub = _make_hub()
+        in_flight = peak = 0
+
+        async def _get_properties(serial, keys):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {PROP_TARGET_CURRENT: 10}
+
+        hub.api_client.get_properties = _get_properties
+        coordinators = []
+        for index in range(MAX_CONCURRENT_REQUESTS * 3):
+            entry = MagicMock()
+            entry.data = {"serial_number": f"SN{index}"}
+            entry.options = {}
+            coordinator = IXcommandCoordinator(hub.hass, entry, hub)
+            coordinator._store = MagicMock()
+            coordinator.async_refresh = coordinator._async_update_data
+            coordinators.append(coordinator)
+
+        await hub.async_poll(coordinators)
+        assert peak == MAX_CONCURRENT_REQUESTS
+
+
+class TestReleaseHub:
+    """Test cases for dropping a hub nobody uses."""
+
+    def _make_hass(self, hub: IXcommandHub) -> MagicMock:
+        """Create a hass mock holding the hub under its API key."""
+        hass = MagicMock()
+        hass.data = {DOMAIN: {DATA_HUBS: {"key": hub}}}
+        return hass
+
+    @pytest.mark.asyncio
+    async def test_empty_hub_released(self):
+        """Test that the last charger leaving drops the hub and closes its client."""
+        hub = _make_hub()
+        hass = self._make_hass(hub)
+        await async_release_hub(hass, "key")
+        assert hass.data[DOMAIN][DATA_HUBS] == {}
+        hub.api_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_hub_with_chargers_kept(self):
+        """Test that a hub still polling chargers stays registered."""
+        hub = _make_hub()
+        hub._coordinators = {"A": _make_member("A")}
+        hass = self._make_hass(hub)
+        await async_release_hub(hass, "key")
+        assert hass.data[DOMAIN][DATA_HUBS] == {"key": hub}
+        hub.api_client.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_key_ignored(self):
+        """Test that releasing a key without a hub does nothing."""
+        hub = _make_hub()
+        hass = self._make_hass(hub)
+        await async_release_hub(hass, "other")
+        assert hass.data[DOMAIN][DATA_HUBS] == {"key": hub}
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
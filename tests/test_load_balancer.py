@@ -0,0 +1,245 @@
+"""Tests for the iXcommand site load balancer."""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand import load_balancer as load_balancer_module
+from custom_components.ixcommand.const import PROP_CHARGING_ENABLE, PROP_TARGET_CURRENT
+from custom_components.ixcommand.load_balancer import (
+    ChargerDemand,
+    IXcommandLoadBalancer,
+    allocate_currents,
+)
+from custom_components.ixcommand.models import ChargerState
+
+
+class TestAllocateCurrents:
+    """Test cases for the allocation algorithm."""
+
+    def test_fair_split_with_caps(self):
+        """Test that capacity left by a capped charger goes to the others."""
+        demands = [
+            ChargerDemand("A", 10, True),
+            ChargerDemand("B", 32, True),
+            ChargerDemand("C", 32, True),
+        ]
+        assert allocate_currents(demands, 50) == {"A": 10, "B": 20, "C": 20}
+
+    def test_never_exceeds_capacity(self):
+        """Test that integer rounding never allocates more than the capacity."""
+        demands = [ChargerDemand(str(index), 16, True) for index in range(7)]
+        targets = allocate_currents(demands, 50)
+        assert sum(targets.values()) <= 50
+        assert min(targets.values()) >= 6
+
+    def test_inactive_chargers_get_minimum_without_reserving(self):
+        """Test that idle chargers are parked at the minimum."""
+        demands = [ChargerDemand("A", 16, True), ChargerDemand("B", 16, False)]
+        assert allocate_currents(demands, 16) == {"A": 16, "B": 6}
+
+    def test_chargers_beyond_capacity_get_none(self):
+        """Test that chargers earlier in the list are served first."""
+        demands = [ChargerDemand(name, 16, True) for name in "ABC"]
+        assert allocate_currents(demands, 13) == {"A": 6, "B": 7, "C": None}
+
+    def test_scales_to_large_fleets(self):
+        """Test that allocating a thousand chargers is far below a second."""
+        demands = [ChargerDemand(str(index), 16 + index % 17, index % 3 != 0) for index in range(1000)]
+        start = time.perf_counter()
+        targets = allocate_currents(demands, 4000)
+        assert time.perf_counter() - start < 0.5
+        assert sum(target for target in targets.values() if target is not None) >= 4000
+
+
+def _make_balancer(states: dict[str, ChargerState], limit: float = 32, grid_sensor=None):
+    """Create a balancer over coordinators with the given snapshots."""
+    hub = MagicMock()
+    hub.coordinators = {}
+    for serial, data in states.items():
+        coordinator = MagicMock()
+        coordinator.serial_number = serial
+        coordinator.data = data
+        coordinator.write_buffer.async_write = AsyncMock()
+        hub.coordinators[serial] = coordinator
+    hass = MagicMock()
+    balancer = IXcommandLoadBalancer(hass, hub)
+    for coordinator in hub.coordinators.values():
+        balancer._members[coordinator.serial_number] = (limit, grid_sensor)
+    balancer._update_settings()
+    return balancer
+
+
+def _charging(target: int, current: float | None = None, maximum: int = 16) -> ChargerState:
+    """Return the snapshot of a charging three-phase charger.
+
+    The vehicle draws its whole target unless another current is given.
+    """
+    if current is None:
+        current = float(target)
+    return ChargerState(
+        charging_status="CHARGING",
+        charging_enable=True,
+        target_current=target,
+        maximum_current=maximum,
+        charging_current=current,
+        charging_current_l2=current,
+        charging_current_l3=current,
+    )
+
+
+class TestLoadBalancer:
+    """Test cases for the load balancer control loop."""
+
+    def test_only_changed_targets_written(self):
+        """Test that chargers already at their allocation are left alone."""
+        balancer = _make_balancer({"A": _charging(16), "B": _charging(10)})
+        assert balancer.async_plan() == {"B": {PROP_TARGET_CURRENT: 16}}
+
+    def test_grid_meter_reduces_capacity(self):
+        """Test that household load seen by the grid meter is left free."""
+        balancer = _make_balancer({"A": _charging(16), "B": _charging(16)}, grid_sensor="sensor.grid")
+        # 40 A metered, 32 A of it drawn by the chargers: 8 A household load
+        balancer.hass.states.get.return_value = MagicMock(state="40")
+        assert balancer.async_plan() == {
+            "A": {PROP_TARGET_CURRENT: 12},
+            "B": {PROP_TARGET_CURRENT: 12},
+        }
+
+    def test_single_phase_draw_only_counted_on_l1(self):
+        """Test that stray L2/L3 readings of a single-phase charger are ignored."""
+        single = ChargerState(
+            charging_status="CHARGING",
+            single_phase=True,
+            target_current=16,
+            maximum_current=16,
+            charging_current=16.0,
+            charging_current_l2=30.0,
+            charging_current_l3=30.0,
+        )
+        balancer = _make_balancer({"A": single, "B": _charging(16)}, grid_sensor="sensor.grid")
+        # 40 A metered on L1, 32 A of it drawn by the chargers
+        balancer.hass.states.get.return_value = MagicMock(state="40")
+        assert balancer.async_plan() == {
+            "A": {PROP_TARGET_CURRENT: 12},
+            "B": {PROP_TARGET_CURRENT: 12},
+        }
+
+    def test_unused_current_goes_to_other_chargers(self):
+        """Test that a vehicle drawing less than its target frees the rest."""
+        balancer = _make_balancer({"A": _charging(16, 8.0), "B": _charging(16, maximum=32)})
+        assert balancer.async_plan() == {
+            "A": {PROP_TARGET_CURRENT: 10},
+            "B": {PROP_TARGET_CURRENT: 22},
+        }
+
+    def test_share_grows_while_vehicle_uses_it(self):
+        """Test that a vehicle drawing its capped target is offered more."""
+        balancer = _make_balancer({"A": _charging(10), "B": _charging(22, maximum=32)})
+        assert balancer.async_plan() == {
+            "A": {PROP_TARGET_CURRENT: 16},
+            "B": {PROP_TARGET_CURRENT: 16},
+        }
+
+    def test_connected_vehicle_reserves_minimum(self):
+        """Test that a plugged-in vehicle not yet charging holds the minimum."""
+        connected = ChargerState(
+            charging_status="CONNECTED", charging_enable=True, target_current=16, maximum_current=16
+        )
+        balancer = _make_balancer({"A": _charging(16, maximum=32), "B": connected})
+        assert balancer.async_plan() == {
+            "A": {PROP_TARGET_CURRENT: 26},
+            "B": {PROP_TARGET_CURRENT: 6},
+        }
+
+    def test_connected_vehicle_paused_without_capacity(self):
+        """Test that a waiting vehicle is paused rather than overloading the fuse."""
+        connected = ChargerState(
+            charging_status="CONNECTED", charging_enable=True, target_current=6, maximum_current=16
+        )
+        balancer = _make_balancer({"B": connected, "A": _charging(10)}, limit=10)
+        assert balancer.async_plan() == {"B": {PROP_CHARGING_ENABLE: False}}
+
+    def test_unreadable_grid_meter_holds_targets(self):
+        """Test that nothing is written while the grid meter is unavailable."""
+        balancer = _make_balancer({"A": _charging(6)}, grid_sensor="sensor.grid")
+        balancer.hass.states.get.return_value = MagicMock(state="unavailable")
+        assert balancer.async_plan() == {}
+
+    def test_pauses_and_resumes_when_capacity_short(self):
+        """Test that a charger without the minimum is paused, then resumed."""
+        balancer = _make_balancer({"A": _charging(6), "B": _charging(6)}, limit=10)
+        assert balancer.async_plan() == {"A": {PROP_TARGET_CURRENT: 10}, "B": {PROP_CHARGING_ENABLE: False}}
+
+        balancer.paused.add("B")
+        balancer.hub.coordinators["B"].data = ChargerState(
+            charging_status="CONNECTED", charging_enable=False, target_current=6, maximum_current=16
+        )
+        balancer._members = {serial: (16, None) for serial in balancer._members}
+        balancer._update_settings()
+        plan = balancer.async_plan()
+        assert plan == {
+            "A": {PROP_TARGET_CURRENT: 8},
+            "B": {PROP_TARGET_CURRENT: 8, PROP_CHARGING_ENABLE: True},
+        }
+
+    def test_pause_survives_restart(self, monkeypatch):
+        """Test that a fresh balancer resumes a charger paused before a restart."""
+        monkeypatch.setattr(load_balancer_module, "async_track_time_interval", MagicMock())
+        balancer = _make_balancer({})
+        coordinator = MagicMock()
+        coordinator.serial_number = "A"
+        coordinator.load_balancer_paused = True
+        coordinator.data = ChargerState(
+            charging_status="CONNECTED", charging_enable=False, target_current=6, maximum_current=16
+        )
+        balancer.hub.coordinators["A"] = coordinator
+        balancer.async_add_charger(coordinator, 32, None)
+        assert balancer.async_plan() == {"A": {PROP_TARGET_CURRENT: 16, PROP_CHARGING_ENABLE: True}}
+
+    def test_members_polled_at_active_interval(self, monkeypatch):
+        """Test that joining the balancer switches a charger to fast polling."""
+        monkeypatch.setattr(load_balancer_module, "async_track_time_interval", MagicMock())
+        balancer = _make_balancer({})
+        coordinator = MagicMock()
+        coordinator.serial_number = "A"
+        coordinator.load_balancer_paused = False
+        balancer.async_add_charger(coordinator, 32, None)
+        assert coordinator.load_balanced is True
+        balancer.async_remove_charger(coordinator)
+        assert coordinator.load_balanced is False
+
+    @pytest.mark.asyncio
+    async def test_lowering_sent_before_raising(self):
+        """Test that decreases complete before any increase is sent."""
+        balancer = _make_balancer({"A": _charging(16), "B": _charging(6)})
+        order = []
+        for serial, coordinator in balancer.hub.coordinators.items():
+            coordinator.write_buffer.async_write.side_effect = (
+                lambda properties, serial=serial: order.append(serial)
+            )
+        await balancer.async_apply(
+            {"B": {PROP_TARGET_CURRENT: 12}, "A": {PROP_TARGET_CURRENT: 12}}
+        )
+        assert order == ["A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_pause_tracked_after_write(self):
+        """Test that a successful pause is remembered."""
+        balancer = _make_balancer({"A": _charging(6)})
+        await balancer.async_apply({"A": {PROP_CHARGING_ENABLE: False}})
+        assert balancer.paused == {"A"}
+        balancer.hub.coordinators["A"].async_set_load_balancer_paused.assert_called_once_with(True)
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
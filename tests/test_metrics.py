@@ -0,0 +1,155 @@
+"""Tests for the iXcommand API request metrics."""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand.api import IXcommandApiClient, IXcommandApiError
+from custom_components.ixcommand.const import (
+    CONF_API_KEY,
+    CONF_SERIAL_NUMBER,
+    DOMAIN,
+    PROP_BSSID,
+    PROP_SSID,
+    PROP_TARGET_CURRENT,
+)
+from custom_components.ixcommand.diagnostics import async_get_config_entry_diagnostics
+from custom_components.ixcommand.metrics import ApiMetrics, RequestStats
+from custom_components.ixcommand.models import ChargerState
+from tests.mock_server import MOCK_API_KEY, MockIXcommandServer
+
+
+class TestRequestStats:
+    """Test cases for the counters of one request group."""
+
+    def test_latency_histogram_bins(self):
+        """Test that latencies land in the first bucket they fit."""
+        stats = RequestStats()
+        for latency in (0.05, 0.1, 0.3, 30):
+            stats.record(latency, 100, None)
+        histogram = stats.histogram()
+        assert histogram["0.1"] == 2
+        assert histogram["0.5"] == 1
+        assert histogram["+Inf"] == 1
+        assert stats.bytes_received == 400
+
+    def test_errors_counted_by_type(self):
+        """Test that failed requests are counted per error type."""
+        stats = RequestStats()
+        stats.record(0.1, 0, "timeout")
+        stats.record(0.1, 20, "http_503")
+        stats.record(0.1, 20, "http_503")
+        assert stats.errors == 3
+        assert stats.errors_by_type == {"timeout": 1, "http_503": 2}
+
+    def test_recent_latency_window(self):
+        """Test that the recent latency only averages the last requests."""
+        stats = RequestStats()
+        for _ in range(100):
+            stats.record(2.0, 0, None)
+        for _ in range(50):
+            stats.record(0.2, 0, None)
+        assert stats.recent_latency == pytest.approx(0.2)
+        assert RequestStats().recent_latency is None
+
+
+class TestApiMetrics:
+    """Test cases for grouping requests of one API key."""
+
+    def test_grouped_by_method_endpoint_and_charger(self):
+        """Test that charger endpoints share a label and count per serial."""
+        metrics = ApiMetrics()
+        metrics.record("GET", "/thing/SN1/properties", 0.1, 100)
+        metrics.record("GET", "/thing/SN2/properties", 0.1, 100)
+        metrics.record("PATCH", "/thing/SN1/properties", 0.1, 10)
+        assert metrics.total.requests == 3
+        assert {key: stats.requests for key, stats in metrics.by_method.items()} == {
+            "GET": 2,
+            "PATCH": 1,
+        }
+        assert set(metrics.by_endpoint) == {
+            "GET /thing/{serial}/properties",
+            "PATCH /thing/{serial}/properties",
+        }
+        assert metrics.charger("SN1").requests == 2
+        assert metrics.charger("SN3").requests == 0
+
+
+class TestClientInstrumentation:
+    """Test cases for the metrics recorded by the API client."""
+
+    @pytest.mark.asyncio
+    async def test_requests_and_retries_recorded(self):
+        """Test that every attempt is counted with its bytes and errors."""
+        async with MockIXcommandServer() as server, aiohttp.ClientSession() as session:
+            client = IXcommandApiClient(
+                MOCK_API_KEY, session, base_url=server.base_url, retry_backoff=0
+            )
+            serial = server.serials[0]
+            server.fail_next(503)
+            await client.get_properties(serial, [PROP_TARGET_CURRENT])
+            await client.set_properties(serial, {PROP_TARGET_CURRENT: 12})
+
+        charger = client.metrics.charger(serial)
+        assert charger.requests == 3
+        assert charger.errors_by_type == {"http_503": 1}
+        assert charger.bytes_received > 0
+        assert client.metrics.by_method["GET"].requests == 2
+        assert client.metrics.by_method["PATCH"].requests == 1
+
+    @pytest.mark.asyncio
+    async def test_auth_error_recorded(self):
+        """Test that a rejected API key counts as an error by status."""
+        async with MockIXcommandServer() as server, aiohttp.ClientSession() as session:
+            client = IXcommandApiClient("wrong-key", session, base_url=server.base_url)
+            with pytest.raises(IXcommandApiError):
+                await client.get_properties(server.serials[0])
+        assert client.metrics.total.errors_by_type == {"http_401": 1}
+
+
+class TestDiagnostics:
+    """Test cases for the diagnostics download."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_included_and_secrets_redacted(self):
+        """Test that the download has the metrics but not the API key or WiFi network."""
+        entry = MagicMock()
+        entry.entry_id = "entry"
+        entry.data = {CONF_API_KEY: "secret", CONF_SERIAL_NUMBER: "SN1"}
+        entry.options = {}
+        hub = MagicMock()
+        hub.coordinators = {"SN1": MagicMock()}
+        hub.api_client = IXcommandApiClient("secret", MagicMock())
+        hub.api_client.metrics.record("GET", "/thing/SN1/properties", 0.2, 150)
+        coordinator = MagicMock()
+        coordinator.data = ChargerState(ssid="HomeNet", bssid="aa:bb:cc:dd:ee:ff", signal=80)
+        coordinator.last_successful_update = None
+        coordinator.async_load_snapshot = AsyncMock(
+            return_value={"saved_at": "2026-01-01T00:00:00+00:00", "data": coordinator.data.as_dict()}
+        )
+        hass = MagicMock()
+        hass.data = {DOMAIN: {"entry": {"coordinator": coordinator, "hub": hub}}}
+
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+        assert diagnostics["entry"]["data"][CONF_API_KEY] == "**REDACTED**"
+        charger = diagnostics["charger"]
+        assert charger["data"][PROP_SSID] == charger["data"][PROP_BSSID] == "**REDACTED**"
+        assert charger["data"]["signal"] == 80
+        assert charger["stored_snapshot"]["data"][PROP_BSSID] == "**REDACTED**"
+        assert "HomeNet" not in str(diagnostics)
+        metrics = diagnostics["api"]["metrics"]
+        assert metrics["total"]["bytes_received"] == 150
+        assert metrics["by_charger"]["SN1"]["requests"] == 1
+        assert "secret" not in str(diagnostics)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,88 @@
+"""Tests for the iXcommand data models."""
+
+import sys
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand.api import IXcommandApiError
+from custom_components.ixcommand.const import (
+    ALL_READABLE_PROPERTIES,
+    PROP_CHARGING_CURRENT,
+    PROP_CHARGING_CURRENT_L2,
+    PROP_CHARGING_CURRENT_L3,
+    PROP_CHARGING_STATUS,
+    PROP_MAXIMUM_CURRENT,
+    PROP_SIGNAL,
+    PROP_TARGET_CURRENT,
+)
+from custom_components.ixcommand.models import PROPERTY_FIELDS, ChargerState
+
+
+class TestChargerState:
+    """Test cases for the parsed charger snapshot."""
+
+    def test_every_readable_property_has_a_field(self):
+        """Test that each API property maps to a typed field."""
+        assert set(PROPERTY_FIELDS) == set(ALL_READABLE_PROPERTIES)
+        for name, _ in PROPERTY_FIELDS.values():
+            assert name in ChargerState.__dataclass_fields__
+
+    def test_parses_and_coerces_types(self):
+        """Test that integral floats become ints and numbers become floats."""
+        state = ChargerState.from_properties(
+            {PROP_TARGET_CURRENT: 10.0, PROP_CHARGING_CURRENT: 9, PROP_CHARGING_STATUS: "IDLE"}
+        )
+        assert state.target_current == 10 and isinstance(state.target_current, int)
+        assert state.charging_current == 9.0 and isinstance(state.charging_current, float)
+        assert state.charging_status == "IDLE"
+        assert state.signal is None
+
+    def test_malformed_value_keeps_previous(self):
+        """Test that a value of the wrong type is dropped."""
+        state = ChargerState(signal=80, target_current=10)
+        merged = state.merge({PROP_SIGNAL: "strong", PROP_TARGET_CURRENT: 10.5})
+        assert merged is state
+
+    def test_non_mapping_payload_raises(self):
+        """Test that a payload that is not an object is rejected."""
+        with pytest.raises(IXcommandApiError):
+            ChargerState().merge(["signal", 80])
+
+    def test_derived_values(self):
+        """Test total current and phase count from the phase currents."""
+        state = ChargerState.from_properties(
+            {PROP_CHARGING_CURRENT: 9.8, PROP_CHARGING_CURRENT_L2: 9.7, PROP_CHARGING_CURRENT_L3: 0.1}
+        )
+        assert state.total_current == 19.6
+        assert state.phase_count == 2
+        assert ChargerState().total_current is None
+
+    def test_merge_is_copy_on_write(self):
+        """Test that merging returns a new snapshot only when values change."""
+        state = ChargerState(target_current=10, maximum_current=16)
+        assert state.merge({PROP_TARGET_CURRENT: 10}) is state
+        merged = state.merge({PROP_TARGET_CURRENT: 12, "unknownKey": 1})
+        assert (merged.target_current, merged.maximum_current) == (12, 16)
+        assert state.target_current == 10
+        with pytest.raises(FrozenInstanceError):
+            merged.target_current = 8
+
+    def test_changed_properties_and_round_trip(self):
+        """Test diffing by API key and converting back to a payload."""
+        state = ChargerState(target_current=10, maximum_current=16)
+        merged = state.merge({PROP_MAXIMUM_CURRENT: 13})
+        assert merged.changed_properties(state) == [PROP_MAXIMUM_CURRENT]
+        assert ChargerState.from_properties(merged.as_dict()) == merged
+        assert merged.get(PROP_SIGNAL, 50) == 50
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,73 @@
+"""Tests for the iXcommand rate limiter."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand.rate_limiter import IXcommandRateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for the token bucket."""
+
+    def test_burst_then_wait(self):
+        """Test that the bucket allows its burst and then reports a wait."""
+        bucket = TokenBucket(rate=1, capacity=2)
+        assert bucket.take() == 0
+        assert bucket.take() == 0
+        assert 0 < bucket.take() <= 1
+
+
+class TestRateLimiter:
+    """Test cases for the rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_requests_within_burst_do_not_wait(self):
+        """Test that requests inside the burst are not throttled."""
+        limiter = IXcommandRateLimiter(read_rate=1, read_burst=3)
+        for _ in range(3):
+            await limiter.async_acquire(write=False)
+        assert limiter.throttled_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_reads_and_writes_have_separate_budgets(self):
+        """Test that exhausting reads does not throttle writes."""
+        limiter = IXcommandRateLimiter(read_rate=1, read_burst=1, write_rate=1, write_burst=1)
+        await limiter.async_acquire(write=False)
+        await limiter.async_acquire(write=True)
+        assert limiter.throttled_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_waiting_write_goes_before_reads(self):
+        """Test that reads queue behind a waiting write."""
+        limiter = IXcommandRateLimiter(
+            read_rate=1000, read_burst=1, write_rate=50, write_burst=1
+        )
+        await limiter.async_acquire(write=False)
+        await limiter.async_acquire(write=True)
+        order: list[str] = []
+
+        async def request(kind: str) -> None:
+            await limiter.async_acquire(write=kind == "write")
+            order.append(kind)
+
+        write = asyncio.create_task(request("write"))
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == {"read": 0, "write": 1}
+        read = asyncio.create_task(request("read"))
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == {"read": 1, "write": 1}
+        await asyncio.gather(write, read)
+        assert order == ["write", "read"]
+        assert limiter.queue_depth == {"read": 0, "write": 0}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+"""Tests for the iXcommand services."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import voluptuous as vol
+from homeassistant.exceptions import ServiceValidationError
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand import services as services_module
+from custom_components.ixcommand.api import IXcommandApiError
+from custom_components.ixcommand.const import (
+    DATA_HUBS,
+    DOMAIN,
+    PROP_CHARGING_ENABLE,
+    PROP_TARGET_CURRENT,
+    WRITABLE_PROPERTIES,
+)
+from custom_components.ixcommand.services import (
+    PROPERTY_VALIDATORS,
+    SET_PROPERTIES_SCHEMA,
+    async_handle_set_properties,
+)
+
+
+def _make_hass(serials: list[str], write):
+    """Create a hass mock with one hub holding chargers that use ``write``."""
+    hub = MagicMock()
+    hub.coordinators = {}
+    for serial in serials:
+        coordinator = MagicMock()
+        coordinator.serial_number = serial
+        coordinator.write_buffer.async_write = lambda properties, serial=serial: write(serial, properties)
+        hub.coordinators[serial] = coordinator
+    hass = MagicMock()
+    hass.data = {DOMAIN: {DATA_HUBS: {"key": hub}}}
+    return hass
+
+
+def _make_call(data: dict):
+    """Create a service call with validated data."""
+    call = MagicMock()
+    call.data = SET_PROPERTIES_SCHEMA(data)
+    return call
+
+
+class TestSetPropertiesSchema:
+    """Test cases for validating the service data."""
+
+    def test_every_writable_property_has_a_validator(self):
+        """Test that the validators cover exactly the writable properties."""
+        assert set(PROPERTY_VALIDATORS) == set(WRITABLE_PROPERTIES)
+
+    def test_values_coerced(self):
+        """Test that values are coerced to the property types."""
+        data = SET_PROPERTIES_SCHEMA(
+            {"serial_number": "ABC-123-DEF", "properties": {PROP_TARGET_CURRENT: "10", PROP_CHARGING_ENABLE: "off"}}
+        )
+        assert data["serial_number"] == ["ABC-123-DEF"]
+        assert data["properties"] == {PROP_TARGET_CURRENT: 10, PROP_CHARGING_ENABLE: False}
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"serial_number": ["ABC-123-DEF"], "properties": {"signal": 50}},
+            {"serial_number": ["ABC-123-DEF"], "properties": {PROP_TARGET_CURRENT: 2}},
+            {"serial_number": ["ABC-123-DEF"], "properties": {}},
+            {"properties": {PROP_CHARGING_ENABLE: False}},
+        ],
+    )
+    def test_invalid_data_rejected(self, data):
+        """Test that read-only keys, bad values and missing targets are rejected."""
+        with pytest.raises(vol.Invalid):
+            SET_PROPERTIES_SCHEMA(data)
+
+
+class TestSetProperties:
+    """Test cases for the bulk write service."""
+
+    @pytest.mark.asyncio
+    async def test_one_write_per_charger_with_results(self):
+        """Test that each charger gets one write and its own result."""
+        written = []
+
+        async def write(serial, properties):
+            written.append((serial, properties))
+            if serial == "B":
+                raise IXcommandApiError("offline")
+
+        hass = _make_hass(["A", "B", "C"], write)
+        call = _make_call({"serial_number": ["A", "B", "C", "A"], "properties": {PROP_CHARGING_ENABLE: False}})
+        response = await async_handle_set_properties(hass, call)
+
+        assert sorted(written) == [(serial, {PROP_CHARGING_ENABLE: False}) for serial in "ABC"]
+        assert response == {
+            "chargers": {
+                "A": {"success": True},
+                "B": {"success": False, "error": "offline"},
+                "C": {"success": True},
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self, monkeypatch):
+        """Test that no more than MAX_CONCURRENT_WRITES chargers are written at once."""
+        monkeypatch.setattr(services_module, "MAX_CONCURRENT_WRITES", 2)
+        running = peak = 0
+
+        async def write(serial, properties):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        serials = [str(index) for index in range(6)]
+        hass = _make_hass(serials, write)
+        call = _make_call({"serial_number": serials, "properties": {PROP_CHARGING_ENABLE: True}})
+        await async_handle_set_properties(hass, call)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_charger_writes_nothing(self):
+        """Test that an unknown serial fails the call before any write."""
+        written = []
+
+        async def write(serial, properties):
+            written.append(serial)
+
+        hass = _make_hass(["A"], write)
+        call = _make_call({"serial_number": ["A", "Z"], "properties": {PROP_CHARGING_ENABLE: False}})
+        with pytest.raises(ServiceValidationError):
+            await async_handle_set_properties(hass, call)
+        assert written == []
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,206 @@
+"""Tests for iXcommand solar surplus charging."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand.const import (
+    CONF_SERIAL_NUMBER,
+    CONF_SOLAR_WINDOW,
+    PROP_CHARGING_ENABLE,
+    PROP_SINGLE_PHASE,
+    PROP_TARGET_CURRENT,
+)
+from custom_components.ixcommand.entity import IXcommandEntity
+from custom_components.ixcommand.models import ChargerState
+from custom_components.ixcommand.solar import SolarSurplusController, SurplusWindow
+from custom_components.ixcommand.switch import IXcommandSolarSurplusSwitch
+
+THREE_PHASE = ChargerState(charging_enable=True, single_phase=False, target_current=10, maximum_current=16)
+
+
+class TestSurplusWindow:
+    """Test cases for the rolling surplus average."""
+
+    def test_mean_over_window(self):
+        """Test that samples older than the window are dropped."""
+        window = SurplusWindow(30)
+        window.add(0, 1000)
+        window.add(10, 2000)
+        window.add(20, 3000)
+        assert window.mean == 2000
+        window.add(30, 4000)
+        assert window.mean == 3000
+
+    def test_empty_window(self):
+        """Test that an empty window has no mean."""
+        window = SurplusWindow(30)
+        window.add(0, 1000)
+        window.clear()
+        assert window.mean is None
+
+
+class TestSolarSurplusController:
+    """Test cases for the surplus control decisions."""
+
+    def test_target_follows_surplus(self):
+        """Test that the surplus is turned into whole amps on three phases."""
+        controller = SolarSurplusController()
+        assert controller.plan(8500, THREE_PHASE, 0) == {PROP_TARGET_CURRENT: 12}
+
+    def test_target_clamped_to_maximum(self):
+        """Test that a large surplus never exceeds the maximum current."""
+        controller = SolarSurplusController()
+        assert controller.plan(50000, THREE_PHASE, 0) == {PROP_TARGET_CURRENT: 16}
+
+    def test_switches_to_single_phase_below_three_phase_minimum(self):
+        """Test that a surplus too small for three phases uses one."""
+        controller = SolarSurplusController()
+        assert controller.plan(2800, THREE_PHASE, 0) == {
+            PROP_SINGLE_PHASE: True,
+            PROP_TARGET_CURRENT: 12,
+        }
+
+    def test_pauses_below_single_phase_minimum(self):
+        """Test that charging is paused without enough surplus."""
+        controller = SolarSurplusController()
+        assert controller.plan(500, THREE_PHASE, 0) == {PROP_CHARGING_ENABLE: False}
+
+    def test_hysteresis_before_switching_up(self):
+        """Test that three phases need the hysteresis above the minimum."""
+        controller = SolarSurplusController(hysteresis=300)
+        single = ChargerState(charging_enable=True, single_phase=True, target_current=16, maximum_current=16)
+        assert controller.plan(4200, single, 0) == {}
+        assert controller.plan(4500, single, 0) == {
+            PROP_SINGLE_PHASE: False,
+            PROP_TARGET_CURRENT: 6,
+        }
+
+    def test_resume_needs_hysteresis(self):
+        """Test that a paused charger resumes only above the hysteresis."""
+        controller = SolarSurplusController(hysteresis=300)
+        paused = ChargerState(charging_enable=False, single_phase=True, target_current=6, maximum_current=16)
+        assert controller.plan(1500, paused, 0) == {}
+        assert controller.plan(1700, paused, 0) == {PROP_CHARGING_ENABLE: True, PROP_TARGET_CURRENT: 7}
+
+    def test_writes_rate_limited(self):
+        """Test that nothing is written within the minimum write interval."""
+        controller = SolarSurplusController(min_write_interval=60)
+        assert controller.plan(8500, THREE_PHASE, 0)
+        assert controller.plan(9500, THREE_PHASE, 30) == {}
+        assert controller.plan(9500, THREE_PHASE, 60) == {PROP_TARGET_CURRENT: 13}
+
+    def test_mode_changes_rate_limited(self):
+        """Test that the phase count is held until a mode switch is allowed."""
+        controller = SolarSurplusController(min_write_interval=10, mode_switch_interval=300)
+        assert controller.plan(2800, THREE_PHASE, 0) == {PROP_SINGLE_PHASE: True, PROP_TARGET_CURRENT: 12}
+        single = THREE_PHASE.merge({PROP_SINGLE_PHASE: True, PROP_TARGET_CURRENT: 12})
+        assert controller.plan(9000, single, 100) == {PROP_TARGET_CURRENT: 16}
+        assert controller.plan(9000, single, 300) == {PROP_SINGLE_PHASE: False, PROP_TARGET_CURRENT: 13}
+
+
+class TestSolarSurplusSwitch:
+    """Test cases for the solar surplus switch control loop."""
+
+    def _make_switch(self, data: ChargerState, export: str = "2000") -> IXcommandSolarSurplusSwitch:
+        """Create a switch whose export sensor reports the given power."""
+        entry = MagicMock()
+        entry.data = {CONF_SERIAL_NUMBER: "ABC-123-DEF"}
+        entry.options = {CONF_SOLAR_WINDOW: 30}
+        coordinator = MagicMock()
+        coordinator.serial_number = "ABC-123-DEF"
+        coordinator.data = data
+        writes: list[dict] = []
+
+        async def write(properties, delay=0):
+            writes.append(properties)
+
+        coordinator.write_buffer.async_write = write
+        switch = IXcommandSolarSurplusSwitch(
+            coordinator, entry, MagicMock(), "sensor.export", "solar_surplus", "Solar Surplus Charging"
+        )
+        switch.hass = MagicMock()
+        switch.hass.states.get.return_value = MagicMock(state=export, attributes={})
+        switch.hass.async_create_background_task = lambda coro, name: asyncio.ensure_future(coro)
+        switch.writes = writes
+        return switch
+
+    @pytest.mark.asyncio
+    async def test_surplus_includes_charger_power(self):
+        """Test that the charger's own draw counts as surplus."""
+        switch = self._make_switch(THREE_PHASE.merge({"currentChargingPower": 6900}), export="1380")
+        switch._async_handle_tick(None)
+        await switch._write_task
+        assert switch.writes == [{PROP_TARGET_CURRENT: 12}]
+
+    @pytest.mark.asyncio
+    async def test_pause_tracked_and_resumed_on_turn_off(self, monkeypatch):
+        """Test that turning the switch off resumes a charger it paused."""
+        switch = self._make_switch(THREE_PHASE, export="100")
+        monkeypatch.setattr(switch, "async_write_ha_state", MagicMock())
+        switch._attr_is_on = True
+        switch._async_handle_tick(None)
+        await switch._write_task
+        assert switch.paused
+        await switch.async_turn_off()
+        assert switch.writes == [{PROP_CHARGING_ENABLE: False}, {PROP_CHARGING_ENABLE: True}]
+        assert not switch.paused
+
+    @pytest.mark.asyncio
+    async def test_turn_off_waits_for_pause_in_flight(self, monkeypatch):
+        """Test that a pause finishing during turn off is still resumed."""
+        switch = self._make_switch(THREE_PHASE, export="100")
+        monkeypatch.setattr(switch, "async_write_ha_state", MagicMock())
+        switch._attr_is_on = True
+        release = asyncio.Event()
+
+        async def slow_write(properties, delay=0):
+            if properties == {PROP_CHARGING_ENABLE: False}:
+                await release.wait()
+            switch.writes.append(properties)
+
+        switch.coordinator.write_buffer.async_write = slow_write
+        switch._async_handle_tick(None)
+        turn_off = asyncio.ensure_future(switch.async_turn_off())
+        await asyncio.sleep(0)
+        release.set()
+        await turn_off
+        assert switch.writes == [{PROP_CHARGING_ENABLE: False}, {PROP_CHARGING_ENABLE: True}]
+        assert not switch.paused
+        assert not switch.is_on
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("enabled", "paused"), [(False, True), (True, False)])
+    async def test_pause_restored_after_restart(self, monkeypatch, enabled, paused):
+        """Test that a charger left disabled while on is resumed on turn off."""
+        switch = self._make_switch(THREE_PHASE.merge({PROP_CHARGING_ENABLE: enabled}))
+        monkeypatch.setattr(IXcommandEntity, "async_added_to_hass", AsyncMock())
+        monkeypatch.setattr(switch, "async_get_last_state", AsyncMock(return_value=MagicMock(state="on")))
+        monkeypatch.setattr(switch, "async_write_ha_state", MagicMock())
+        monkeypatch.setattr(switch, "_async_start_loop", MagicMock())
+        await switch.async_added_to_hass()
+        assert switch.is_on
+        assert switch.paused is paused
+        await switch.async_turn_off()
+        assert switch.writes == ([{PROP_CHARGING_ENABLE: True}] if paused else [])
+
+    @pytest.mark.asyncio
+    async def test_unreadable_sensor_holds_settings(self):
+        """Test that an unavailable export sensor writes nothing."""
+        switch = self._make_switch(THREE_PHASE, export="unavailable")
+        switch._async_handle_tick(None)
+        assert switch._write_task is None
+        assert switch.window.mean is None
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,183 @@
+"""Tests for the iXcommand write buffer."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from custom_components.ixcommand.api import IXcommandApiError
+from custom_components.ixcommand.const import (
+    PROP_BOOST_TIME,
+    PROP_CHARGING_ENABLE,
+    PROP_TARGET_CURRENT,
+)
+from custom_components.ixcommand.models import ChargerState
+from custom_components.ixcommand.write_buffer import IXcommandWriteBuffer
+
+
+def _make_buffer() -> IXcommandWriteBuffer:
+    """Create a write buffer backed by a mocked coordinator."""
+    loop = asyncio.get_running_loop()
+    hass = MagicMock()
+    hass.loop = loop
+    hass.async_create_task = loop.create_task
+    coordinator = MagicMock()
+    coordinator.serial_number = "ABC-123-DEF"
+    coordinator.api_client.set_properties = AsyncMock(return_value={})
+    coordinator.async_confirm_properties = AsyncMock()
+    coordinator.data = ChargerState(target_current=10, charging_enable=True)
+    coordinator.write_suppression_max_age = 60
+    # Without a known age nothing is suppressed
+    coordinator.property_age.return_value = None
+    return IXcommandWriteBuffer(hass, coordinator)
+
+
+class TestWriteCoalescing:
+    """Test cases for write coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_slider_steps_merge_into_one_patch(self):
+        """Test that rapid writes of one property send only the latest value."""
+        buffer = _make_buffer()
+        await asyncio.gather(
+            *(buffer.async_write({PROP_TARGET_CURRENT: value}, 0.01) for value in range(6, 17))
+        )
+        set_properties = buffer.coordinator.api_client.set_properties
+        set_properties.assert_awaited_once_with("ABC-123-DEF", {PROP_TARGET_CURRENT: 16})
+        buffer.coordinator.async_set_local_properties.assert_called_once_with(
+            {PROP_TARGET_CURRENT: 16}
+        )
+        buffer.coordinator.async_confirm_properties.assert_awaited_once_with(
+            {PROP_TARGET_CURRENT: 16}
+        )
+
+    @pytest.mark.asyncio
+    async def test_different_properties_share_one_patch(self):
+        """Test that pending writes to different properties go out together."""
+        buffer = _make_buffer()
+        await asyncio.gather(
+            buffer.async_write({PROP_TARGET_CURRENT: 10}, 0.01),
+            buffer.async_write({PROP_BOOST_TIME: 600}, 0.01),
+        )
+        buffer.coordinator.api_client.set_properties.assert_awaited_once_with(
+            "ABC-123-DEF", {PROP_TARGET_CURRENT: 10, PROP_BOOST_TIME: 600}
+        )
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self):
+        """Test that a failed PATCH is raised to every merged caller."""
+        buffer = _make_buffer()
+        buffer.coordinator.api_client.set_properties.side_effect = IXcommandApiError("boom")
+        results = await asyncio.gather(
+            buffer.async_write({PROP_TARGET_CURRENT: 10}, 0.01),
+            buffer.async_write({PROP_BOOST_TIME: 600}, 0.01),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, IXcommandApiError) for result in results)
+        buffer.coordinator.async_set_local_properties.assert_not_called()
+
+
+class TestWriteQueue:
+    """Test cases for serializing writes to one charger."""
+
+    @pytest.mark.asyncio
+    async def test_writes_during_patch_wait_and_collapse(self):
+        """Test that writes made during a PATCH go out afterwards as one batch."""
+        buffer = _make_buffer()
+        release = asyncio.Event()
+        in_flight = 0
+        sent: list[dict] = []
+
+        async def set_properties(serial, properties):
+            nonlocal in_flight
+            in_flight += 1
+            assert in_flight == 1
+            sent.append(properties)
+            await release.wait()
+            in_flight -= 1
+
+        buffer.coordinator.api_client.set_properties = set_properties
+        first = asyncio.ensure_future(buffer.async_write({PROP_TARGET_CURRENT: 8}))
+        await asyncio.sleep(0.01)
+        later = [
+            asyncio.ensure_future(buffer.async_write({PROP_TARGET_CURRENT: value}))
+            for value in (12, 13)
+        ]
+        await asyncio.sleep(0.01)
+        assert sent == [{PROP_TARGET_CURRENT: 8}]
+
+        release.set()
+        await asyncio.wait_for(asyncio.gather(first, *later), 1)
+        assert sent == [{PROP_TARGET_CURRENT: 8}, {PROP_TARGET_CURRENT: 13}]
+        assert buffer._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_write(self):
+        """Test that cancelling the buffer also cancels callers of a running PATCH."""
+        buffer = _make_buffer()
+
+        async def set_properties(serial, properties):
+            await asyncio.Event().wait()
+
+        buffer.coordinator.api_client.set_properties = set_properties
+        write = asyncio.ensure_future(buffer.async_write({PROP_TARGET_CURRENT: 8}))
+        await asyncio.sleep(0.01)
+        buffer.async_cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(write, 1)
+
+
+class TestWriteSuppression:
+    """Test cases for skipping writes the charger already reports."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_fresh_values_not_sent(self):
+        """Test that values recently reported by the charger cost no request."""
+        buffer = _make_buffer()
+        buffer.coordinator.property_age.return_value = 5
+        await buffer.async_write({PROP_TARGET_CURRENT: 10, PROP_CHARGING_ENABLE: True})
+        buffer.coordinator.api_client.set_properties.assert_not_awaited()
+        assert (buffer.sent_writes, buffer.suppressed_writes) == (0, 2)
+
+    @pytest.mark.asyncio
+    async def test_only_changed_values_sent(self):
+        """Test that unchanged values are dropped from a mixed batch."""
+        buffer = _make_buffer()
+        buffer.coordinator.property_age.return_value = 5
+        await buffer.async_write({PROP_TARGET_CURRENT: 12, PROP_CHARGING_ENABLE: True})
+        buffer.coordinator.api_client.set_properties.assert_awaited_once_with(
+            "ABC-123-DEF", {PROP_TARGET_CURRENT: 12}
+        )
+        assert (buffer.sent_writes, buffer.suppressed_writes) == (1, 1)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("age", "max_age"), [(None, 60), (61, 60), (5, 0)])
+    async def test_old_or_unknown_values_written(self, age, max_age):
+        """Test that values without a recent read are written regardless."""
+        buffer = _make_buffer()
+        buffer.coordinator.property_age.return_value = age
+        buffer.coordinator.write_suppression_max_age = max_age
+        await buffer.async_write({PROP_TARGET_CURRENT: 10})
+        buffer.coordinator.api_client.set_properties.assert_awaited_once_with(
+            "ABC-123-DEF", {PROP_TARGET_CURRENT: 10}
+        )
+        assert (buffer.sent_writes, buffer.suppressed_writes) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_suppression_error_reaches_caller(self):
+        """Test that a failure while checking the snapshot does not hang callers."""
+        buffer = _make_buffer()
+        buffer.coordinator.property_age.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(buffer.async_write({PROP_TARGET_CURRENT: 10}), 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])